@@ -1,14 +1,18 @@
-# Required to deal with annotations including `Queue`
+# Required to deal with annotations including `Future`
 # https://mypy.readthedocs.io/en/latest/common_issues.html#issues-with-code-at-runtime
 from __future__ import annotations
 
-import time
 import asyncio
+import heapq
+import math
 
-from asyncio import Future, Queue, wait_for, Task
+from asyncio import Future, Semaphore, Task, TimerHandle
+from bisect import bisect_left
 from functools import partial
-from typing import AsyncIterator, Awaitable, Dict, Optional, Tuple
+from itertools import count
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Tuple
 
+from ..errors import InferenceError
 from ..model import MLModel
 from ..types import (
     InferenceRequest,
@@ -16,7 +20,77 @@ from ..types import (
 )
 from ..utils import generate_uuid
 
-from .requests import BatchedRequests
+from .errors import DeadlineExceeded
+from .metrics import batch_tuner_collector
+from .requests import BatchedRequests, get_length
+from .tuning import BatchTuner
+
+PriorityParameter = "priority"
+TimeoutParameter = "timeout"
+
+PriorityHeader = "mlserver-priority"
+TimeoutHeader = "mlserver-timeout"
+
+# Pending requests are kept as a heap, sorted by (negated) priority, deadline
+# and order of arrival
+_QueuedRequest = Tuple[int, float, int, str, InferenceRequest]
+
+
+def _get_scheduling_value(
+    req: InferenceRequest, parameter_name: str, header_name: str
+) -> Optional[str]:
+    parameters = req.parameters
+    if parameters is None:
+        return None
+
+    value = getattr(parameters, parameter_name, None)
+    if value is None and parameters.headers:
+        value = parameters.headers.get(header_name)
+
+    return value
+
+
+def get_priority(req: InferenceRequest) -> int:
+    """
+    Returns the priority of a request, where requests with a higher priority
+    get batched first. Requests have a priority of 0 by default.
+    """
+    priority = _get_scheduling_value(req, PriorityParameter, PriorityHeader)
+    if priority is None:
+        return 0
+
+    try:
+        return int(priority)
+    except (TypeError, ValueError):
+        raise InferenceError(f"Invalid request priority: {priority}")
+
+
+def get_timeout(req: InferenceRequest) -> Optional[float]:
+    """
+    Returns how long (in seconds) a request can wait to get batched, if set.
+    """
+    timeout = _get_scheduling_value(req, TimeoutParameter, TimeoutHeader)
+    if timeout is None:
+        return None
+
+    try:
+        return float(timeout)
+    except (TypeError, ValueError):
+        raise InferenceError(f"Invalid request timeout: {timeout}")
+
+
+class _Batch:
+    def __init__(self, closes_at: float):
+        self.closes_at = closes_at
+        self.requests: Dict[str, InferenceRequest] = {}
+        self.deadlines: Dict[str, float] = {}
+
+    def add(self, internal_id: str, req: InferenceRequest, deadline: float):
+        self.requests[internal_id] = req
+        self.deadlines[internal_id] = deadline
+
+        # Requests can't wait for the batch to fill up past their deadline
+        self.closes_at = min(self.closes_at, deadline)
 
 
 class AdaptiveBatcher:
@@ -25,41 +99,117 @@ class AdaptiveBatcher:
 
         self._max_batch_size = model.settings.max_batch_size
         self._max_batch_time = model.settings.max_batch_time
+        self._max_queue_size = model.settings.max_batch_queue_size
+        self._length_buckets = sorted(model.settings.batch_length_buckets)
+        self._padded_outputs = set(model.settings.batch_padded_outputs)
+
+        self._tuner: Optional[BatchTuner] = None
+        target_latency = model.settings.target_batch_latency
+        if target_latency is not None:
+            self._tuner = BatchTuner(
+                model_name=model.name,
+                model_version=model.version,
+                max_batch_size=self._max_batch_size,
+                max_batch_time=self._max_batch_time,
+                target_latency=target_latency,
+            )
+            batch_tuner_collector.add(self._tuner)
 
         # Save predict function before it gets decorated
         self._predict_fn = model.predict
-        self.__requests: Optional[Queue[Tuple[str, InferenceRequest]]] = None
+        self._requests: List[_QueuedRequest] = []
+        self._arrivals = count()
+        self.__queue_slots: Optional[Semaphore] = None
         self._async_responses: Dict[str, Future[InferenceResponse]] = {}
         self._batching_task = None
 
+        # Future used by the batcher to wait for new requests (or for the
+        # current batch to time out)
+        self._waiter: Optional[Future[None]] = None
+        self._batch_timed_out = False
+
     async def predict(self, req: InferenceRequest) -> InferenceResponse:
-        internal_id, _ = await self._queue_request(req)
-        self._start_batcher_if_needed()
-        return await self._wait_response(internal_id)
+        if self._tuner is None:
+            internal_id, _ = await self._queue_request(req)
+            self._start_batcher_if_needed()
+            return await self._wait_response(internal_id)
+
+        loop = asyncio.get_running_loop()
+        queued_at = loop.time()
+        self._tuner.observe_arrival(queued_at)
+        try:
+            internal_id, _ = await self._queue_request(req)
+            self._start_batcher_if_needed()
+            return await self._wait_response(internal_id)
+        finally:
+            self._tuner.observe_latency(loop.time() - queued_at)
 
     @property
-    def _requests(self) -> Queue[Tuple[str, InferenceRequest]]:
-        # NOTE: We need to create Queue within the async request path (and not
-        # during __init__!!) to ensure that it shares the same AsyncIO loop.
-        if self.__requests is None:
-            self.__requests = Queue(maxsize=self._max_batch_size)
+    def _batch_size(self) -> int:
+        if self._tuner is None:
+            return self._max_batch_size
 
-        return self.__requests
+        return self._tuner.batch_size
+
+    @property
+    def _batch_time(self) -> float:
+        if self._tuner is None:
+            return self._max_batch_time
+
+        return self._tuner.batch_time
+
+    @property
+    def _queue_slots(self) -> Optional[Semaphore]:
+        if not self._max_queue_size:
+            # The queue of pending requests is unbounded
+            return None
+
+        # NOTE: We need to create the Semaphore within the async request path
+        # (and not during __init__!!) to ensure that it shares the same AsyncIO
+        # loop.
+        if self.__queue_slots is None:
+            self.__queue_slots = Semaphore(self._max_queue_size)
+
+        return self.__queue_slots
 
     async def _queue_request(
         self,
         req: InferenceRequest,
     ) -> Tuple[str, Awaitable[InferenceResponse]]:
         internal_id = generate_uuid()
-
-        await self._requests.put((internal_id, req))
+        priority = get_priority(req)
+        timeout = get_timeout(req)
 
         loop = asyncio.get_running_loop()
+        deadline = math.inf
+        if timeout is not None:
+            # The deadline also covers any time spent waiting for a slot in the
+            # queue
+            deadline = loop.time() + timeout
+
+        queue_slots = self._queue_slots
+        if queue_slots is not None:
+            await queue_slots.acquire()
+
+        arrival = next(self._arrivals)
+        queued = (-priority, deadline, arrival, internal_id, req)
+        heapq.heappush(self._requests, queued)
+        self._wake_batcher()
+
         async_response = loop.create_future()
         self._async_responses[internal_id] = async_response
 
         return internal_id, async_response
 
+    def _dequeue_request(self) -> _QueuedRequest:
+        queued = heapq.heappop(self._requests)
+
+        queue_slots = self._queue_slots
+        if queue_slots is not None:
+            queue_slots.release()
+
+        return queued
+
     async def _wait_response(self, internal_id: str) -> InferenceResponse:
         async_response = self._async_responses[internal_id]
 
@@ -90,8 +240,8 @@ class AdaptiveBatcher:
             async_response.set_exception(err)
 
         # Empty queue
-        for _ in range(self._requests.qsize()):
-            self._requests.get_nowait()
+        while self._requests:
+            self._dequeue_request()
 
     async def _batcher(self):
         async for batched in self._batch_requests():
@@ -100,6 +250,18 @@ class AdaptiveBatcher:
             # That way, we can process multiple batches concurrently.
             predict_task = asyncio.create_task(self._predict_fn(batched.merged_request))
             predict_task.add_done_callback(partial(self._predict_callback, batched))
+            if self._tuner is not None:
+                started_at = asyncio.get_running_loop().time()
+                predict_task.add_done_callback(
+                    partial(self._observe_batch, batched, started_at)
+                )
+
+    def _observe_batch(
+        self, batched: BatchedRequests, started_at: float, predict_task: Task
+    ):
+        inference_time = asyncio.get_running_loop().time() - started_at
+        batch_size = len(batched.inference_requests)
+        self._tuner.observe_batch(batch_size, inference_time)  # type: ignore
 
     def _predict_callback(self, batched: BatchedRequests, predict_task: Task):
         try:
@@ -111,25 +273,116 @@ class AdaptiveBatcher:
             for internal_id in batched.inference_requests.keys():
                 self._async_responses[internal_id].set_exception(err)
 
+    def _reject_request(self, internal_id: str):
+        # Fail fast on requests which can't be served on time anymore
+        async_response = self._async_responses[internal_id]
+        if not async_response.done():
+            err = DeadlineExceeded(self._model.name)
+            async_response.set_exception(err)
+
+    def _wake_batcher(self):
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def _time_out_batch(self):
+        self._batch_timed_out = True
+        self._wake_batcher()
+
+    def _get_bucket(self, req: InferenceRequest) -> Optional[int]:
+        if not self._length_buckets:
+            return None
+
+        return bisect_left(self._length_buckets, get_length(req))
+
+    def _close_batch(self, batch: _Batch, now: float) -> Optional[BatchedRequests]:
+        for internal_id, deadline in batch.deadlines.items():
+            if deadline < now:
+                # The request expired while the batch was still open
+                del batch.requests[internal_id]
+                self._reject_request(internal_id)
+
+        if not batch.requests:
+            return None
+
+        return BatchedRequests(
+            batch.requests,
+            pad_inputs=bool(self._length_buckets),
+            padded_outputs=self._padded_outputs,
+        )
+
     async def _batch_requests(self) -> AsyncIterator[BatchedRequests]:
-        while not self._requests.empty():
-            to_batch: Dict[str, InferenceRequest] = {}
-            start = time.time()
-            timeout = self._max_batch_time
-
-            try:
-                while len(to_batch) < self._max_batch_size:
-                    read_op = self._requests.get()
-                    internal_id, inference_request = await wait_for(
-                        read_op, timeout=timeout
-                    )
-                    to_batch[internal_id] = inference_request
-
-                    # Update remaining timeout
-                    current = time.time()
-                    timeout = timeout - (current - start)
-            except asyncio.TimeoutError:
-                # NOTE: Hit timeout, continue
-                pass
-
-            yield BatchedRequests(to_batch)
+        loop = asyncio.get_running_loop()
+
+        # Requests get batched separately for each length bucket (or all
+        # together if inputs don't need padding)
+        open_batches: Dict[Optional[int], _Batch] = {}
+        num_buffered = 0
+        max_buckets = len(self._length_buckets) + 1
+
+        # A single timer keeps track of the earliest batch deadline, instead of
+        # having to set up a new one for each request
+        timer: Optional[TimerHandle] = None
+        self._batch_timed_out = False
+
+        try:
+            while self._requests or open_batches:
+                # Take every request already waiting in bulk, without going
+                # back to the event loop for each of them
+                batch_size = self._batch_size
+                now = loop.time()
+                while self._requests and num_buffered < batch_size * max_buckets:
+                    queued = self._dequeue_request()
+                    _, deadline, _, internal_id, inference_request = queued
+                    if deadline < now:
+                        self._reject_request(internal_id)
+                        continue
+
+                    bucket = self._get_bucket(inference_request)
+                    batch = open_batches.get(bucket)
+                    if batch is None:
+                        batch = _Batch(closes_at=now + self._batch_time)
+                        open_batches[bucket] = batch
+
+                    batch.add(internal_id, inference_request, deadline)
+                    num_buffered += 1
+                    if len(batch.requests) >= batch_size:
+                        del open_batches[bucket]
+                        num_buffered -= len(batch.requests)
+                        batched = self._close_batch(batch, now)
+                        if batched is not None:
+                            yield batched
+
+                if self._batch_timed_out:
+                    self._batch_timed_out = False
+                    timed_out_at = timer.when()  # type: ignore
+                    timer = None
+                    for bucket, batch in list(open_batches.items()):
+                        if batch.closes_at <= timed_out_at:
+                            del open_batches[bucket]
+                            num_buffered -= len(batch.requests)
+                            # NOTE: Requests whose deadline triggered the timer
+                            # are still on time
+                            batched = self._close_batch(batch, timed_out_at)
+                            if batched is not None:
+                                yield batched
+
+                if not open_batches:
+                    # Either every request got batched or had already missed
+                    # its deadline
+                    continue
+
+                closes_at = min(batch.closes_at for batch in open_batches.values())
+                if timer is None or timer.when() != closes_at:
+                    if timer is not None:
+                        timer.cancel()
+
+                    timer = loop.call_at(closes_at, self._time_out_batch)
+
+                # Sleep until either new requests come in, or a batch times out
+                self._waiter = loop.create_future()
+                await self._waiter
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+            self._waiter = None
@@ -0,0 +1,14 @@
+from fastapi import status
+
+from ..errors import MLServerError
+
+
+class DeadlineExceeded(MLServerError):
+    """
+    Raised for requests whose deadline went by while they were waiting to get
+    batched, so that no inference gets spent on them.
+    """
+
+    def __init__(self, model_name: str):
+        msg = f"Deadline exceeded before request to model {model_name} got batched"
+        super().__init__(msg, status.HTTP_504_GATEWAY_TIMEOUT)
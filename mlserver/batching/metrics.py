@@ -0,0 +1,60 @@
+from typing import Iterable
+from weakref import WeakSet
+
+from prometheus_client.core import GaugeMetricFamily, Metric
+
+from ..metrics import _Collector
+from .tuning import BatchTuner
+
+BatchSizeMetricName = "batching_max_batch_size"
+BatchTimeMetricName = "batching_max_batch_time"
+
+_Labels = ["model_name", "model_version"]
+
+
+class BatchTunerCollector(_Collector):
+    """
+    Exposes the batch size and batch time currently chosen for each model
+    whose adaptive batching gets tuned dynamically.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Tuners will go away alongside their models
+        self._tuners: WeakSet = WeakSet()
+
+    def add(self, tuner: BatchTuner):
+        self._tuners.add(tuner)
+
+        try:
+            self.register()
+        except ValueError:
+            # The collector was already registered
+            pass
+
+    def _new_metrics(self):
+        return (
+            GaugeMetricFamily(
+                BatchSizeMetricName,
+                "Maximum batch size currently used by adaptive batching",
+                labels=_Labels,
+            ),
+            GaugeMetricFamily(
+                BatchTimeMetricName,
+                "Maximum time (in seconds) currently waited by adaptive batching",
+                labels=_Labels,
+            ),
+        )
+
+    def collect(self) -> Iterable[Metric]:
+        batch_size, batch_time = self._new_metrics()
+        for tuner in list(self._tuners):
+            labels = [tuner.model_name, tuner.model_version or ""]
+            batch_size.add_metric(labels, tuner.batch_size)
+            batch_time.add_metric(labels, tuner.batch_time)
+
+        yield batch_size
+        yield batch_time
+
+
+batch_tuner_collector = BatchTunerCollector()
@@ -1,6 +1,10 @@
+import numpy as np
+
 from collections import defaultdict, OrderedDict
-from typing import Dict, List, Optional, Union
+from itertools import chain
+from typing import Dict, List, Optional, Set, Union
 
+from ..codecs.numpy import to_dtype
 from ..types import (
     InferenceRequest,
     InferenceResponse,
@@ -27,9 +31,18 @@ def _merge_parameters(
     return {**all_params, **obj_params}
 
 
+def _merge_arrays(all_data: list, dtype: np.dtype) -> Optional[np.ndarray]:
+    try:
+        return np.concatenate([np.asarray(data, dtype=dtype) for data in all_data])
+    except (TypeError, ValueError):
+        # The minibatches may not have compatible dimensions (or may not be
+        # numeric at all), in which case they need to get merged as lists
+        return None
+
+
 def _merge_data(
-    all_data: Union[list, List[str], List[bytes]]
-) -> Union[list, str, bytes]:
+    all_data: Union[list, List[str], List[bytes]], dtype: Optional[np.dtype] = None
+) -> Union[list, str, bytes, np.ndarray]:
     sampled_datum = all_data[0]
 
     if isinstance(sampled_datum, str):
@@ -38,16 +51,89 @@ def _merge_data(
     if isinstance(sampled_datum, bytes):
         return b"".join(all_data)  # type: ignore
 
-    if isinstance(sampled_datum, list):
-        return sum(all_data, [])
+    if dtype is not None:
+        # Numeric data can get merged into a single contiguous array, which
+        # won't need to be converted again further down the line
+        merged = _merge_arrays(all_data, dtype)
+        if merged is not None:
+            return merged
+
+    if isinstance(sampled_datum, (list, np.ndarray)):
+        return list(chain.from_iterable(all_data))
 
     # TODO: Should we raise an error if we couldn't merge the data?
     return all_data
 
 
+def _get_numeric_dtype(
+    payload: Union[RequestInput, ResponseOutput]
+) -> Optional[np.dtype]:
+    if payload.datatype == "BYTES":
+        return None
+
+    try:
+        return to_dtype(payload)
+    except KeyError:
+        # Unknown datatype
+        return None
+
+
+def _get_length(shape: List[int]) -> int:
+    # The length of variable-length inputs (e.g. sequences of tokens) spans
+    # the axis right after the batch one
+    if len(shape) < 2:
+        return 1
+
+    return shape[1]
+
+
+def get_length(inference_request: InferenceRequest) -> int:
+    """
+    Returns the length of the longest input within a request.
+    """
+    return max(
+        (
+            _get_length(request_input.shape)
+            for request_input in inference_request.inputs
+        ),
+        default=1,
+    )
+
+
+def _pad_arrays(arrays: List[np.ndarray]) -> Optional[np.ndarray]:
+    ndims = {array.ndim for array in arrays}
+    if len(ndims) != 1:
+        return None
+
+    padded_shape = np.max([array.shape for array in arrays], axis=0)
+    padded = []
+    for array in arrays:
+        # Padding only gets added at the end of each axis, besides the batch
+        pad_width = [(0, 0)] + [
+            (0, padded_size - size)
+            for size, padded_size in zip(array.shape[1:], padded_shape[1:])
+        ]
+        padded.append(np.pad(array, pad_width))
+
+    return np.concatenate(padded)
+
+
 class BatchedRequests:
-    def __init__(self, inference_requests: Dict[str, InferenceRequest] = {}):
+    def __init__(
+        self,
+        inference_requests: Dict[str, InferenceRequest] = {},
+        pad_inputs: bool = False,
+        padded_outputs: Set[str] = set(),
+    ):
         self.inference_requests = inference_requests
+        self._pad_inputs = pad_inputs
+        self._padded_outputs = padded_outputs
+
+        # When inputs of different lengths get padded, keep track of the
+        # original length of each request, so that the padding can be stripped
+        # from the outputs
+        self._lengths: Dict[str, int] = {}
+        self._padded_length: Optional[int] = None
 
         # External IDs represent the incoming prediction IDs that need to match
         # 1:1 between request and response.
@@ -113,13 +199,22 @@ class BatchedRequests:
             self._minibatch_sizes[internal_id] = minibatch_shape.batch_size
             batch_size += minibatch_shape.batch_size
 
-        data = _merge_data(all_data)
-        parameters = Parameters(**all_params) if all_params else None
-
         # TODO: What should we do if list is empty?
         sampled = next(iter(request_inputs.values()))
-        shape = Shape(sampled.shape)
-        shape.batch_size = batch_size
+        parameters = Parameters(**all_params) if all_params else None
+        dtype = _get_numeric_dtype(sampled)
+
+        padded = None
+        if self._pad_inputs and dtype is not None:
+            padded = self._pad_request_inputs(request_inputs, dtype)
+
+        if padded is not None:
+            data: Union[list, str, bytes, np.ndarray] = padded.ravel()
+            shape = Shape(list(padded.shape))
+        else:
+            data = _merge_data(all_data, dtype)
+            shape = Shape(sampled.shape)
+            shape.batch_size = batch_size
 
         return RequestInput(
             name=sampled.name,
@@ -129,6 +224,32 @@ class BatchedRequests:
             parameters=parameters,
         )
 
+    def _pad_request_inputs(
+        self, request_inputs: Dict[str, RequestInput], dtype: np.dtype
+    ) -> Optional[np.ndarray]:
+        shapes = [request_input.shape for request_input in request_inputs.values()]
+        if all(shape[1:] == shapes[0][1:] for shape in shapes):
+            # Nothing to pad
+            return None
+
+        arrays = [
+            np.asarray(_get_data(request_input), dtype=dtype).reshape(
+                request_input.shape
+            )
+            for request_input in request_inputs.values()
+        ]
+
+        padded = _pad_arrays(arrays)
+        if padded is None:
+            return None
+
+        for internal_id, array in zip(request_inputs.keys(), arrays):
+            length = _get_length(list(array.shape))
+            self._lengths[internal_id] = max(self._lengths.get(internal_id, 0), length)
+
+        self._padded_length = _get_length(list(padded.shape))
+        return padded
+
     def _merge_request_outputs(
         self, request_outputs: Dict[str, RequestOutput]
     ) -> RequestOutput:
@@ -167,6 +288,8 @@ class BatchedRequests:
     def _split_response_output(
         self, response_output: ResponseOutput
     ) -> Dict[str, ResponseOutput]:
+        if self._is_padded(response_output):
+            return self._split_padded_output(response_output)
 
         all_data = self._split_data(response_output)
         response_outputs = {}
@@ -183,12 +306,55 @@ class BatchedRequests:
 
         return response_outputs
 
+    def _is_padded(self, response_output: ResponseOutput) -> bool:
+        if self._padded_length is None:
+            return False
+
+        # Only outputs holding a value per position need to get stripped (e.g.
+        # per-token outputs, as opposed to a single value per sequence), which
+        # can't be told apart from fixed-size outputs just by their shape
+        if response_output.name not in self._padded_outputs:
+            return False
+
+        if len(response_output.shape) < 2:
+            return False
+
+        if _get_length(response_output.shape) != self._padded_length:
+            return False
+
+        return _get_numeric_dtype(response_output) is not None
+
+    def _split_padded_output(
+        self, response_output: ResponseOutput
+    ) -> Dict[str, ResponseOutput]:
+        merged_data = np.asarray(
+            _get_data(response_output), dtype=_get_numeric_dtype(response_output)
+        ).reshape(response_output.shape)
+
+        split_data = self._split_array(merged_data, element_size=1)
+        response_outputs = {}
+        for internal_id, data in split_data.items():
+            length = self._lengths.get(internal_id, self._padded_length)
+            stripped = data[:, :length]
+            response_outputs[internal_id] = ResponseOutput(
+                name=response_output.name,
+                shape=list(stripped.shape),
+                data=stripped.ravel(),
+                datatype=response_output.datatype,
+                parameters=response_output.parameters,
+            )
+
+        return response_outputs
+
     def _split_data(self, response_output: ResponseOutput) -> Dict[str, ResponseOutput]:
         merged_shape = Shape(response_output.shape)
         element_size = merged_shape.elem_size
         merged_data = _get_data(response_output)
-        idx = 0
 
+        if isinstance(merged_data, np.ndarray):
+            return self._split_array(merged_data, element_size)
+
+        idx = 0
         all_data = {}
         # TODO: Don't rely on array to have been flattened
         for internal_id, minibatch_size in self._minibatch_sizes.items():
@@ -197,3 +363,18 @@ class BatchedRequests:
             all_data[internal_id] = data
 
         return all_data
+
+    def _split_array(
+        self, merged_data: np.ndarray, element_size: int
+    ) -> Dict[str, np.ndarray]:
+        # Flattened arrays hold every element of each minibatch, whereas
+        # otherwise each minibatch spans its batch size on the first axis
+        step = element_size if merged_data.ndim == 1 else 1
+        minibatch_sizes = np.fromiter(
+            self._minibatch_sizes.values(), dtype=int, count=len(self._minibatch_sizes)
+        )
+        split_idxs = np.cumsum(minibatch_sizes * step)[:-1]
+
+        # NOTE: Splitting the array only creates views over the merged one
+        split_data = np.split(merged_data, split_idxs)
+        return dict(zip(self._minibatch_sizes.keys(), split_data))
@@ -0,0 +1,146 @@
+import math
+
+from collections import deque
+from typing import Deque, Optional
+
+# Number of recent requests used to estimate the tail latency
+_LatencyWindow = 256
+
+# Minimum number of requests observed before changing the batch size
+_MinSamples = 16
+
+# Percentile of the latency which should stay under the target
+_LatencyPercentile = 0.99
+
+# Weight given to each new observation in the moving averages
+_Smoothing = 0.1
+
+# Batches will only grow while the tail latency stays below this fraction of
+# the target, and will shrink by this factor once it goes above it
+_Headroom = 0.8
+_Backoff = 0.75
+
+
+def _ewma(average: Optional[float], value: float) -> float:
+    if average is None:
+        return value
+
+    return average + _Smoothing * (value - average)
+
+
+class _InferenceTimeEstimate:
+    """
+    Online estimate of the time it takes to run inference on a batch, modelled
+    as a fixed overhead plus a cost per element.
+    """
+
+    def __init__(self):
+        self._size: Optional[float] = None
+        self._time: Optional[float] = None
+        self._size_sq: Optional[float] = None
+        self._size_time: Optional[float] = None
+
+    def update(self, batch_size: int, inference_time: float):
+        self._size = _ewma(self._size, batch_size)
+        self._time = _ewma(self._time, inference_time)
+        self._size_sq = _ewma(self._size_sq, batch_size**2)
+        self._size_time = _ewma(self._size_time, batch_size * inference_time)
+
+    def predict(self, batch_size: int) -> float:
+        if self._size is None:
+            return 0.0
+
+        variance = self._size_sq - self._size**2  # type: ignore
+        if variance < 1e-6:
+            # Without enough variety on batch sizes, assume that inference time
+            # grows proportionally
+            return self._time * batch_size / self._size  # type: ignore
+
+        slope = (self._size_time - self._size * self._time) / variance  # type: ignore
+        intercept = self._time - slope * self._size  # type: ignore
+        return max(intercept + slope * batch_size, 0.0)
+
+
+class BatchTuner:
+    """
+    Tunes the size of each batch, and how long to wait for it, so that the
+    tail latency of batched requests stays under a target.
+
+    The batch size follows an additive-increase / multiplicative-decrease
+    policy based on the observed latencies, whereas the wait time gets derived
+    from the observed arrival rate and inference times.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        model_version: Optional[str],
+        max_batch_size: int,
+        max_batch_time: float,
+        target_latency: float,
+    ):
+        self.model_name = model_name
+        self.model_version = model_version
+
+        self._max_batch_size = max_batch_size
+        self._max_batch_time = max_batch_time
+        self._target_latency = target_latency
+
+        self.batch_size = max_batch_size
+        self.batch_time = max_batch_time
+
+        self._latencies: Deque[float] = deque(maxlen=_LatencyWindow)
+        self._last_arrival: Optional[float] = None
+        self._arrival_interval: Optional[float] = None
+        self._inference_time = _InferenceTimeEstimate()
+
+    def observe_arrival(self, now: float):
+        if self._last_arrival is not None:
+            self._arrival_interval = _ewma(
+                self._arrival_interval, now - self._last_arrival
+            )
+
+        self._last_arrival = now
+
+    def observe_latency(self, latency: float):
+        self._latencies.append(latency)
+
+    def observe_batch(self, batch_size: int, inference_time: float):
+        self._inference_time.update(batch_size, inference_time)
+        self._tune()
+
+    @property
+    def tail_latency(self) -> Optional[float]:
+        if len(self._latencies) < _MinSamples:
+            return None
+
+        latencies = sorted(self._latencies)
+        idx = math.ceil(_LatencyPercentile * len(latencies)) - 1
+        return latencies[idx]
+
+    def _tune(self):
+        tail_latency = self.tail_latency
+        if tail_latency is not None:
+            batch_size = self.batch_size
+            if tail_latency > self._target_latency:
+                batch_size = max(int(batch_size * _Backoff), 1)
+            elif tail_latency < self._target_latency * _Headroom:
+                batch_size = min(batch_size + 1, self._max_batch_size)
+
+            if batch_size != self.batch_size:
+                # Latencies observed so far don't apply to the new batch size
+                self.batch_size = batch_size
+                self._latencies.clear()
+
+        self.batch_time = self._get_batch_time()
+
+    def _get_batch_time(self) -> float:
+        # Wait as long as it would take to fill up the batch at the current
+        # arrival rate, without eating into the time needed to run inference
+        budget = self._target_latency - self._inference_time.predict(self.batch_size)
+        batch_time = min(self._max_batch_time, budget)
+        if self._arrival_interval is not None:
+            fill_time = self._arrival_interval * (self.batch_size - 1)
+            batch_time = min(batch_time, fill_time)
+
+        return max(batch_time, 0.0)
@@ -1,5 +1,6 @@
 from .numpy import NumpyCodec, NumpyRequestCodec
-from .pandas import PandasCodec
+from .pandas import PandasCodec, PandasArrowCodec
+from .arrow import ArrowCodec
 from .string import StringCodec
 from .base64 import Base64Codec
 from .datetime import DatetimeCodec
@@ -31,6 +32,8 @@ __all__ = [
     "Base64Codec",
     "DatetimeCodec",
     "PandasCodec",
+    "PandasArrowCodec",
+    "ArrowCodec",
     "InputCodec",
     "InputCodecLike",
     "RequestCodec",
@@ -0,0 +1,282 @@
+"""
+Helpers to convert tensors to and from Apache Arrow arrays.
+Numeric tensors get converted without copying their underlying buffers.
+
+These require the optional `pyarrow` package.
+"""
+
+import numpy as np
+
+from typing import Any, List, Tuple, Union
+
+from ..types import (
+    InferenceRequest,
+    InferenceResponse,
+    Parameters,
+    RequestInput,
+    ResponseOutput,
+    TensorData,
+)
+from .base import RequestCodec, register_request_codec
+from .errors import CodecError
+from .numpy import NumpyCodec, to_datatype, to_dtype
+from .pack import unpack
+from .string import StringCodec, encode_strs
+from .utils import get_decoded_or_raw
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None  # type: ignore
+
+ArrowStreamContentType = "application/vnd.apache.arrow.stream"
+
+# Keys of the schema's metadata used to carry the non-tensor fields
+_IdMetadataKey = b"id"
+_ModelNameMetadataKey = b"model_name"
+_ModelVersionMetadataKey = b"model_version"
+
+
+def check_arrow():
+    if pa is None:
+        raise CodecError(
+            "Apache Arrow support requires the `pyarrow` package to be installed"
+        )
+
+
+def _to_list(payload: Any) -> List[Any]:
+    payload = getattr(payload, "__root__", payload)
+    if isinstance(payload, np.ndarray):
+        return payload.tolist()
+
+    return list(unpack(payload))
+
+
+def to_arrow_array(request_input: RequestInput) -> "pa.Array":
+    """
+    Converts a (possibly already decoded) input into an Arrow array.
+    Inputs with more than one dimension get converted into fixed-size lists,
+    with one list per row.
+    """
+    check_arrow()
+
+    payload = get_decoded_or_raw(request_input)
+    if request_input.datatype == "BYTES" and not isinstance(payload, np.ndarray):
+        # NOTE: Arrow will work out whether these are strings or raw bytes
+        return pa.array(_to_list(payload))
+
+    if not isinstance(payload, np.ndarray):
+        payload = NumpyCodec.decode(request_input)
+
+    if payload.ndim <= 1:
+        return pa.array(payload)
+
+    row_size = int(np.prod(payload.shape[1:]))
+    values = pa.array(np.ascontiguousarray(payload).reshape(-1))
+    return pa.FixedSizeListArray.from_arrays(values, row_size)
+
+
+def _to_numpy(array: "pa.Array") -> np.ndarray:
+    # NOTE: Arrow will only avoid copying the array's buffer when it's got no
+    # missing values
+    return array.to_numpy(zero_copy_only=False)
+
+
+def _is_string(arrow_type: "pa.DataType") -> bool:
+    return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+
+
+def _is_numeric(arrow_type: "pa.DataType") -> bool:
+    return (
+        pa.types.is_integer(arrow_type)
+        or pa.types.is_floating(arrow_type)
+        or pa.types.is_boolean(arrow_type)
+    )
+
+
+def _has_nulls(array: "pa.Array") -> bool:
+    if array.null_count > 0:
+        return True
+
+    if pa.types.is_fixed_size_list(array.type):
+        return array.flatten().null_count > 0
+
+    return False
+
+
+def _to_tensor(
+    name: str, array: Union["pa.Array", "pa.ChunkedArray"]
+) -> Tuple[List[int], str, Any]:
+    if isinstance(array, pa.ChunkedArray):
+        if array.num_chunks == 1:
+            array = array.chunk(0)
+        else:
+            array = array.combine_chunks()
+
+    is_numeric = _is_numeric(array.type) or (
+        pa.types.is_fixed_size_list(array.type) and _is_numeric(array.type.value_type)
+    )
+    if is_numeric and _has_nulls(array):
+        # NOTE: Tensors can't represent missing values
+        raise CodecError(
+            f"Numeric column {name} has missing values, which are not supported"
+        )
+
+    shape = [len(array)]
+    if _is_numeric(array.type):
+        data = _to_numpy(array)
+        datatype = to_datatype(data.dtype)
+    elif is_numeric:
+        data = _to_numpy(array.flatten())
+        datatype = to_datatype(data.dtype)
+        shape.append(array.type.list_size)
+    elif _is_string(array.type):
+        data = encode_strs(array.to_pylist())
+        datatype = "BYTES"
+    else:
+        data = array.to_pylist()
+        datatype = "BYTES"
+
+    return shape, datatype, data
+
+
+def from_arrow_array(
+    name: str, array: Union["pa.Array", "pa.ChunkedArray"]
+) -> ResponseOutput:
+    """
+    Converts an Arrow array into an output, encoding its data straight from
+    its buffers.
+    """
+    check_arrow()
+
+    shape, datatype, data = _to_tensor(name, array)
+    return ResponseOutput(name=name, shape=shape, datatype=datatype, data=data)
+
+
+def _from_tensor(v2_data: Union[RequestInput, ResponseOutput]) -> "pa.Array":
+    data = getattr(v2_data.data, "__root__", v2_data.data)
+    if v2_data.datatype == "BYTES":
+        return pa.array(_to_list(data), type=pa.binary())
+
+    payload = np.asarray(data, dtype=to_dtype(v2_data)).reshape(v2_data.shape)
+    if payload.ndim <= 1:
+        return pa.array(payload.reshape(-1))
+
+    row_size = int(np.prod(payload.shape[1:]))
+    values = pa.array(np.ascontiguousarray(payload).reshape(-1))
+    return pa.FixedSizeListArray.from_arrays(values, row_size)
+
+
+@register_request_codec
+class ArrowCodec(RequestCodec):
+    """
+    Decodes a request into an Apache Arrow table, with one column per input.
+    Numeric inputs are used without copying their data.
+    """
+
+    ContentType = "arrow"
+
+    @classmethod
+    def can_encode(cls, payload: Any) -> bool:
+        return pa is not None and isinstance(payload, (pa.Table, pa.RecordBatch))
+
+    @classmethod
+    def encode(
+        cls,
+        model_name: str,
+        payload: Union["pa.Table", "pa.RecordBatch"],
+        model_version: str = None,
+    ) -> InferenceResponse:
+        outputs = [
+            from_arrow_array(name, column)
+            for name, column in zip(payload.column_names, payload.columns)
+        ]
+
+        return InferenceResponse(
+            model_name=model_name, model_version=model_version, outputs=outputs
+        )
+
+    @classmethod
+    def decode(cls, request: InferenceRequest) -> "pa.Table":
+        check_arrow()
+
+        return pa.table(
+            {
+                request_input.name: to_arrow_array(request_input)
+                for request_input in request.inputs
+            }
+        )
+
+
+def decode_arrow_stream(buffer: Union[bytes, memoryview]) -> InferenceRequest:
+    """
+    Decodes a request sent as an Arrow IPC stream, where each column of the
+    record batches becomes an input.
+    The data of numeric columns points straight to the original buffer.
+    """
+    check_arrow()
+
+    try:
+        table = pa.ipc.open_stream(pa.py_buffer(buffer)).read_all()
+    except pa.ArrowInvalid as err:
+        raise CodecError(f"Invalid Arrow IPC stream: {err}")
+
+    inputs = []
+    for name, column in zip(table.column_names, table.columns):
+        shape, datatype, data = _to_tensor(name, column)
+
+        parameters = None
+        if _is_string(column.type):
+            parameters = Parameters(content_type=StringCodec.ContentType)
+
+        inputs.append(
+            RequestInput.construct(
+                name=name,
+                shape=shape,
+                datatype=datatype,
+                parameters=parameters,
+                data=TensorData.construct(__root__=data),
+            )
+        )
+
+    metadata = table.schema.metadata or {}
+    request_id = metadata.get(_IdMetadataKey)
+    return InferenceRequest.construct(
+        id=request_id.decode() if request_id is not None else None,
+        parameters=None,
+        inputs=inputs,
+        outputs=None,
+    )
+
+
+def encode_arrow_stream(inference_response: InferenceResponse) -> bytes:
+    """
+    Encodes a response as an Arrow IPC stream, holding a single record batch
+    with one column per output.
+    """
+    check_arrow()
+
+    outputs = inference_response.outputs
+    num_rows = {output.shape[0] if output.shape else 1 for output in outputs}
+    if len(num_rows) > 1:
+        raise CodecError(
+            "Arrow responses require all outputs to have the same number of rows"
+        )
+
+    metadata = {_ModelNameMetadataKey: inference_response.model_name}
+    if inference_response.model_version is not None:
+        metadata[_ModelVersionMetadataKey] = inference_response.model_version
+    if inference_response.id is not None:
+        metadata[_IdMetadataKey] = inference_response.id
+
+    batch = pa.RecordBatch.from_arrays(
+        [_from_tensor(output) for output in outputs],
+        names=[output.name for output in outputs],
+    )
+    batch = batch.replace_schema_metadata(metadata)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+
+    return sink.getvalue().to_pybytes()
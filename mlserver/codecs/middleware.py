@@ -1,29 +1,16 @@
-from typing import Dict
+from typing import TYPE_CHECKING
 
-from .utils import decode_inference_request
-from ..settings import ModelSettings
-from ..types import InferenceRequest, MetadataTensor
+from ..types import InferenceRequest
 
-DecodedParameterName = "_decoded_payload"
-
-
-# TODO: Memoize to avoid computing the index every time
-def _metadata_index(model_settings: ModelSettings) -> Dict[str, MetadataTensor]:
-    index: Dict[str, MetadataTensor] = {}
+if TYPE_CHECKING:
+    from ..model import MLModel
 
-    if not model_settings.inputs:
-        return index
-
-    for inp in model_settings.inputs:
-        index[inp.name] = inp
-
-    return index
+DecodedParameterName = "_decoded_payload"
 
 
-def codec_middleware(
-    request: InferenceRequest, model_settings: ModelSettings
-) -> InferenceRequest:
-    metadata_inputs = _metadata_index(model_settings)
-    decode_inference_request(request, model_settings, metadata_inputs)
+def codec_middleware(request: InferenceRequest, model: "MLModel") -> InferenceRequest:
+    # NOTE: The model keeps its codecs resolved from its metadata, so that
+    # these don't need to be looked up again on every request
+    model.codec_plan.decode_inference_request(request)
 
     return request
@@ -6,7 +6,7 @@ from ..types import RequestInput, ResponseOutput, Parameters
 
 from .base import InputCodec, register_input_codec, register_request_codec
 from .utils import SingleInputRequestCodec, is_list_of
-from .string import encode_str
+from .string import encode_strs
 
 _DatatypeToNumpy = {
     "BOOL": "bool",
@@ -73,16 +73,27 @@ def _to_ndarray(v2_data: Union[RequestInput, ResponseOutput]) -> np.ndarray:
             decoded = [np.frombuffer(buffer, dtype) for buffer in data]
             return np.concatenate(decoded)
 
-    return np.array(data, dtype)
+    # NOTE: Data which is already held as a NumPy array (e.g. when it was sent
+    # as raw binary contents) doesn't need to go through a list
+    return _to_writeable(np.asarray(data, dtype))
 
 
-def _encode_data(data: np.ndarray, datatype: str) -> list:
+def _to_writeable(array: np.ndarray) -> np.ndarray:
+    # Arrays loaded from raw buffers (e.g. the request's body) are read-only,
+    # thus they need to be copied for models to be able to modify them
+    if not array.flags.writeable:
+        return array.copy()
+
+    return array
+
+
+def _encode_data(data: np.ndarray, datatype: str) -> Union[list, np.ndarray]:
     if datatype == "BYTES":
         if np.issubdtype(data.dtype, str):
             # Handle special case of a string Numpy array, where the diff elems
             # need to be encoded as well
             as_list = data.flatten().tolist()
-            return list(map(encode_str, as_list))
+            return encode_strs(as_list)
 
         if np.issubdtype(data.dtype, bytes):
             # `tobytes` is way faster than tolist, although it's harder to serialise
@@ -91,7 +102,11 @@ def _encode_data(data: np.ndarray, datatype: str) -> list:
             # need to encapsulate it into a list so that it's compatible.
             return [data.tobytes()]
 
-    return data.flatten().tolist()
+        return data.flatten().tolist()
+
+    # NOTE: Numeric tensors are kept as a (flattened) NumPy array, which will
+    # only get converted into a list if the serialiser needs it
+    return data.ravel()
 
 
 @register_input_codec
@@ -3,33 +3,79 @@ import numpy as np
 
 from typing import Any, List
 
+from .arrow import check_arrow, from_arrow_array, to_arrow_array
 from .base import RequestCodec, register_request_codec
+from .errors import CodecError
 from .numpy import to_datatype, to_dtype
-from .string import encode_str
+from .string import encode_strs
 from .utils import get_decoded_or_raw
-from .pack import PackElement
 from ..types import InferenceRequest, InferenceResponse, RequestInput, ResponseOutput
 
 
 def _to_series(request_input: RequestInput) -> pd.Series:
     payload = get_decoded_or_raw(request_input)
+    raw_data = getattr(payload, "__root__", None)
+    if isinstance(raw_data, np.ndarray):
+        # NOTE: Raw data may already be held as a NumPy array (e.g. when sent
+        # as an Arrow stream)
+        shape = request_input.shape
+        if len(shape) == 2 and shape[-1] == 1:
+            # Single columns get flattened, same as when sent as a list
+            shape = shape[:1]
+
+        payload = raw_data.reshape(shape)
+
     if isinstance(payload, np.ndarray):
+        dtype = to_dtype(request_input)
+        if payload.ndim == 1 and request_input.datatype != "BYTES":
+            # Flat numeric arrays can back the series as they are
+            return pd.Series(payload, dtype=dtype)
+
         # Necessary so that it's compatible with pd.Series
         payload = list(payload)
-        dtype = to_dtype(request_input)
         return pd.Series(payload, dtype=dtype)
 
     return pd.Series(payload)
 
 
+def _to_arrow(series: pd.Series) -> Any:
+    # NOTE: Arrow-backed series will return their underlying (chunked) array
+    # as is
+    return series.array.__arrow_array__()
+
+
+def _is_arrow_backed(series: pd.Series) -> bool:
+    arrow_dtype = getattr(pd, "ArrowDtype", None)
+    return arrow_dtype is not None and isinstance(series.dtype, arrow_dtype)
+
+
+def _check_arrow_backed():
+    check_arrow()
+    if getattr(pd, "ArrowDtype", None) is None:
+        raise CodecError("Arrow-backed DataFrames require pandas 1.5 or above")
+
+
 def _to_response_output(series: pd.Series) -> ResponseOutput:
+    if _is_arrow_backed(series):
+        return from_arrow_array(series.name, _to_arrow(series))
+
     datatype = to_datatype(series.dtype)
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+        # NOTE: Numeric columns are encoded straight from their underlying
+        # array, instead of creating a Python object per element
+        return ResponseOutput(
+            name=series.name,
+            shape=list(series.shape),
+            data=series.to_numpy(),
+            datatype=datatype,
+        )
+
     data = series.tolist()
 
     if datatype == "BYTES":
         # To ensure that "string" columns can be encoded in gRPC, we need to
         # encode them as bytes
-        data = list(map(_ensure_bytes, data))
+        data = encode_strs(data)
 
     return ResponseOutput(
         name=series.name,
@@ -40,13 +86,6 @@ def _to_response_output(series: pd.Series) -> ResponseOutput:
     )
 
 
-def _ensure_bytes(elem: PackElement) -> bytes:
-    if isinstance(elem, str):
-        return encode_str(elem)
-
-    return elem
-
-
 @register_request_codec
 class PandasCodec(RequestCodec):
     ContentType = "pd"
@@ -77,3 +116,32 @@ class PandasCodec(RequestCodec):
         }
 
         return pd.DataFrame(data)
+
+
+@register_request_codec
+class PandasArrowCodec(PandasCodec):
+    """
+    Decodes a request into a DataFrame backed by Apache Arrow arrays, where
+    numeric inputs are used without copying their data.
+    Outputs get encoded straight from the Arrow buffers of each column.
+    """
+
+    ContentType = "pd_arrow"
+
+    @classmethod
+    def can_encode(cls, payload: Any) -> bool:
+        # NOTE: Arrow-backed DataFrames can also be encoded by `PandasCodec`
+        return False
+
+    @classmethod
+    def decode(cls, request: InferenceRequest) -> pd.DataFrame:
+        _check_arrow_backed()
+
+        data = {
+            request_input.name: pd.Series(
+                pd.arrays.ArrowExtensionArray(to_arrow_array(request_input))
+            )
+            for request_input in request.inputs
+        }
+
+        return pd.DataFrame(data)
@@ -0,0 +1,217 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from ..settings import ModelSettings
+from ..types import (
+    InferenceRequest,
+    InferenceResponse,
+    MetadataTensor,
+    RequestInput,
+    RequestOutput,
+    ResponseOutput,
+)
+from .base import (
+    find_input_codec,
+    find_input_codec_by_payload,
+    find_request_codec,
+    find_request_codec_by_payload,
+    InputCodec,
+    RequestCodec,
+)
+from .utils import Parametrised, _save_decoded, get_decoded
+
+# NOTE: Keeps track of the codec used to decode each field, so that fields
+# already decoded by the codec middleware don't get decoded twice
+DecodedCodecName = "_decoded_codec"
+
+CodecType = TypeVar("CodecType", Type[InputCodec], Type[RequestCodec])
+
+
+def _get_override(parametrised_obj: Parametrised) -> Optional[str]:
+    parameters = parametrised_obj.parameters
+    if parameters is None:
+        return None
+
+    return parameters.content_type
+
+
+def _is_decoded_with(parametrised_obj: Parametrised, codec: Any) -> bool:
+    parameters = parametrised_obj.parameters
+    if parameters is None:
+        return False
+
+    return getattr(parameters, DecodedCodecName, None) is codec
+
+
+def _save_decoded_with(parametrised_obj: Parametrised, codec: Any, decoded: Any):
+    _save_decoded(parametrised_obj, decoded)
+    setattr(parametrised_obj.parameters, DecodedCodecName, codec)
+
+
+def _resolve_codecs(
+    metadata_tensors: Optional[List[MetadataTensor]],
+) -> Dict[str, Type[InputCodec]]:
+    codecs: Dict[str, Type[InputCodec]] = {}
+    for metadata_tensor in metadata_tensors or []:
+        content_type = _get_override(metadata_tensor)  # type: ignore
+        if content_type:
+            codecs[metadata_tensor.name] = find_input_codec(content_type)
+
+    return codecs
+
+
+def _find_by_payload(
+    payload: Any,
+    cached: Dict[type, CodecType],
+    find_by_payload: Callable[[Any], Optional[CodecType]],
+) -> Optional[CodecType]:
+    # NOTE: Payloads of the same type can still need different codecs (e.g.
+    # lists of strings and lists of bytes), so the cached codec needs to be
+    # checked against the payload
+    payload_type = type(payload)
+    codec = cached.get(payload_type)
+    if codec is not None and codec.can_encode(payload):
+        return codec
+
+    codec = find_by_payload(payload)
+    if codec is not None:
+        cached[payload_type] = codec
+
+    return codec
+
+
+def _get_sources(model_settings: ModelSettings) -> Tuple[Any, ...]:
+    return (
+        model_settings.inputs,
+        model_settings.outputs,
+        model_settings.parameters,
+    )
+
+
+def _get_fingerprint(model_settings: ModelSettings) -> Tuple[Any, ...]:
+    parameters = model_settings.parameters
+    return (
+        len(model_settings.inputs or []),
+        len(model_settings.outputs or []),
+        parameters.content_type if parameters is not None else None,
+    )
+
+
+class CodecPlan:
+    """
+    Codecs of a model, resolved ahead of time from the content types of its
+    metadata.
+    This avoids looking up the codec registry on every request, unless the
+    request itself overrides the content type of any of its fields.
+    """
+
+    def __init__(self, model_settings: ModelSettings):
+        self._sources = _get_sources(model_settings)
+        self._fingerprint = _get_fingerprint(model_settings)
+        self._input_codecs = _resolve_codecs(model_settings.inputs)
+        self._output_codecs = _resolve_codecs(model_settings.outputs)
+
+        self._request_codec: Optional[Type[RequestCodec]] = None
+        model_parameters = model_settings.parameters
+        if model_parameters is not None and model_parameters.content_type:
+            self._request_codec = find_request_codec(model_parameters.content_type)
+
+        # Codecs found for each type of payload when encoding outputs
+        self._codecs_by_payload: Dict[type, Type[InputCodec]] = {}
+        self._request_codecs_by_payload: Dict[type, Type[RequestCodec]] = {}
+
+    def is_stale(self, model_settings: ModelSettings) -> bool:
+        """
+        Checks whether the model's metadata has changed since its codecs were
+        resolved.
+        Metadata tends to get replaced (or extended) as a whole (e.g. while
+        loading the model), so checking the identity and size of each field
+        is enough, and cheap enough to do on every request.
+        """
+        sources = _get_sources(model_settings)
+        if any(new is not old for new, old in zip(sources, self._sources)):
+            return True
+
+        return _get_fingerprint(model_settings) != self._fingerprint
+
+    def get_input_codec(
+        self, request_input: RequestInput
+    ) -> Optional[Type[InputCodec]]:
+        content_type = _get_override(request_input)
+        if content_type:
+            return find_input_codec(content_type)
+
+        return self._input_codecs.get(request_input.name)
+
+    def get_request_codec(
+        self, inference_request: InferenceRequest
+    ) -> Optional[Type[RequestCodec]]:
+        content_type = _get_override(inference_request)
+        if content_type:
+            return find_request_codec(content_type)
+
+        return self._request_codec
+
+    def get_output_codec(
+        self, payload: Any, request_output: RequestOutput
+    ) -> Optional[Type[InputCodec]]:
+        content_type = _get_override(request_output)
+        if content_type:
+            return find_input_codec(content_type)
+
+        codec = self._output_codecs.get(request_output.name)
+        if codec is not None:
+            return codec
+
+        return _find_by_payload(
+            payload, self._codecs_by_payload, find_input_codec_by_payload
+        )
+
+    def get_response_codec(self, payload: Any) -> Optional[Type[RequestCodec]]:
+        return _find_by_payload(
+            payload, self._request_codecs_by_payload, find_request_codec_by_payload
+        )
+
+    def decode_request_input(self, request_input: RequestInput) -> Optional[Any]:
+        codec = self.get_input_codec(request_input)
+        if codec is None:
+            return None
+
+        if _is_decoded_with(request_input, codec):
+            return get_decoded(request_input)
+
+        decoded_payload = codec.decode(request_input)
+        _save_decoded_with(request_input, codec, decoded_payload)
+        return decoded_payload
+
+    def decode_inference_request(self, inference_request: InferenceRequest) -> Any:
+        for request_input in inference_request.inputs:
+            self.decode_request_input(request_input)
+
+        codec = self.get_request_codec(inference_request)
+        if codec is None:
+            return inference_request
+
+        if _is_decoded_with(inference_request, codec):
+            return get_decoded(inference_request)
+
+        decoded_payload = codec.decode(inference_request)
+        _save_decoded_with(inference_request, codec, decoded_payload)
+        return decoded_payload
+
+    def encode_response_output(
+        self, payload: Any, request_output: RequestOutput
+    ) -> Optional[ResponseOutput]:
+        codec = self.get_output_codec(payload, request_output)
+        if codec is None:
+            return None
+
+        return codec.encode(name=request_output.name, payload=payload)
+
+    def encode_inference_response(
+        self, payload: Any, model_name: str, model_version: Optional[str]
+    ) -> Optional[InferenceResponse]:
+        codec = self.get_response_codec(payload)
+        if codec is None:
+            return None
+
+        return codec.encode(model_name, payload, model_version)
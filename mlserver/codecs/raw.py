@@ -0,0 +1,81 @@
+import struct
+import numpy as np
+
+from typing import Any, List, Union
+
+from ..types import RequestInput
+from .errors import CodecError
+from .numpy import to_dtype
+
+RawData = Union[np.ndarray, List[bytes]]
+
+# BYTES elements are prefixed by their length, as a 4-byte unsigned integer
+_BytesLength = struct.Struct("<I")
+
+
+def _to_raw_dtype(datatype: str) -> np.dtype:
+    # NOTE: Numeric datatypes can be mapped without looking at the tensor's
+    # data
+    tensor = RequestInput.construct(datatype=datatype)
+    try:
+        return to_dtype(tensor).newbyteorder("<")
+    except KeyError:
+        raise CodecError(f"Unsupported datatype for raw contents: {datatype}")
+
+
+def _decode_bytes(buffer: Union[bytes, memoryview]) -> List[bytes]:
+    elems = []
+    idx = 0
+    while idx < len(buffer):
+        (elem_size,) = _BytesLength.unpack_from(buffer, idx)
+        idx += _BytesLength.size
+        elems.append(bytes(buffer[idx : idx + elem_size]))
+        idx += elem_size
+
+    return elems
+
+
+def decode_raw(
+    name: str, datatype: str, shape: List[int], buffer: Union[bytes, memoryview]
+) -> RawData:
+    """
+    Decodes the raw (i.e. flattened, little-endian) contents of a tensor.
+    Numeric tensors only get loaded as a view over the raw buffer, without
+    creating a Python object per element.
+    """
+    if datatype == "BYTES":
+        return _decode_bytes(buffer)
+
+    dtype = _to_raw_dtype(datatype)
+    expected_size = int(np.prod(shape)) * dtype.itemsize
+    if len(buffer) != expected_size:
+        raise CodecError(
+            f"Invalid size of raw contents for tensor {name}: "
+            f"expected {expected_size} bytes, got {len(buffer)}"
+        )
+
+    return np.frombuffer(buffer, dtype=dtype)
+
+
+def encode_raw(datatype: str, data: Any) -> bytes:
+    """
+    Encodes the data of a tensor into its raw (i.e. flattened, little-endian)
+    contents.
+    """
+    data = getattr(data, "__root__", data)
+    if datatype == "BYTES":
+        if isinstance(data, (bytes, str)):
+            data = [data]
+
+        buffer = bytearray()
+        for elem in data:
+            if isinstance(elem, str):
+                elem = elem.encode("utf-8")
+
+            buffer += _BytesLength.pack(len(elem))
+            buffer += elem
+
+        return bytes(buffer)
+
+    dtype = _to_raw_dtype(datatype)
+    return np.asarray(data, dtype=dtype).tobytes()
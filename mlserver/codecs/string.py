@@ -1,13 +1,18 @@
-from typing import Any, List
+from typing import Any, List, Optional
 
 from ..types import RequestInput, ResponseOutput, Parameters
 
 from .utils import SingleInputRequestCodec, is_list_of
 from .base import InputCodec, register_input_codec, register_request_codec
-from .pack import unpack, PackElement
+from .pack import unpack, PackElement, PackedPayload
 
 _DefaultStrCodec = "utf-8"
 
+# NOTE: Batches of strings get joined into a single payload, so that they can
+# be encoded / decoded in one go, instead of one element at a time
+_Separator = "\x00"
+_BytesSeparator = _Separator.encode(_DefaultStrCodec)
+
 
 def encode_str(elem: str) -> bytes:
     return elem.encode(_DefaultStrCodec)
@@ -27,6 +32,56 @@ def decode_str(encoded: PackElement, str_codec=_DefaultStrCodec) -> str:
     return ""
 
 
+def _join(elems: list, separator: Any) -> Optional[Any]:
+    try:
+        joined = separator.join(elems)
+    except TypeError:
+        # Mixed types (or missing values), which need to be handled one by one
+        return None
+
+    if joined.count(separator) != len(elems) - 1:
+        # Some of the elements contain the separator themselves
+        return None
+
+    return joined
+
+
+def encode_strs(payload: List[str]) -> List[bytes]:
+    """
+    Encodes a list of strings in bulk.
+    """
+    if not payload:
+        return []
+
+    joined = _join(payload, _Separator)
+    if joined is None:
+        return list(map(_ensure_bytes, payload))
+
+    return joined.encode(_DefaultStrCodec).split(_BytesSeparator)
+
+
+def decode_strs(packed: PackedPayload) -> List[str]:
+    """
+    Decodes a (packed) list of strings in bulk.
+    """
+    elems = packed if isinstance(packed, list) else list(unpack(packed))
+    if not elems:
+        return []
+
+    joined = _join(elems, _BytesSeparator)
+    if joined is None:
+        return list(map(decode_str, elems))
+
+    return joined.decode(_DefaultStrCodec).split(_Separator)
+
+
+def _ensure_bytes(elem: PackElement) -> bytes:
+    if isinstance(elem, str):
+        return encode_str(elem)
+
+    return elem
+
+
 @register_input_codec
 class StringCodec(InputCodec):
     """
@@ -41,21 +96,19 @@ class StringCodec(InputCodec):
 
     @classmethod
     def encode(cls, name: str, payload: List[str]) -> ResponseOutput:
-        packed = map(encode_str, payload)
+        packed = encode_strs(payload)
         shape = [len(payload)]
         return ResponseOutput(
             name=name,
             datatype="BYTES",
             shape=shape,
-            data=list(packed),
+            data=packed,
         )
 
     @classmethod
     def decode(cls, request_input: RequestInput) -> List[str]:
         packed = request_input.data.__root__
-
-        unpacked = map(decode_str, unpack(packed))
-        return list(unpacked)
+        return decode_strs(packed)
 
     @classmethod
     def encode_request_input(cls, name: str, payload: List[str]) -> RequestInput:
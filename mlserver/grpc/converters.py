@@ -1,9 +1,14 @@
+import numpy as np
+
 from typing import Any, Union, Mapping, Optional
 
 from . import dataplane_pb2 as pb
 from . import model_repository_pb2 as mr_pb
 
 from .. import types
+from ..codecs.arrow import decode_arrow_stream, encode_arrow_stream
+from ..codecs.raw import decode_raw, encode_raw
+from ..errors import InferenceError
 
 _FIELDS = {
     "BOOL": "bool_contents",
@@ -22,6 +27,14 @@ _FIELDS = {
 }
 
 
+# Datatypes which can only be sent as raw contents
+_RAW_ONLY = {"FP16"}
+
+# Requests (and responses) flagged with this parameter hold all their tensors
+# as a single Arrow IPC stream, sent as their only raw contents entry
+ArrowStreamParameter = "arrow_stream"
+
+
 def _get_value(pb_object, default: Any = None) -> Any:
     fields = pb_object.ListFields()
     if len(fields) == 0:
@@ -38,6 +51,14 @@ def _merge_map(pb_map: Mapping, value_dict: Mapping) -> Mapping:
     return pb_map
 
 
+def is_arrow_stream(pb_object: pb.ModelInferRequest) -> bool:
+    if ArrowStreamParameter not in pb_object.parameters:
+        return False
+
+    is_arrow = pb_object.parameters[ArrowStreamParameter].bool_param
+    return is_arrow and len(pb_object.raw_input_contents) == 1
+
+
 class ServerMetadataResponseConverter:
     @classmethod
     def to_types(
@@ -121,12 +142,41 @@ class TensorMetadataConverter:
 class ModelInferRequestConverter:
     @classmethod
     def to_types(cls, pb_object: pb.ModelInferRequest) -> types.InferenceRequest:
+        raw_contents = pb_object.raw_input_contents
+        if is_arrow_stream(pb_object):
+            inference_request = decode_arrow_stream(raw_contents[0])
+            inference_request.id = pb_object.id
+            inference_request.parameters = ParametersConverter.to_types(
+                pb_object.parameters
+            )
+            if pb_object.outputs:
+                inference_request.outputs = [
+                    InferRequestedOutputTensorConverter.to_types(out)
+                    for out in pb_object.outputs
+                ]
+
+            return inference_request
+
+        if raw_contents:
+            if len(raw_contents) != len(pb_object.inputs):
+                raise InferenceError(
+                    "Raw input contents need to be sent for every input: "
+                    f"expected {len(pb_object.inputs)}, got {len(raw_contents)}"
+                )
+
+            inputs = [
+                InferInputTensorConverter.to_types(inp, raw_contents=raw)
+                for inp, raw in zip(pb_object.inputs, raw_contents)
+            ]
+        else:
+            inputs = [
+                InferInputTensorConverter.to_types(inp) for inp in pb_object.inputs
+            ]
+
         inference_request = types.InferenceRequest.construct(
             id=pb_object.id,
             parameters=ParametersConverter.to_types(pb_object.parameters),
-            inputs=[
-                InferInputTensorConverter.to_types(inp) for inp in pb_object.inputs
-            ],
+            inputs=inputs,
         )
 
         if pb_object.outputs:
@@ -139,16 +189,30 @@ class ModelInferRequestConverter:
 
     @classmethod
     def from_types(
-        cls, type_object: types.InferenceRequest, model_name: str, model_version: str
+        cls,
+        type_object: types.InferenceRequest,
+        model_name: str,
+        model_version: str,
+        use_raw: bool = False,
     ) -> pb.ModelInferRequest:
+        # Raw contents need to be used for either all inputs or none of them
+        if not use_raw:
+            use_raw = any(inp.datatype in _RAW_ONLY for inp in type_object.inputs)
+
         model_infer_request = pb.ModelInferRequest(
             model_name=model_name,
             model_version=model_version,
             inputs=[
-                InferInputTensorConverter.from_types(inp) for inp in type_object.inputs
+                InferInputTensorConverter.from_types(inp, use_raw=use_raw)
+                for inp in type_object.inputs
             ],
         )
 
+        if use_raw:
+            model_infer_request.raw_input_contents.extend(
+                [encode_raw(inp.datatype, inp.data) for inp in type_object.inputs]
+            )
+
         if type_object.id is not None:
             model_infer_request.id = type_object.id
 
@@ -172,29 +236,46 @@ class ModelInferRequestConverter:
 class InferInputTensorConverter:
     @classmethod
     def to_types(
-        cls, pb_object: pb.ModelInferRequest.InferInputTensor
+        cls,
+        pb_object: pb.ModelInferRequest.InferInputTensor,
+        raw_contents: Optional[bytes] = None,
     ) -> types.RequestInput:
+        shape = list(pb_object.shape)
+        if raw_contents is None:
+            data = InferTensorContentsConverter.to_types(pb_object.contents)
+        else:
+            decoded = decode_raw(
+                pb_object.name, pb_object.datatype, shape, raw_contents
+            )
+            data = types.TensorData.construct(__root__=decoded)
+
         return types.RequestInput.construct(
             name=pb_object.name,
-            shape=list(pb_object.shape),
+            shape=shape,
             datatype=pb_object.datatype,
             parameters=ParametersConverter.to_types(pb_object.parameters),
-            data=InferTensorContentsConverter.to_types(pb_object.contents),
+            data=data,
         )
 
     @classmethod
     def from_types(
-        cls, type_object: types.RequestInput
+        cls, type_object: types.RequestInput, use_raw: bool = False
     ) -> pb.ModelInferRequest.InferInputTensor:
         infer_input_tensor = pb.ModelInferRequest.InferInputTensor(
             name=type_object.name,
             shape=type_object.shape,
             datatype=type_object.datatype,
-            contents=InferTensorContentsConverter.from_types(
-                type_object.data, datatype=type_object.datatype
-            ),
         )
 
+        if not use_raw:
+            # Otherwise, the data will be sent as part of the raw contents of
+            # the request
+            infer_input_tensor.contents.CopyFrom(
+                InferTensorContentsConverter.from_types(
+                    type_object.data, datatype=type_object.datatype
+                )
+            )
+
         if type_object.parameters is not None:
             _merge_map(
                 infer_input_tensor.parameters,
@@ -292,7 +373,13 @@ class InferTensorContentsConverter:
     @classmethod
     def _get_contents(cls, type_object: types.TensorData, datatype: str) -> dict:
         field = _FIELDS[datatype]
-        return {field: type_object}
+        data = getattr(type_object, "__root__", type_object)
+        if isinstance(data, np.ndarray):
+            # Lazy tensor data only gets converted into a list once it needs
+            # to be copied into the Protobuf message
+            data = data.tolist()
+
+        return {field: data}
 
 
 class ModelInferResponseConverter:
@@ -301,15 +388,51 @@ class ModelInferResponseConverter:
         pass
 
     @classmethod
-    def from_types(cls, type_object: types.InferenceResponse) -> pb.ModelInferResponse:
+    def from_types(
+        cls,
+        type_object: types.InferenceResponse,
+        use_raw: bool = False,
+        use_arrow: bool = False,
+    ) -> pb.ModelInferResponse:
+        if use_arrow:
+            # The whole set of outputs gets sent as a single Arrow IPC stream
+            model_infer_response = pb.ModelInferResponse(
+                model_name=type_object.model_name,
+                raw_output_contents=[encode_arrow_stream(type_object)],
+            )
+            model_infer_response.parameters[ArrowStreamParameter].bool_param = True
+            return cls._add_fields(model_infer_response, type_object)
+
+        # Raw contents need to be used for either all outputs or none of them
+        if not use_raw:
+            use_raw = any(
+                output.datatype in _RAW_ONLY for output in type_object.outputs
+            )
+
         model_infer_response = pb.ModelInferResponse(
             model_name=type_object.model_name,
             outputs=[
-                InferOutputTensorConverter.from_types(output)
+                InferOutputTensorConverter.from_types(output, use_raw=use_raw)
                 for output in type_object.outputs
             ],
         )
 
+        if use_raw:
+            model_infer_response.raw_output_contents.extend(
+                [
+                    encode_raw(output.datatype, output.data)
+                    for output in type_object.outputs
+                ]
+            )
+
+        return cls._add_fields(model_infer_response, type_object)
+
+    @classmethod
+    def _add_fields(
+        cls,
+        model_infer_response: pb.ModelInferResponse,
+        type_object: types.InferenceResponse,
+    ) -> pb.ModelInferResponse:
         if type_object.model_version is not None:
             model_infer_response.model_version = type_object.model_version
 
@@ -334,17 +457,23 @@ class InferOutputTensorConverter:
 
     @classmethod
     def from_types(
-        cls, type_object: types.ResponseOutput
+        cls, type_object: types.ResponseOutput, use_raw: bool = False
     ) -> pb.ModelInferResponse.InferOutputTensor:
         infer_output_tensor = pb.ModelInferResponse.InferOutputTensor(
             name=type_object.name,
             shape=type_object.shape,
             datatype=type_object.datatype,
-            contents=InferTensorContentsConverter.from_types(
-                type_object.data, datatype=type_object.datatype
-            ),
         )
 
+        if not use_raw:
+            # Otherwise, the data will be sent as part of the raw contents of
+            # the response
+            infer_output_tensor.contents.CopyFrom(
+                InferTensorContentsConverter.from_types(
+                    type_object.data, datatype=type_object.datatype
+                )
+            )
+
         if type_object.parameters:
             _merge_map(
                 infer_output_tensor.parameters,
@@ -524,6 +524,7 @@ class ModelInferRequest(google.protobuf.message.Message):
     PARAMETERS_FIELD_NUMBER: builtins.int
     INPUTS_FIELD_NUMBER: builtins.int
     OUTPUTS_FIELD_NUMBER: builtins.int
+    RAW_INPUT_CONTENTS_FIELD_NUMBER: builtins.int
     model_name: typing.Text = ...
     """The name of the model to use for inferencing."""
 
@@ -562,6 +563,27 @@ class ModelInferRequest(google.protobuf.message.Message):
         specified all outputs produced by the model will be returned.
         """
         pass
+    @property
+    def raw_input_contents(
+        self,
+    ) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[
+        builtins.bytes
+    ]:
+        """The data contained in an input tensor can be represented in "raw"
+        bytes form or in the repeated type that matches the tensor's data
+        type. To use the raw representation 'raw_input_contents' must be
+        initialized with data for each tensor in the same order as
+        'inputs'. For each tensor, the size of this content must match
+        what is expected by the tensor's shape and data type. The raw
+        data must be the flattened, one-dimensional, row-major order of
+        the tensor elements without any stride or padding between the
+        elements. Note that the FP16 data type must be represented as raw
+        content as there is no specific data type for a 16-bit float type.
+
+        If this field is specified then InferInputTensor::contents must
+        not be specified for any input tensor.
+        """
+        pass
     def __init__(
         self,
         *,
@@ -577,6 +599,7 @@ class ModelInferRequest(google.protobuf.message.Message):
         outputs: typing.Optional[
             typing.Iterable[global___ModelInferRequest.InferRequestedOutputTensor]
         ] = ...,
+        raw_input_contents: typing.Optional[typing.Iterable[builtins.bytes]] = ...,
     ) -> None: ...
     def ClearField(
         self,
@@ -593,6 +616,8 @@ class ModelInferRequest(google.protobuf.message.Message):
             b"outputs",
             "parameters",
             b"parameters",
+            "raw_input_contents",
+            b"raw_input_contents",
         ],
     ) -> None: ...
 
@@ -708,6 +733,7 @@ class ModelInferResponse(google.protobuf.message.Message):
     ID_FIELD_NUMBER: builtins.int
     PARAMETERS_FIELD_NUMBER: builtins.int
     OUTPUTS_FIELD_NUMBER: builtins.int
+    RAW_OUTPUT_CONTENTS_FIELD_NUMBER: builtins.int
     model_name: typing.Text = ...
     """The name of the model used for inference."""
 
@@ -732,6 +758,27 @@ class ModelInferResponse(google.protobuf.message.Message):
     ]:
         """The output tensors holding inference results."""
         pass
+    @property
+    def raw_output_contents(
+        self,
+    ) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[
+        builtins.bytes
+    ]:
+        """The data contained in an output tensor can be represented in
+        "raw" bytes form or in the repeated type that matches the
+        tensor's data type. To use the raw representation 'raw_output_contents'
+        must be initialized for each tensor in the same order as
+        'outputs'. For each tensor, the size of this content must match
+        what is expected by the tensor's shape and data type. The raw
+        data must be the flattened, one-dimensional, row-major order of
+        the tensor elements without any stride or padding between the
+        elements. Note that the FP16 data type must be represented as raw
+        content as there is no specific data type for a 16-bit float type.
+
+        If this field is specified then InferOutputTensor::contents must
+        not be specified for any output tensor.
+        """
+        pass
     def __init__(
         self,
         *,
@@ -744,6 +791,7 @@ class ModelInferResponse(google.protobuf.message.Message):
         outputs: typing.Optional[
             typing.Iterable[global___ModelInferResponse.InferOutputTensor]
         ] = ...,
+        raw_output_contents: typing.Optional[typing.Iterable[builtins.bytes]] = ...,
     ) -> None: ...
     def ClearField(
         self,
@@ -758,11 +806,71 @@ class ModelInferResponse(google.protobuf.message.Message):
             b"outputs",
             "parameters",
             b"parameters",
+            "raw_output_contents",
+            b"raw_output_contents",
         ],
     ) -> None: ...
 
 global___ModelInferResponse = ModelInferResponse
 
+class ModelStreamInferResponse(google.protobuf.message.Message):
+    """
+    ModelStreamInfer messages.
+    """
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor = ...
+    ERROR_MESSAGE_FIELD_NUMBER: builtins.int
+    INFER_RESPONSE_FIELD_NUMBER: builtins.int
+    error_message: typing.Text = ...
+    """The message describing the error. An empty message indicates that the
+    inference was successful without errors.
+    """
+
+    @property
+    def infer_response(self) -> global___ModelInferResponse:
+        """Holds the results of the request. On errors, only its model name,
+        version and id will be set, so that it can be matched to its request.
+        """
+        pass
+    def __init__(self,
+        *,
+        error_message : typing.Text = ...,
+        infer_response : typing.Optional[global___ModelInferResponse] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal[u"infer_response",b"infer_response"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal[u"error_message",b"error_message",u"infer_response",b"infer_response"]) -> None: ...
+global___ModelStreamInferResponse = ModelStreamInferResponse
+
+class ModelBulkInferRequest(google.protobuf.message.Message):
+    """
+    ModelBulkInfer messages.
+    """
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor = ...
+    MODEL_NAME_FIELD_NUMBER: builtins.int
+    MODEL_VERSION_FIELD_NUMBER: builtins.int
+    REQUESTS_FIELD_NUMBER: builtins.int
+    model_name: typing.Text = ...
+    """The name of the model to use for inference."""
+
+    model_version: typing.Text = ...
+    """The version of the model to use for inference. If not given the
+    server will choose a version based on the model and internal policy.
+    """
+
+    @property
+    def requests(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___ModelInferRequest]:
+        """The list of independent inference requests. Their own model name and
+        version will be ignored.
+        """
+        pass
+    def __init__(self,
+        *,
+        model_name : typing.Text = ...,
+        model_version : typing.Text = ...,
+        requests : typing.Optional[typing.Iterable[global___ModelInferRequest]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal[u"model_name",b"model_name",u"model_version",b"model_version",u"requests",b"requests"]) -> None: ...
+global___ModelBulkInferRequest = ModelBulkInferRequest
+
 class InferParameter(google.protobuf.message.Message):
     """
     An inference parameter value.
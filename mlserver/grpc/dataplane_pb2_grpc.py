@@ -47,6 +47,16 @@ class GRPCInferenceServiceStub(object):
             request_serializer=dataplane__pb2.ModelInferRequest.SerializeToString,
             response_deserializer=dataplane__pb2.ModelInferResponse.FromString,
         )
+        self.ModelStreamInfer = channel.stream_stream(
+            "/inference.GRPCInferenceService/ModelStreamInfer",
+            request_serializer=dataplane__pb2.ModelInferRequest.SerializeToString,
+            response_deserializer=dataplane__pb2.ModelStreamInferResponse.FromString,
+        )
+        self.ModelBulkInfer = channel.unary_stream(
+            "/inference.GRPCInferenceService/ModelBulkInfer",
+            request_serializer=dataplane__pb2.ModelBulkInferRequest.SerializeToString,
+            response_deserializer=dataplane__pb2.ModelStreamInferResponse.FromString,
+        )
 
 
 class GRPCInferenceServiceServicer(object):
@@ -91,6 +101,22 @@ class GRPCInferenceServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ModelStreamInfer(self, request_iterator, context):
+        """Perform inference using a specific model, over a bidirectional stream.
+        Responses may be sent back in a different order than their requests.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def ModelBulkInfer(self, request, context):
+        """Perform inference over a list of independent requests for a specific
+        model. Responses are streamed back as soon as each of them is ready.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_GRPCInferenceServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -124,6 +150,16 @@ def add_GRPCInferenceServiceServicer_to_server(servicer, server):
             request_deserializer=dataplane__pb2.ModelInferRequest.FromString,
             response_serializer=dataplane__pb2.ModelInferResponse.SerializeToString,
         ),
+        "ModelStreamInfer": grpc.stream_stream_rpc_method_handler(
+            servicer.ModelStreamInfer,
+            request_deserializer=dataplane__pb2.ModelInferRequest.FromString,
+            response_serializer=dataplane__pb2.ModelStreamInferResponse.SerializeToString,
+        ),
+        "ModelBulkInfer": grpc.unary_stream_rpc_method_handler(
+            servicer.ModelBulkInfer,
+            request_deserializer=dataplane__pb2.ModelBulkInferRequest.FromString,
+            response_serializer=dataplane__pb2.ModelStreamInferResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "inference.GRPCInferenceService", rpc_method_handlers
@@ -311,3 +347,61 @@ class GRPCInferenceService(object):
             timeout,
             metadata,
         )
+
+    @staticmethod
+    def ModelStreamInfer(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            "/inference.GRPCInferenceService/ModelStreamInfer",
+            dataplane__pb2.ModelInferRequest.SerializeToString,
+            dataplane__pb2.ModelStreamInferResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def ModelBulkInfer(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/inference.GRPCInferenceService/ModelBulkInfer",
+            dataplane__pb2.ModelBulkInferRequest.SerializeToString,
+            dataplane__pb2.ModelStreamInferResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
@@ -1,4 +1,4 @@
-from typing import Awaitable, Callable, Tuple
+from typing import AsyncIterator, Awaitable, Callable, Tuple
 from functools import partial
 from timeit import default_timer
 
@@ -12,6 +12,14 @@ from py_grpc_prometheus.prometheus_server_interceptor import (
 from .logging import logger
 
 
+async def _wrap_async_iterator_inc_counter(
+    iterator: AsyncIterator, counter
+) -> AsyncIterator:
+    async for item in iterator:
+        counter.inc()
+        yield item
+
+
 class LoggingInterceptor(ServerInterceptor):
     def _get_log_message(self, handler_call_details: HandlerCallDetails) -> str:
         return handler_call_details.method
@@ -94,6 +102,11 @@ class PromServerInterceptor(ServerInterceptor):
 
         https://github.com/lchenn/py-grpc-prometheus/blob/eb9dee1f0a4e57cef220193ee48021dc9a9f3d82/py_grpc_prometheus/prometheus_server_interceptor.py#L46-L120
         """
+        if response_streaming:
+            return self._stream_metrics_wrapper(
+                method_call, old_handler, request_streaming
+            )
+
         grpc_service_name, grpc_method_name, _ = method_call
 
         async def _new_handler(request_or_iterator, servicer_context: ServicerContext):
@@ -196,3 +209,57 @@ class PromServerInterceptor(ServerInterceptor):
                 raise e
 
         return _new_handler
+
+    def _stream_metrics_wrapper(
+        self,
+        method_call: Tuple[str, str, str],
+        old_handler: RpcMethodHandler,
+        request_streaming: bool,
+    ):
+        """
+        Metrics wrapper for RPCs with streaming responses, which (with gRPC's
+        AsyncIO support) are implemented as async generators, and thus can't
+        be awaited.
+        """
+        grpc_service_name, grpc_method_name, _ = method_call
+        grpc_type = grpc_utils.get_method_type(request_streaming, True)
+        labels = {
+            "grpc_type": grpc_type,
+            "grpc_service": grpc_service_name,
+            "grpc_method": grpc_method_name,
+        }
+        metrics = self._interceptor._metrics
+
+        async def _new_handler(request_or_iterator, servicer_context: ServicerContext):
+            if request_streaming:
+                request_or_iterator = _wrap_async_iterator_inc_counter(
+                    request_or_iterator,
+                    metrics["grpc_server_stream_msg_received"].labels(**labels),
+                )
+            else:
+                metrics["grpc_server_started_counter"].labels(**labels).inc()
+
+            sent_counter = metrics["grpc_server_stream_msg_sent"].labels(**labels)
+            try:
+                async for response in old_handler(
+                    request_or_iterator, servicer_context
+                ):
+                    sent_counter.inc()
+                    yield response
+            except RpcError as e:
+                self._interceptor.increase_grpc_server_handled_total_counter(
+                    grpc_type,
+                    grpc_service_name,
+                    grpc_method_name,
+                    self._interceptor._compute_error_code(e).name,
+                )
+                raise e
+
+            self._interceptor.increase_grpc_server_handled_total_counter(
+                grpc_type,
+                grpc_service_name,
+                grpc_method_name,
+                self._compute_status_code(servicer_context).name,
+            )
+
+        return _new_handler
@@ -1,6 +1,7 @@
+import asyncio
 import grpc
 
-from typing import Callable
+from typing import AsyncIterator, Callable, Dict, Set
 from fastapi import status
 
 from . import dataplane_pb2 as pb
@@ -10,6 +11,7 @@ from .model_repository_pb2_grpc import ModelRepositoryServiceServicer
 from .converters import (
     ModelInferRequestConverter,
     ModelInferResponseConverter,
+    is_arrow_stream,
     ServerMetadataResponseConverter,
     ModelMetadataResponseConverter,
     RepositoryIndexRequestConverter,
@@ -21,12 +23,15 @@ from .utils import to_headers, to_metadata
 from ..utils import insert_headers, extract_headers
 from ..handlers import DataPlane, ModelRepositoryHandlers
 from ..errors import MLServerError
+from ..settings import Settings
 
 STATUS_CODE_MAPPING = {
     status.HTTP_400_BAD_REQUEST: grpc.StatusCode.INVALID_ARGUMENT,
     status.HTTP_404_NOT_FOUND: grpc.StatusCode.NOT_FOUND,
     status.HTTP_422_UNPROCESSABLE_ENTITY: grpc.StatusCode.FAILED_PRECONDITION,
     status.HTTP_500_INTERNAL_SERVER_ERROR: grpc.StatusCode.INTERNAL,
+    status.HTTP_503_SERVICE_UNAVAILABLE: grpc.StatusCode.UNAVAILABLE,
+    status.HTTP_504_GATEWAY_TIMEOUT: grpc.StatusCode.DEADLINE_EXCEEDED,
 }
 
 
@@ -45,10 +50,23 @@ def _handle_mlserver_error(f: Callable):
     return _inner
 
 
+def _to_stream_error(
+    err: Exception, model_name: str, model_version: str, request_id: str
+) -> pb.ModelStreamInferResponse:
+    # Errors need to carry the request's ID, so that they can be matched
+    return pb.ModelStreamInferResponse(
+        error_message=str(err),
+        infer_response=pb.ModelInferResponse(
+            model_name=model_name, model_version=model_version, id=request_id
+        ),
+    )
+
+
 class InferenceServicer(GRPCInferenceServiceServicer):
-    def __init__(self, data_plane: DataPlane):
+    def __init__(self, data_plane: DataPlane, settings: Settings):
         super().__init__()
         self._data_plane = data_plane
+        self._settings = settings
 
     async def ServerLive(
         self, request: pb.ServerLiveRequest, context
@@ -103,9 +121,148 @@ class InferenceServicer(GRPCInferenceServiceServicer):
             response_metadata = to_metadata(response_headers)
             context.set_trailing_metadata(response_metadata)
 
-        response = ModelInferResponseConverter.from_types(result)
+        # Reply with raw contents (or an Arrow stream) to clients which sent
+        # them
+        use_raw = len(request.raw_input_contents) > 0
+        use_arrow = is_arrow_stream(request)
+        response = ModelInferResponseConverter.from_types(
+            result, use_raw=use_raw, use_arrow=use_arrow
+        )
         return response
 
+    async def ModelStreamInfer(
+        self,
+        request_iterator: AsyncIterator[pb.ModelInferRequest],
+        context: grpc.ServicerContext,
+    ) -> AsyncIterator[pb.ModelStreamInferResponse]:
+        # NOTE: Requests get processed concurrently (so that they can get
+        # batched together), thus responses will be sent back as soon as they
+        # are ready, regardless of the order of their requests
+        request_headers = to_headers(context)
+        responses: asyncio.Queue = asyncio.Queue()
+        in_flight: Set[asyncio.Task] = set()
+
+        # Each request holds a slot until its response gets sent back, which
+        # keeps both the pending tasks and the queued responses bounded
+        slots = asyncio.Semaphore(self._settings.grpc_max_stream_requests)
+
+        async def _process_request(request: pb.ModelInferRequest):
+            try:
+                response = await self._stream_infer(request, request_headers)
+            except BaseException:
+                slots.release()
+                raise
+
+            responses.put_nowait(response)
+
+        async def _read_requests():
+            try:
+                # Stop reading from the stream while all slots are taken
+                await slots.acquire()
+                async for request in request_iterator:
+                    task = asyncio.create_task(_process_request(request))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+                    await slots.acquire()
+
+                if in_flight:
+                    await asyncio.wait(in_flight)
+            finally:
+                responses.put_nowait(None)
+
+        reader = asyncio.create_task(_read_requests())
+        try:
+            while True:
+                response = await responses.get()
+                if response is None:
+                    break
+
+                yield response
+                slots.release()
+
+            # Surface any errors raised while reading the request stream
+            await reader
+        finally:
+            # If the stream gets closed early, there is no one left waiting for
+            # the pending requests
+            reader.cancel()
+            for task in in_flight:
+                task.cancel()
+
+    async def ModelBulkInfer(
+        self, request: pb.ModelBulkInferRequest, context: grpc.ServicerContext
+    ) -> AsyncIterator[pb.ModelStreamInferResponse]:
+        request_headers = to_headers(context)
+        try:
+            payloads = []
+            for model_infer_request in request.requests:
+                payload = ModelInferRequestConverter.to_types(model_infer_request)
+                insert_headers(payload, request_headers.copy())
+                payloads.append(payload)
+
+            results = await self._data_plane.infer_bulk(
+                payloads, name=request.model_name, version=request.model_version
+            )
+        except MLServerError as err:
+            logger.error(err)
+            await context.abort(code=_grpc_status_code(err), details=str(err))
+
+        async for idx, result in results:
+            model_infer_request = request.requests[idx]
+            if isinstance(result, Exception):
+                logger.error(result)
+                yield _to_stream_error(
+                    result,
+                    request.model_name,
+                    request.model_version,
+                    payloads[idx].id,
+                )
+                continue
+
+            # NOTE: Response headers can't be sent back for each response
+            extract_headers(result)
+
+            use_raw = len(model_infer_request.raw_input_contents) > 0
+            use_arrow = is_arrow_stream(model_infer_request)
+            response = ModelInferResponseConverter.from_types(
+                result, use_raw=use_raw, use_arrow=use_arrow
+            )
+            yield pb.ModelStreamInferResponse(infer_response=response)
+
+    async def _stream_infer(
+        self, request: pb.ModelInferRequest, request_headers: Dict[str, str]
+    ) -> pb.ModelStreamInferResponse:
+        try:
+            payload = ModelInferRequestConverter.to_types(request)
+            insert_headers(payload, request_headers.copy())
+
+            result = await self._data_plane.infer(
+                payload=payload, name=request.model_name, version=request.model_version
+            )
+
+            # NOTE: Response headers can't be sent back for each message of
+            # the stream
+            extract_headers(result)
+
+            use_raw = len(request.raw_input_contents) > 0
+            use_arrow = is_arrow_stream(request)
+            response = ModelInferResponseConverter.from_types(
+                result, use_raw=use_raw, use_arrow=use_arrow
+            )
+            return pb.ModelStreamInferResponse(infer_response=response)
+        except MLServerError as err:
+            logger.error(err)
+            return _to_stream_error(
+                err, request.model_name, request.model_version, request.id
+            )
+        except Exception as err:
+            # Unexpected errors shouldn't close the stream for every other
+            # request
+            logger.exception(err)
+            return _to_stream_error(
+                err, request.model_name, request.model_version, request.id
+            )
+
 
 class ModelRepositoryServicer(ModelRepositoryServiceServicer):
     def __init__(self, handlers: ModelRepositoryHandlers):
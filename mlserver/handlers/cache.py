@@ -0,0 +1,121 @@
+import time
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ..codecs.numpy import to_dtype
+from ..types import InferenceResponse, ResponseOutput
+
+# Each entry holds the cached response, its size in bytes, and when it expires
+_CacheEntry = Tuple[InferenceResponse, int, float]
+
+
+def _get_output_size(response_output: ResponseOutput) -> int:
+    data = getattr(response_output.data, "__root__", response_output.data)
+    if isinstance(data, np.ndarray):
+        return data.nbytes
+
+    if isinstance(data, (bytes, str)):
+        return len(data)
+
+    if response_output.datatype == "BYTES":
+        return sum(len(elem) for elem in data if isinstance(elem, (bytes, str)))
+
+    # Estimate the size of numeric data from its shape, to avoid having to go
+    # through every element
+    num_elems = int(np.prod(response_output.shape))
+
+    try:
+        return num_elems * to_dtype(response_output).itemsize
+    except KeyError:
+        # Unknown datatype
+        return num_elems
+
+
+def get_response_size(response: InferenceResponse) -> int:
+    """
+    Returns a rough estimate of the memory used by the data of a response.
+    """
+    return sum(
+        _get_output_size(response_output) for response_output in response.outputs
+    )
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache of the responses returned by a model, which can be
+    capped on the number of entries and total bytes held, and whose entries
+    can expire after a TTL.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        model_version: Optional[str],
+        max_entries: int,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.model_name = model_name
+        self.model_version = model_version
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[InferenceResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        response, _, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._evict(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return response
+
+    def put(self, key: str, response: InferenceResponse):
+        size = get_response_size(response)
+        if self._max_bytes is not None and size > self._max_bytes:
+            # The response wouldn't fit even on an empty cache
+            return
+
+        if key in self._entries:
+            self._evict(key)
+
+        expires_at = float("inf")
+        if self._ttl is not None:
+            expires_at = time.monotonic() + self._ttl
+
+        self._entries[key] = (response, size, expires_at)
+        self.size_bytes += size
+
+        # Evict least recently used entries until we're back within limits
+        while len(self._entries) > self._max_entries or self._is_over_max_bytes():
+            oldest_key = next(iter(self._entries))
+            self._evict(oldest_key)
+
+    def _is_over_max_bytes(self) -> bool:
+        if self._max_bytes is None:
+            return False
+
+        return self.size_bytes > self._max_bytes
+
+    def _evict(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self.size_bytes -= size
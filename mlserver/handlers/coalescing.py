@@ -0,0 +1,120 @@
+import asyncio
+import hashlib
+import json
+
+from asyncio import Task
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Union
+
+import numpy as np
+
+from ..codecs.numpy import to_dtype
+from ..codecs.raw import _BytesLength
+from ..model import MLModel
+from ..types import InferenceRequest, InferenceResponse, RequestInput, RequestOutput
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, sort_keys=True, default=str).encode()
+
+
+def _parameters(obj: Any) -> Dict[str, Any]:
+    if obj.parameters is None:
+        return {}
+
+    return obj.parameters.dict(exclude={"headers"}, exclude_none=True)
+
+
+def _update_bytes(digest: "hashlib._Hash", data: Any):
+    elems = [data] if isinstance(data, (bytes, str)) else data
+    for elem in np.asarray(elems, dtype=object).reshape(-1):
+        if isinstance(elem, str):
+            elem = elem.encode("utf-8")
+        elif not isinstance(elem, bytes):
+            elem = str(elem).encode("utf-8")
+
+        digest.update(_BytesLength.pack(len(elem)))
+        digest.update(elem)
+
+
+def _update_tensor(digest: "hashlib._Hash", tensor: Union[RequestInput, RequestOutput]):
+    header = [tensor.name, _parameters(tensor)]
+    if isinstance(tensor, RequestInput):
+        header += [tensor.shape, tensor.datatype]
+    digest.update(_dumps(header))
+
+    if not isinstance(tensor, RequestInput):
+        return
+
+    data = getattr(tensor.data, "__root__", tensor.data)
+    if tensor.datatype == "BYTES":
+        return _update_bytes(digest, data)
+
+    try:
+        # NOTE: Hashing the tensor's raw bytes avoids serialising each of its
+        # elements, which would dominate the cost of large payloads
+        digest.update(np.asarray(data, dtype=to_dtype(tensor)).tobytes())
+    except (KeyError, TypeError, ValueError):
+        # Malformed tensors will be rejected by the model later on
+        digest.update(_dumps(data))
+
+
+def get_request_key(model: MLModel, payload: InferenceRequest) -> str:
+    """
+    Returns a key which identifies requests that should always lead to the
+    same response from a model.
+    The key is built from the raw bytes of each input, alongside their name,
+    shape, datatype and parameters.
+    Request IDs and headers are left out, as they will usually change across
+    clients.
+    """
+    digest = hashlib.sha256(_dumps(_parameters(payload)))
+    for request_input in payload.inputs:
+        _update_tensor(digest, request_input)
+
+    digest.update(_dumps(len(payload.inputs)))
+    for request_output in payload.outputs or []:
+        _update_tensor(digest, request_output)
+
+    return f"{model.name}:{model.version}:{digest.hexdigest()}"
+
+
+def copy_response(response: InferenceResponse) -> InferenceResponse:
+    """
+    Returns a copy of a response which can get modified independently (e.g.
+    to change its ID or to extract its headers), while still sharing its data.
+    """
+    update = {}
+    if response.parameters is not None:
+        update["parameters"] = response.parameters.copy()
+
+    return response.copy(update=update)
+
+
+class RequestCoalescer:
+    """
+    Ensures that concurrent identical requests only run inference once, with
+    every duplicate waiting for the prediction that is already in flight.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, Task] = {}
+
+    async def coalesce(
+        self, key: str, predict: Callable[[], Awaitable[InferenceResponse]]
+    ) -> InferenceResponse:
+        in_flight = self._in_flight.get(key)
+        if in_flight is None:
+            in_flight = asyncio.create_task(predict())
+            in_flight.add_done_callback(partial(self._remove, key))
+            self._in_flight[key] = in_flight
+
+        # Shield the prediction so that, if the client which started it goes
+        # away, the rest of them still get their response
+        response = await asyncio.shield(in_flight)
+
+        # Every client gets its own copy, as the response ID will differ
+        return copy_response(response)
+
+    def _remove(self, key: str, in_flight: Task):
+        self._in_flight.pop(key, None)
@@ -1,3 +1,10 @@
+import asyncio
+
+from functools import partial
+from typing import AsyncIterator, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
+
+from ..model import MLModel
 from ..settings import Settings
 from ..registry import MultiModelRegistry
 from ..types import (
@@ -6,8 +13,10 @@ from ..types import (
     InferenceRequest,
     InferenceResponse,
 )
-from ..middleware import inference_middlewares
 from ..utils import generate_uuid
+from .cache import ResponseCache
+from .coalescing import RequestCoalescer, copy_response, get_request_key
+from .metrics import response_cache_collector
 
 
 class DataPlane:
@@ -19,6 +28,10 @@ class DataPlane:
     def __init__(self, settings: Settings, model_registry: MultiModelRegistry):
         self._settings = settings
         self._model_registry = model_registry
+        self._coalescer = RequestCoalescer()
+
+        # Response caches will go away alongside their models
+        self._response_caches: WeakKeyDictionary = WeakKeyDictionary()
 
     async def live(self) -> bool:
         return True
@@ -52,14 +65,99 @@ class DataPlane:
             payload.id = generate_uuid()
 
         model = await self._model_registry.get_model(name, version)
-
-        # Run middlewares
-        inference_middlewares(payload, model.settings)
-
-        # TODO: Make await optional for sync methods
-        prediction = await model.predict(payload)
+        prediction = await self._predict(model, payload)
 
         # Ensure ID matches
         prediction.id = payload.id
 
         return prediction
+
+    async def infer_bulk(
+        self, payloads: List[InferenceRequest], name: str, version: str = None
+    ) -> AsyncIterator[Tuple[int, Union[InferenceResponse, Exception]]]:
+        """
+        Runs a list of independent inference requests concurrently (so that
+        they can get batched together).
+        The returned iterator yields each response alongside the index of its
+        request, as soon as it's ready.
+        Errors get yielded in place of their response, so that a single failed
+        request doesn't stop the rest.
+        """
+        # NOTE: Checking the model upfront lets callers fail early if it
+        # doesn't exist, before they start waiting on any of the responses
+        await self._model_registry.get_model(name, version)
+        return self._infer_bulk(payloads, name, version)
+
+    async def _infer_bulk(
+        self, payloads: List[InferenceRequest], name: str, version: Optional[str]
+    ) -> AsyncIterator[Tuple[int, Union[InferenceResponse, Exception]]]:
+        async def _infer(idx: int, payload: InferenceRequest):
+            try:
+                return idx, await self.infer(payload, name, version)
+            except Exception as err:
+                return idx, err
+
+        tasks = [
+            asyncio.create_task(_infer(idx, payload))
+            for idx, payload in enumerate(payloads)
+        ]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                yield await next_completed
+        finally:
+            # If the consumer stops early, there is no one left waiting for
+            # the pending requests
+            for task in tasks:
+                task.cancel()
+
+    async def _predict(
+        self, model: MLModel, payload: InferenceRequest
+    ) -> InferenceResponse:
+        response_cache = self._get_response_cache(model)
+        if response_cache is None and not model.settings.coalesce_requests:
+            return await self._infer(model, payload)
+
+        key = get_request_key(model, payload)
+        if response_cache is not None:
+            # Cache hits skip adaptive batching and the inference pool
+            cached = response_cache.get(key)
+            if cached is not None:
+                return copy_response(cached)
+
+        if model.settings.coalesce_requests:
+            # Identical requests already in flight will share their prediction
+            prediction = await self._coalescer.coalesce(
+                key, partial(self._infer, model, payload)
+            )
+        else:
+            prediction = await self._infer(model, payload)
+
+        if response_cache is not None:
+            response_cache.put(key, copy_response(prediction))
+
+        return prediction
+
+    def _get_response_cache(self, model: MLModel) -> Optional[ResponseCache]:
+        model_settings = model.settings
+        if not model_settings.response_cache_size:
+            return None
+
+        response_cache = self._response_caches.get(model)
+        if response_cache is None:
+            response_cache = ResponseCache(
+                model_name=model.name,
+                model_version=model.version,
+                max_entries=model_settings.response_cache_size,
+                max_bytes=model_settings.response_cache_max_bytes,
+                ttl=model_settings.response_cache_ttl,
+            )
+            self._response_caches[model] = response_cache
+            response_cache_collector.add(response_cache)
+
+        return response_cache
+
+    async def _infer(
+        self, model: MLModel, payload: InferenceRequest
+    ) -> InferenceResponse:
+        # TODO: Make await optional for sync methods
+        return await model.predict(payload)
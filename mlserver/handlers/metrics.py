@@ -0,0 +1,75 @@
+from typing import Iterable
+from weakref import WeakSet
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+
+from ..metrics import _Collector
+from .cache import ResponseCache
+
+CacheHitsMetricName = "response_cache_hits"
+CacheMissesMetricName = "response_cache_misses"
+CacheEntriesMetricName = "response_cache_entries"
+CacheBytesMetricName = "response_cache_bytes"
+
+_Labels = ["model_name", "model_version"]
+
+
+class ResponseCacheCollector(_Collector):
+    """
+    Exposes the hits, misses and usage of the response cache of each model.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Caches will go away alongside their models
+        self._caches: WeakSet = WeakSet()
+
+    def add(self, cache: ResponseCache):
+        self._caches.add(cache)
+
+        try:
+            self.register()
+        except ValueError:
+            # The collector was already registered
+            pass
+
+    def _new_metrics(self):
+        return (
+            CounterMetricFamily(
+                CacheHitsMetricName,
+                "Number of requests served from the response cache",
+                labels=_Labels,
+            ),
+            CounterMetricFamily(
+                CacheMissesMetricName,
+                "Number of requests not found in the response cache",
+                labels=_Labels,
+            ),
+            GaugeMetricFamily(
+                CacheEntriesMetricName,
+                "Number of responses currently held in the response cache",
+                labels=_Labels,
+            ),
+            GaugeMetricFamily(
+                CacheBytesMetricName,
+                "Estimated size (in bytes) of the responses currently cached",
+                labels=_Labels,
+            ),
+        )
+
+    def collect(self) -> Iterable[Metric]:
+        hits, misses, entries, size_bytes = self._new_metrics()
+        for cache in list(self._caches):
+            labels = [cache.model_name, cache.model_version or ""]
+            hits.add_metric(labels, cache.hits)
+            misses.add_metric(labels, cache.misses)
+            entries.add_metric(labels, len(cache))
+            size_bytes.add_metric(labels, cache.size_bytes)
+
+        yield hits
+        yield misses
+        yield entries
+        yield size_bytes
+
+
+response_cache_collector = ResponseCacheCollector()
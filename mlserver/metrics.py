@@ -0,0 +1,31 @@
+from typing import Iterable, Optional, Tuple
+
+from prometheus_client.core import Metric
+from prometheus_client.registry import REGISTRY, CollectorRegistry
+
+
+class _Collector:
+    """
+    Base class for the Prometheus collectors exposed by MLServer.
+    Values are read on every scrape, so that the inference hot path doesn't
+    need to update any metric.
+    """
+
+    def __init__(self, registry: Optional[CollectorRegistry] = None):
+        self._registry = registry or REGISTRY
+
+    def _new_metrics(self) -> Tuple[Metric, ...]:
+        raise NotImplementedError()
+
+    def describe(self) -> Iterable[Metric]:
+        yield from self._new_metrics()
+
+    def register(self):
+        self._registry.register(self)
+
+    def unregister(self):
+        try:
+            self._registry.unregister(self)
+        except KeyError:
+            # The collector may have already been removed from the registry
+            pass
@@ -1,20 +1,36 @@
+from functools import wraps
 from typing import Callable, List
 
-#  from .codecs.middleware import codec_middleware
-from .settings import ModelSettings
-from .types import InferenceRequest
+from .codecs.middleware import codec_middleware
+from .model import MLModel
+from .types import InferenceRequest, InferenceResponse
 
-MiddlewareFunc = Callable[[InferenceRequest, ModelSettings], InferenceRequest]
-#  InferenceMiddlewares: List[MiddlewareFunc] = [codec_middleware]
-# NOTE: Remove codecs temporarily from middleware to reduce serialisation
-# overhead when sending payload to inference workers.
-InferenceMiddlewares: List[MiddlewareFunc] = []
+MiddlewareFunc = Callable[[InferenceRequest, MLModel], InferenceRequest]
+InferenceMiddlewares: List[MiddlewareFunc] = [codec_middleware]
 
 
 def inference_middlewares(
-    request: InferenceRequest, model_settings: ModelSettings
+    request: InferenceRequest, model: MLModel
 ) -> InferenceRequest:
     for middleware in InferenceMiddlewares:
-        request = middleware(request, model_settings)
+        request = middleware(request, model)
 
     return request
+
+
+def load_middlewares(model: MLModel):
+    """
+    Decorates the model's `predict()` method, so that middlewares only run
+    right before the model's own code.
+    This wrapper sits below any other one (e.g. to offload requests to the
+    inference pool, or to batch them together), which means that requests get
+    decoded by the inference workers, and never need to be serialised to be
+    sent across processes.
+    """
+    predict = model.predict
+
+    @wraps(predict)
+    async def _inner(payload: InferenceRequest) -> InferenceResponse:
+        return await predict(inference_middlewares(payload, model))
+
+    setattr(model, "predict", _inner)
@@ -1,16 +1,13 @@
-from typing import Any, Dict, Optional, List
+from typing import Any, Optional, List
 
 from .codecs import (
-    encode_response_output,
-    encode_inference_response,
-    decode_request_input,
-    decode_inference_request,
     has_decoded,
     get_decoded,
     InputCodecLike,
     RequestCodecLike,
 )
 from .codecs.errors import CodecNotFound
+from .codecs.plan import CodecPlan
 from .settings import ModelSettings
 from .types import (
     InferenceRequest,
@@ -26,20 +23,6 @@ from .types import (
 )
 
 
-def _generate_metadata_index(
-    metadata_tensors: Optional[List[MetadataTensor]],
-) -> Dict[str, MetadataTensor]:
-    metadata_index: Dict[str, MetadataTensor] = {}
-
-    if not metadata_tensors:
-        return metadata_index
-
-    for metadata_tensor in metadata_tensors:
-        metadata_index[metadata_tensor.name] = metadata_tensor
-
-    return metadata_index
-
-
 class MLModel:
     """
     Abstract class which serves as the main interface to interact with ML
@@ -48,10 +31,10 @@ class MLModel:
 
     def __init__(self, settings: ModelSettings):
         self._settings = settings
-        self._inputs_index: Dict[str, MetadataTensor] = {}
 
-        self._inputs_index = _generate_metadata_index(self._settings.inputs)
-        self._outputs_index = _generate_metadata_index(self._settings.outputs)
+        # NOTE: Codecs get resolved lazily, so that any codecs registered while
+        # loading the model can still be picked up
+        self._codec_plan: Optional[CodecPlan] = None
 
         self.ready = False
 
@@ -77,7 +60,7 @@ class MLModel:
     @inputs.setter
     def inputs(self, value: List[MetadataTensor]):
         self._settings.inputs = value
-        self._inputs_index = _generate_metadata_index(self._settings.inputs)
+        self._codec_plan = None
 
     @property
     def outputs(self) -> Optional[List[MetadataTensor]]:
@@ -86,14 +69,27 @@ class MLModel:
     @outputs.setter
     def outputs(self, value: List[MetadataTensor]):
         self._settings.outputs = value
-        self._outputs_index = _generate_metadata_index(self._settings.outputs)
+        self._codec_plan = None
+
+    @property
+    def codec_plan(self) -> CodecPlan:
+        """
+        Codecs of the model, resolved from its metadata.
+        These are shared by the codec middleware and the model's own
+        `decode()` / `encode()` helpers, and get resolved again whenever the
+        model's metadata changes.
+        """
+        if self._codec_plan is None or self._codec_plan.is_stale(self._settings):
+            self._codec_plan = CodecPlan(self._settings)
+
+        return self._codec_plan
 
     def decode(
         self,
         request_input: RequestInput,
         default_codec: Optional[InputCodecLike] = None,
     ) -> Any:
-        decode_request_input(request_input, self._inputs_index)
+        self.codec_plan.decode_request_input(request_input)
 
         if has_decoded(request_input):
             return get_decoded(request_input)
@@ -108,7 +104,7 @@ class MLModel:
         inference_request: InferenceRequest,
         default_codec: Optional[RequestCodecLike] = None,
     ) -> Any:
-        decode_inference_request(inference_request, self._settings, self._inputs_index)
+        self.codec_plan.decode_inference_request(inference_request)
 
         if has_decoded(inference_request):
             return get_decoded(inference_request)
@@ -123,7 +119,9 @@ class MLModel:
         payload: Any,
         default_codec: Optional[RequestCodecLike] = None,
     ) -> InferenceResponse:
-        inference_response = encode_inference_response(payload, self._settings)
+        inference_response = self.codec_plan.encode_inference_response(
+            payload, self.name, self.version
+        )
 
         if inference_response:
             return inference_response
@@ -140,8 +138,8 @@ class MLModel:
         request_output: RequestOutput,
         default_codec: Optional[InputCodecLike] = None,
     ) -> ResponseOutput:
-        response_output = encode_response_output(
-            payload, request_output, self._outputs_index
+        response_output = self.codec_plan.encode_response_output(
+            payload, request_output
         )
 
         if response_output:
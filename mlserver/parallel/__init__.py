@@ -0,0 +1,10 @@
+from .errors import InvalidParallelMethod, WorkerError, WorkerStopped
+from .pool import InferencePool, parallel
+
+__all__ = [
+    "InferencePool",
+    "InvalidParallelMethod",
+    "WorkerError",
+    "WorkerStopped",
+    "parallel",
+]
@@ -0,0 +1,249 @@
+import asyncio
+import pickle
+
+from asyncio import Future
+from multiprocessing import Pipe, Queue
+from multiprocessing.connection import Connection, wait
+from threading import Thread
+from typing import Dict, List, Optional, Tuple, Union
+
+from ..logging import logger
+from ..types import InferenceResponse
+from ..utils import generate_uuid
+
+from .messages import (
+    Message,
+    ModelRequestMessage,
+    ModelUpdateMessage,
+    ModelResponseMessage,
+    SerialisedResponse,
+)
+from .errors import WorkerError, WorkerStopped
+from .metrics import QueueSizeCollector
+from .shm import discard
+from .worker import Worker, END_OF_QUEUE
+from .zygote import ForkedWorker
+
+_ModelKey = Tuple[str, Optional[str]]
+
+
+def _discard_response(response: ModelResponseMessage):
+    # Responses are sent back through a shared memory segment which only gets
+    # freed once read, thus it needs to be freed for responses nobody waits
+    # for anymore
+    if isinstance(response.return_value, InferenceResponse):
+        discard(response.return_value)
+
+
+class Dispatcher:
+    """
+    The Dispatcher sends requests to the inference workers and matches their
+    responses back, using the message IDs.
+
+    Each request gets routed to the worker with the fewest requests in flight.
+    Optionally, ties can be broken in favour of the worker which last served
+    the same model version.
+    """
+
+    def __init__(
+        self,
+        workers: List[Union[Worker, ForkedWorker]],
+        model_affinity: bool = False,
+    ):
+        # NOTE: Workers are identified by their position in the pool, as the
+        # process behind each position may get replaced over time
+        self._workers = workers
+        self._async_responses: Dict[str, Future] = {}
+
+        self._in_flight = [0] * len(self._workers)
+        # Messages pending a response, indexed by the PID of the worker
+        # processing them
+        self._pending: Dict[int, Dict[str, Message]] = {}
+        self._offset = 0
+
+        self._model_affinity = model_affinity
+        self._affinity: Dict[_ModelKey, int] = {}
+
+        self._queue_size_collector = QueueSizeCollector(self.get_queue_sizes)
+
+        # Used to wake up the reader whenever it needs to stop, or to start
+        # listening to a new worker
+        self._wakeup_reader, self._wakeup_writer = Pipe(duplex=False)
+
+    def get_queue_sizes(self) -> Dict[int, int]:
+        return {
+            worker.pid: in_flight
+            for worker, in_flight in zip(self._workers, self._in_flight)
+        }
+
+    def _select_worker(self, request_message: ModelRequestMessage) -> int:
+        model_key = (request_message.model_name, request_message.model_version)
+        if self._model_affinity:
+            worker_idx = self._affinity.get(model_key)
+            if worker_idx is not None and self._in_flight[worker_idx] == min(
+                self._in_flight
+            ):
+                return worker_idx
+
+        # Start looking from a different worker each time, so that ties get
+        # spread evenly across the pool
+        num_workers = len(self._in_flight)
+        self._offset = (self._offset + 1) % num_workers
+        worker_idx = min(
+            ((self._offset + idx) % num_workers for idx in range(num_workers)),
+            key=self._in_flight.__getitem__,
+        )
+
+        if self._model_affinity:
+            self._affinity[model_key] = worker_idx
+
+        return worker_idx
+
+    def start(self):
+        self._queue_size_collector.register()
+
+        # Reading from the queues is a blocking operation, so we run it on a
+        # separate thread which hands over each response to the event loop
+        self._reader = Thread(target=self._read_responses, daemon=True)
+        self._reader.start()
+
+    def _read_responses(self):
+        while True:
+            # Waiting on the underlying connection of each queue lets us listen
+            # to every worker at once
+            queues: Dict[Connection, Queue] = {
+                worker.responses._reader: worker.responses  # type: ignore
+                for worker in self._workers
+            }
+            for ready in wait([self._wakeup_reader, *queues]):
+                if ready is self._wakeup_reader:
+                    if self._wakeup_reader.recv() is END_OF_QUEUE:
+                        return
+
+                    continue
+
+                # NOTE: Errors on a single response (e.g. coming from a dying
+                # worker) shouldn't stop the responses of every other request
+                try:
+                    self._hand_over(queues[ready].get())
+                except Exception:
+                    logger.exception("Couldn't read response from inference worker")
+
+    def _hand_over(self, serialised: SerialisedResponse):
+        try:
+            response = pickle.loads(serialised.data)
+        except Exception as e:
+            logger.exception(f"Couldn't read response for request {serialised.id}")
+            response = ModelResponseMessage(id=serialised.id, exception=WorkerError(e))
+
+        async_response = self._async_responses.get(response.id)
+        if async_response is None:
+            logger.warning(f"Received response for unknown request {response.id}")
+            _discard_response(response)
+            return
+
+        # NOTE: Requests may come from different event loops, so we need to
+        # make sure that we hand over the response to the right one
+        loop = async_response.get_loop()
+        loop.call_soon_threadsafe(self._process_response, async_response, response)
+
+    def _process_response(self, async_response: Future, response: ModelResponseMessage):
+        if async_response.done():
+            # The caller may have already given up on this response (e.g. if
+            # the request got cancelled)
+            _discard_response(response)
+            return
+
+        if response.exception is not None:
+            async_response.set_exception(response.exception)
+        else:
+            async_response.set_result(response)
+
+    async def dispatch_request(
+        self, request_message: ModelRequestMessage
+    ) -> ModelResponseMessage:
+        worker_idx = self._select_worker(request_message)
+        worker = self._workers[worker_idx]
+
+        self._in_flight[worker_idx] += 1
+        try:
+            return await self._dispatch(worker, request_message)
+        finally:
+            self._in_flight[worker_idx] -= 1
+
+    async def dispatch_update(
+        self, model_update: ModelUpdateMessage
+    ) -> List[ModelResponseMessage]:
+        # Model updates need to reach every worker, so each one gets its own
+        # copy of the message (with its own ID)
+        return await asyncio.gather(
+            *[
+                self._dispatch(
+                    worker, model_update.copy(update={"id": generate_uuid()})
+                )
+                for worker in self._workers
+            ]
+        )
+
+    async def _dispatch(
+        self, worker: Union[Worker, ForkedWorker], message: Message
+    ) -> ModelResponseMessage:
+        loop = asyncio.get_running_loop()
+        async_response = loop.create_future()
+        self._async_responses[message.id] = async_response
+
+        pending = self._pending.setdefault(worker.pid, {})
+        pending[message.id] = message
+
+        worker.send(message)
+        try:
+            return await async_response
+        except asyncio.CancelledError:
+            if (
+                async_response.done()
+                and not async_response.cancelled()
+                and async_response.exception() is None
+            ):
+                # The response arrived right before the caller gave up on it
+                _discard_response(async_response.result())
+
+            raise
+        finally:
+            self._async_responses.pop(message.id, None)
+            pending.pop(message.id, None)
+            if not pending:
+                self._pending.pop(worker.pid, None)
+
+    def fail_worker(self, worker_pid: int, reason: str):
+        """
+        Resolves every message pending on a worker which is no longer around.
+        """
+        # The worker's replacement may come with its own responses queue
+        self._wakeup_writer.send(True)
+
+        pending = self._pending.pop(worker_pid, {})
+        for message_id, message in list(pending.items()):
+            async_response = self._async_responses.get(message_id)
+            if async_response is None:
+                continue
+
+            if isinstance(message, ModelUpdateMessage):
+                # The worker's replacement will already be up to date with the
+                # latest model updates
+                response = ModelResponseMessage(id=message_id)
+            else:
+                response = ModelResponseMessage(
+                    id=message_id, exception=WorkerStopped(worker_pid, reason)
+                )
+
+            loop = async_response.get_loop()
+            loop.call_soon_threadsafe(self._process_response, async_response, response)
+
+    def stop(self):
+        self._queue_size_collector.unregister()
+        self._wakeup_writer.send(END_OF_QUEUE)
+        for async_response in self._async_responses.values():
+            if not async_response.done():
+                async_response.cancel()
+
+        self._async_responses.clear()
@@ -0,0 +1,46 @@
+from typing import Optional
+from fastapi import status
+
+from ..errors import MLServerError
+
+
+class InvalidParallelMethod(MLServerError):
+    def __init__(self, method_name: str, reason: Optional[str] = None):
+        msg = f"Method {method_name} can't be parallelised"
+        if reason:
+            msg += f": {reason}"
+
+        super().__init__(msg)
+
+
+class WorkerError(MLServerError):
+    """
+    Raised in the main process in place of errors which occurred within the
+    inference workers, but couldn't be sent back as they were.
+    """
+
+    def __init__(self, exc: BaseException):
+        msg = f"Error in inference worker: {type(exc).__name__}: {exc}"
+        super().__init__(msg)
+
+    @classmethod
+    def _from_message(cls, msg: str) -> "WorkerError":
+        err = cls.__new__(cls)
+        MLServerError.__init__(err, msg)
+        return err
+
+    def __reduce__(self):
+        # NOTE: The original exception may not be picklable itself, so errors
+        # get rebuilt from their message when sent across processes
+        return (self._from_message, (str(self),))
+
+
+class WorkerStopped(MLServerError):
+    """
+    Raised for requests which were in flight on an inference worker when it
+    died or got restarted.
+    """
+
+    def __init__(self, pid: int, reason: str):
+        msg = f"Inference worker with PID {pid} {reason}"
+        super().__init__(msg, status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -0,0 +1,67 @@
+from enum import Enum
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from pydantic import BaseModel, Field
+
+from ..settings import ModelSettings
+from ..utils import generate_uuid
+
+
+class ModelUpdateType(Enum):
+    Load = 1
+    Unload = 2
+
+
+class Message(BaseModel):
+    class Config:
+        arbitrary_types_allowed = True
+
+    id: str = Field(default_factory=generate_uuid)
+
+
+class ModelRequestMessage(Message):
+    """
+    Request to run one of the methods of a model loaded in a worker.
+    """
+
+    model_name: str
+    model_version: Optional[str] = None
+    method_name: str
+    method_args: List[Any] = []
+    method_kwargs: Dict[str, Any] = {}
+
+
+class ModelUpdateMessage(Message):
+    """
+    Request to load or unload a model in a worker.
+    """
+
+    update_type: ModelUpdateType
+    model_settings: ModelSettings
+
+
+class WorkerForkMessage(Message):
+    """
+    Request for the zygote to fork a new worker, which will pull requests from
+    the queue at the given position of the pool.
+    """
+
+    worker_idx: int
+
+
+class ModelResponseMessage(Message):
+    """
+    Response sent back by a worker, matched to its request by ID.
+    """
+
+    return_value: Optional[Any] = None
+    exception: Optional[Exception] = None
+
+
+class SerialisedResponse(NamedTuple):
+    """
+    Response already pickled by the worker, alongside its ID.
+    """
+
+    id: str
+    data: bytes
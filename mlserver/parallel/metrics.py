@@ -0,0 +1,70 @@
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from prometheus_client.registry import CollectorRegistry
+
+from ..metrics import _Collector
+
+QueueSizeMetricName = "parallel_request_queue"
+WorkerRestartsMetricName = "parallel_worker_restarts"
+
+
+class QueueSizeCollector(_Collector):
+    """
+    Exposes the number of in-flight requests on each inference worker.
+    """
+
+    def __init__(
+        self,
+        get_queue_sizes: Callable[[], Dict[int, int]],
+        registry: Optional[CollectorRegistry] = None,
+    ):
+        super().__init__(registry)
+        self._get_queue_sizes = get_queue_sizes
+
+    def _new_metrics(self) -> Tuple[GaugeMetricFamily]:
+        return (
+            GaugeMetricFamily(
+                QueueSizeMetricName,
+                "Number of requests in flight on each inference worker",
+                labels=["worker_pid"],
+            ),
+        )
+
+    def collect(self) -> Iterable[Metric]:
+        (metric,) = self._new_metrics()
+        for worker_pid, queue_size in self._get_queue_sizes().items():
+            metric.add_metric([str(worker_pid)], queue_size)
+
+        yield metric
+
+
+class WorkerRestartsCollector(_Collector):
+    """
+    Exposes the number of inference workers which had to be restarted, by the
+    reason why they had to be restarted.
+    """
+
+    def __init__(
+        self,
+        get_restarts: Callable[[], Dict[str, int]],
+        registry: Optional[CollectorRegistry] = None,
+    ):
+        super().__init__(registry)
+        self._get_restarts = get_restarts
+
+    def _new_metrics(self) -> Tuple[CounterMetricFamily]:
+        return (
+            CounterMetricFamily(
+                WorkerRestartsMetricName,
+                "Number of inference workers restarted after dying or hanging",
+                labels=["reason"],
+            ),
+        )
+
+    def collect(self) -> Iterable[Metric]:
+        (metric,) = self._new_metrics()
+        for reason, restarts in self._get_restarts().items():
+            metric.add_metric([reason], restarts)
+
+        yield metric
@@ -0,0 +1,327 @@
+import asyncio
+
+from functools import wraps
+from multiprocessing import Process
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+from typing import Any, Coroutine, Callable, Dict, List, Optional, Tuple, Union
+
+from starlette.requests import Request
+
+from ..handlers.custom import get_custom_handlers
+from ..model import MLModel
+from ..settings import Settings
+from ..types import InferenceRequest, InferenceResponse
+from ..utils import get_wrapped_method
+from ..logging import logger
+
+from .errors import InvalidParallelMethod
+from .messages import ModelRequestMessage, ModelUpdateMessage, ModelUpdateType
+from .dispatcher import Dispatcher
+from .worker import Worker
+from .zygote import Zygote, ForkedWorker
+from .supervisor import Supervisor
+from .requests import serialise_request
+from .shm import to_shared_memory, from_shared_memory, release
+
+_InferencePoolAttr = "__inference_pool__"
+
+# Time (in seconds) to wait for workers to finish their in-flight requests
+# before stopping them forcefully
+_WorkerStopTimeout = 5
+
+_ModelKey = Tuple[str, Optional[str]]
+
+
+def _get_key(model: MLModel) -> _ModelKey:
+    return model.name, model.version
+
+
+def _is_parallel(model: MLModel) -> bool:
+    parallel_workers = model.settings.parallel_workers
+    if parallel_workers is None:
+        return True
+
+    if parallel_workers > 0:
+        logger.warning(
+            f"The `parallel_workers` field of model {model.name} is deprecated "
+            "and will be ignored. "
+            "The number of inference workers is now shared across all models, "
+            "and can be set through the server-wide `parallel_workers` setting."
+        )
+        return True
+
+    # When parallel workers is set to 0, disable parallel inference
+    return False
+
+
+def _get_parallel_methods(model: MLModel) -> List[str]:
+    # Custom handlers can be as heavy as `predict()` (e.g. explainers), so
+    # they also get offloaded to the workers
+    custom_handlers = get_custom_handlers(model)
+    return ["predict", "metadata"] + [
+        handler_method.__name__ for _, handler_method in custom_handlers
+    ]
+
+
+async def _detach_arg(arg: Any, segments: List[SharedMemory]) -> Any:
+    """
+    Converts an argument into something which can be cheaply sent to the
+    workers.
+    """
+    if isinstance(arg, InferenceRequest):
+        # Large tensors get sent through shared memory, so that only their
+        # descriptors need to be pickled
+        arg, segment = to_shared_memory(arg)
+        if segment is not None:
+            segments.append(segment)
+    elif isinstance(arg, Request):
+        # Requests are bound to their connection, so they need to get read
+        # upfront
+        arg = await serialise_request(arg)
+
+    return arg
+
+
+class InferencePool:
+    """
+    The InferencePool class represents a pool of workers where we can run
+    inference on.
+
+    Under the hood, it's responsible for managing a pool of multiprocessing
+    workers, shared across all the models loaded in the server.
+    This approach lets MLServer work around the GIL to make sure that inference
+    can occur in parallel across multiple models or instances of a model.
+    """
+
+    def __init__(self, settings: Settings):
+        self._settings = settings
+        self._models: Dict[_ModelKey, MLModel] = {}
+
+        self._zygote: Optional[Zygote] = None
+        self._workers: List[Union[Worker, ForkedWorker]] = []
+        if settings.parallel_fork_workers:
+            self._zygote = Zygote(settings.parallel_workers)
+            self._zygote.start()
+            for worker_idx in range(settings.parallel_workers):
+                self._workers.append(self._zygote.fork_worker(worker_idx))
+        else:
+            for _ in range(settings.parallel_workers):
+                worker = Worker()
+                worker.start()
+                self._workers.append(worker)
+
+        self._dispatcher = Dispatcher(
+            self._workers, model_affinity=settings.parallel_model_affinity
+        )
+        self._dispatcher.start()
+
+        # Guards the replacement of workers, which can happen both when
+        # re-forking them and when restarting them after a failure
+        self._replace_lock = Lock()
+        self._supervisor = Supervisor(
+            self._workers,
+            self._restart_worker,
+            worker_timeout=settings.parallel_worker_timeout,
+        )
+        self._supervisor.start()
+
+    async def load_model(self, model: MLModel):
+        if not _is_parallel(model):
+            return
+
+        # NOTE: Workers restarted while the model gets loaded will load it
+        # from here
+        model_key = _get_key(model)
+        self._models[model_key] = model
+
+        # Load the model in every worker upfront, so that the first requests
+        # don't have to pay the loading cost
+        logger.info(f"Loading model {model.name} in inference pool workers")
+        try:
+            if self._zygote is not None:
+                # Load the model only once in the zygote, and then replace the
+                # workers with fresh forks, which will share the model's memory
+                await self._zygote.load_model(model.settings)
+                await self._refork_workers()
+            else:
+                load_message = ModelUpdateMessage(
+                    update_type=ModelUpdateType.Load, model_settings=model.settings
+                )
+                await self._dispatcher.dispatch_update(load_message)
+        except Exception:
+            if self._models.get(model_key) is model:
+                del self._models[model_key]
+
+            raise
+
+        # Requests only get routed to the workers once every one of them has
+        # the model loaded
+        setattr(model, _InferencePoolAttr, self)
+        for method_name in _get_parallel_methods(model):
+            setattr(model, method_name, parallel(getattr(model, method_name)))
+
+    async def _refork_workers(self):
+        # Workers get replaced one at a time, so that the rest of the pool can
+        # keep serving requests in the meantime.
+        # Any request already queued for a worker will get picked up by its
+        # replacement.
+        loop = asyncio.get_running_loop()
+        for worker_idx in range(len(self._workers)):
+            await loop.run_in_executor(None, self._refork_worker, worker_idx)
+
+    def _refork_worker(self, worker_idx: int):
+        with self._replace_lock:
+            self._workers[worker_idx].stop()
+            new_worker = self._zygote.fork_worker(worker_idx)  # type: ignore
+            self._workers[worker_idx] = new_worker
+
+        if new_worker.killed_pid is not None:
+            # Requests in flight on the previous worker won't get a response
+            self._dispatcher.fail_worker(new_worker.killed_pid, "didn't stop on time")
+
+    def _restart_worker(
+        self, worker_idx: int, worker: Union[Worker, ForkedWorker], reason: str
+    ) -> bool:
+        with self._replace_lock:
+            if self._workers[worker_idx] is not worker:
+                # The worker has already been replaced in the meantime (e.g.
+                # when re-forking the workers)
+                return False
+
+            logger.warning(
+                f"Inference worker with PID {worker.pid} {reason}. Restarting it."
+            )
+            worker.kill()
+            if self._zygote is not None:
+                new_worker = self._zygote.fork_worker(worker_idx)
+            else:
+                worker.join()
+                model_settings = [model.settings for model in self._models.values()]
+                new_worker = Worker(model_settings=model_settings)
+                new_worker.start()
+
+            self._workers[worker_idx] = new_worker
+
+        # Only fail the requests which were in flight on the failed worker
+        # once its replacement is in place, so that they can get retried
+        self._dispatcher.fail_worker(worker.pid, reason)
+        return True
+
+    async def unload_model(self, model: MLModel):
+        if not hasattr(model, _InferencePoolAttr):
+            return
+
+        delattr(model, _InferencePoolAttr)
+
+        model_key = _get_key(model)
+        if self._models.get(model_key) is not model:
+            # If the model has since been replaced by a new instance with the
+            # same name and version (e.g. when reloading it), we don't want to
+            # unload the new one from the workers
+            return
+
+        del self._models[model_key]
+        unload_message = ModelUpdateMessage(
+            update_type=ModelUpdateType.Unload, model_settings=model.settings
+        )
+        await self._dispatcher.dispatch_update(unload_message)
+
+        if self._zygote is not None:
+            await self._zygote.unload_model(model.settings)
+
+    async def predict(
+        self, model: MLModel, payload: InferenceRequest
+    ) -> InferenceResponse:
+        return await self.call(model, "predict", payload)
+
+    async def call(self, model: MLModel, method_name: str, *args, **kwargs) -> Any:
+        """
+        Runs one of the model's methods within the inference workers.
+        """
+        segments: List[SharedMemory] = []
+        try:
+            request_message = ModelRequestMessage(
+                model_name=model.name,
+                model_version=model.version,
+                method_name=method_name,
+                method_args=[await _detach_arg(arg, segments) for arg in args],
+                method_kwargs={
+                    key: await _detach_arg(arg, segments) for key, arg in kwargs.items()
+                },
+            )
+            response_message = await self._dispatcher.dispatch_request(request_message)
+        finally:
+            for segment in segments:
+                release(segment, unlink=True)
+
+        return_value = response_message.return_value
+        if isinstance(return_value, InferenceResponse):
+            return_value, response_segment = from_shared_memory(return_value, copy=True)
+            release(response_segment, unlink=True)
+
+        return return_value
+
+    async def close(self):
+        # Stop the supervisor first, so that it doesn't restart the workers as
+        # they stop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._supervisor.stop)
+
+        for worker in self._workers:
+            worker.stop()
+
+        # Forked workers are children of the zygote, which will be the one
+        # waiting for them to finish
+        processes: List[Process] = self._workers  # type: ignore
+        if self._zygote is not None:
+            self._zygote.stop()
+            processes = [self._zygote]
+
+        await asyncio.gather(
+            *[
+                loop.run_in_executor(None, self._join_process, process)
+                for process in processes
+            ]
+        )
+
+        self._dispatcher.stop()
+        self._workers.clear()
+        self._models.clear()
+
+    def _join_process(self, process: Process):
+        process.join(_WorkerStopTimeout)
+        if process.is_alive():
+            logger.warning(
+                f"Inference process with PID {process.pid} didn't stop on time. "
+                "Terminating it."
+            )
+            process.terminate()
+            process.join()
+
+
+def parallel(f: Callable[..., Coroutine[Any, Any, Any]]):
+    """
+    Decorator to attach to model's methods so that they run in parallel.
+    By default, this will get attached to every model's `predict()` and
+    `metadata()` methods, as well as to its custom handlers.
+    """
+
+    @wraps(f)
+    async def _inner(*args, **kwargs) -> Any:
+        wrapped_f = get_wrapped_method(f)
+        if not hasattr(wrapped_f, "__self__"):
+            raise InvalidParallelMethod(
+                wrapped_f.__name__, reason="method is not bound"
+            )
+
+        model = getattr(wrapped_f, "__self__")
+        if not hasattr(model, _InferencePoolAttr):
+            raise InvalidParallelMethod(
+                wrapped_f.__name__, reason="inference pool has not been loaded"
+            )
+
+        pool = getattr(model, _InferencePoolAttr)
+        return await pool.call(model, wrapped_f.__name__, *args, **kwargs)
+
+    return _inner
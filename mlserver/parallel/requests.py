@@ -0,0 +1,46 @@
+from typing import Any, Dict
+
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.types import Message
+
+# Subset of the ASGI scope which can be sent across processes (i.e. leaving
+# out things like the app or the router)
+_ScopeKeys = [
+    "type",
+    "asgi",
+    "http_version",
+    "server",
+    "client",
+    "scheme",
+    "method",
+    "root_path",
+    "path",
+    "raw_path",
+    "query_string",
+    "headers",
+    "path_params",
+]
+
+
+class SerialisedRequest(BaseModel):
+    """
+    Picklable copy of a Starlette request (e.g. the ones received by custom
+    handlers), which will get rebuilt within the inference workers.
+    """
+
+    scope: Dict[str, Any]
+    body: bytes
+
+
+async def serialise_request(request: Request) -> SerialisedRequest:
+    scope = {key: request.scope[key] for key in _ScopeKeys if key in request.scope}
+    body = await request.body()
+    return SerialisedRequest(scope=scope, body=body)
+
+
+def deserialise_request(serialised: SerialisedRequest) -> Request:
+    async def _receive() -> Message:
+        return {"type": "http.request", "body": serialised.body, "more_body": False}
+
+    return Request(serialised.scope, _receive)
@@ -0,0 +1,200 @@
+import numpy as np
+
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Tuple, TypeVar, Union
+
+from pydantic import BaseModel
+
+from ..codecs.numpy import to_dtype
+from ..types import (
+    InferenceRequest,
+    InferenceResponse,
+    RequestInput,
+    ResponseOutput,
+    TensorData,
+)
+
+# Below this size (in bytes), pickling the tensors is cheaper than allocating a
+# shared memory segment for them
+SharedMemoryThreshold = 64 * 1024
+
+# Offsets within a segment are aligned, so that the NumPy views built on the
+# other side are aligned as well
+_Alignment = 64
+
+_Tensor = Union[RequestInput, ResponseOutput]
+_Payload = TypeVar("_Payload", InferenceRequest, InferenceResponse)
+
+
+class SharedTensor(BaseModel):
+    """
+    Descriptor of a tensor whose contents live in a shared memory segment.
+    This is the only thing that gets pickled when sending the tensor across
+    processes.
+    """
+
+    segment: str
+    dtype: str
+    shape: List[int]
+    offset: int
+
+
+def _get_tensors(payload: Union[InferenceRequest, InferenceResponse]) -> List:
+    if isinstance(payload, InferenceRequest):
+        return payload.inputs
+
+    return payload.outputs
+
+
+def _with_tensors(payload: _Payload, tensors: List[_Tensor]) -> _Payload:
+    # NOTE: Shallow copies are enough here, as we only swap the `data` field
+    # of each tensor, leaving the original payload untouched
+    if isinstance(payload, InferenceRequest):
+        return payload.copy(update={"inputs": tensors})
+
+    return payload.copy(update={"outputs": tensors})
+
+
+def _to_array(tensor: _Tensor) -> Optional[np.ndarray]:
+    if tensor.datatype == "BYTES":
+        # Variable-length payloads don't have a fixed layout, so we just leave
+        # them to be pickled
+        return None
+
+    data = getattr(tensor.data, "__root__", tensor.data)
+    if isinstance(data, SharedTensor):
+        return None
+
+    try:
+        dtype = to_dtype(tensor)
+        return np.ascontiguousarray(data, dtype=dtype)
+    except (KeyError, TypeError, ValueError):
+        # If the payload is malformed, let it go through the regular path so
+        # that the model can raise the relevant error
+        return None
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _Alignment) * _Alignment
+
+
+def to_shared_memory(payload: _Payload) -> Tuple[_Payload, Optional[SharedMemory]]:
+    """
+    Copy the numeric tensors of a request or response into a single shared
+    memory segment, returning a copy of the payload where each tensor only
+    holds a `SharedTensor` descriptor.
+    The caller becomes responsible for releasing the returned segment.
+    """
+    tensors = _get_tensors(payload)
+    arrays = [_to_array(tensor) for tensor in tensors]
+
+    offsets = []
+    size = 0
+    for arr in arrays:
+        offsets.append(size)
+        if arr is not None:
+            size = _aligned(size + arr.nbytes)
+
+    if size < SharedMemoryThreshold:
+        return payload, None
+
+    segment = SharedMemory(create=True, size=size)
+    shared_tensors = []
+    for tensor, arr, offset in zip(tensors, arrays, offsets):
+        if arr is None:
+            shared_tensors.append(tensor)
+            continue
+
+        view: np.ndarray = np.ndarray(
+            arr.shape, dtype=arr.dtype, buffer=segment.buf, offset=offset
+        )
+        view[...] = arr
+        del view
+
+        shared_tensor = SharedTensor(
+            segment=segment.name,
+            dtype=arr.dtype.str,
+            shape=list(arr.shape),
+            offset=offset,
+        )
+        data = TensorData.construct(__root__=shared_tensor)
+        shared_tensors.append(tensor.copy(update={"data": data}))
+
+    return _with_tensors(payload, shared_tensors), segment
+
+
+def from_shared_memory(
+    payload: _Payload, copy: bool = False
+) -> Tuple[_Payload, Optional[SharedMemory]]:
+    """
+    Rebuild the tensors of a payload sent through `to_shared_memory` as NumPy
+    arrays.
+    By default, these will be views over the shared memory segment (i.e.
+    without any copy), thus the segment needs to be kept open for as long as
+    they are in use.
+    Otherwise, if `copy` is set, the tensors will be copied out into their
+    own arrays, which means that the segment can be released straight away.
+    """
+    tensors = _get_tensors(payload)
+    segment = None
+    attached_tensors = []
+    for tensor in tensors:
+        shared_tensor = getattr(tensor.data, "__root__", None)
+        if not isinstance(shared_tensor, SharedTensor):
+            attached_tensors.append(tensor)
+            continue
+
+        if segment is None:
+            segment = SharedMemory(name=shared_tensor.segment)
+
+        view: np.ndarray = np.ndarray(
+            shared_tensor.shape,
+            dtype=np.dtype(shared_tensor.dtype),
+            buffer=segment.buf,
+            offset=shared_tensor.offset,
+        )
+        data = TensorData.construct(__root__=np.array(view) if copy else view)
+        attached_tensors.append(tensor.copy(update={"data": data}))
+        del view
+
+    return _with_tensors(payload, attached_tensors), segment
+
+
+def release(segment: Optional[SharedMemory], unlink: bool = False):
+    """
+    Close our handle to a shared memory segment and, optionally, free it.
+    """
+    if segment is None:
+        return
+
+    try:
+        segment.close()
+    except BufferError:
+        # There are still views pointing to the segment (e.g. held by the
+        # model). The mapping will get closed once these get garbage
+        # collected.
+        pass
+
+    if unlink:
+        segment.unlink()
+
+
+def discard(payload: Union[InferenceRequest, InferenceResponse]):
+    """
+    Free the shared memory segment behind a payload sent through
+    `to_shared_memory`, which won't get read anymore (e.g. if its request got
+    cancelled in the meantime).
+    """
+    for tensor in _get_tensors(payload):
+        shared_tensor = getattr(tensor.data, "__root__", None)
+        if not isinstance(shared_tensor, SharedTensor):
+            continue
+
+        # NOTE: Every tensor of a payload lives in the same segment
+        try:
+            segment = SharedMemory(name=shared_tensor.segment)
+        except FileNotFoundError:
+            return
+
+        release(segment, unlink=True)
+        return
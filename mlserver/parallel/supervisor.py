@@ -0,0 +1,93 @@
+import time
+
+from threading import Event, Thread
+from typing import Callable, Dict, List, Optional, Union
+
+from ..logging import logger
+
+from .metrics import WorkerRestartsCollector
+from .worker import Worker
+from .zygote import ForkedWorker
+
+# Interval (in seconds) between health checks of the inference workers
+_HealthCheckInterval = 1.0
+
+WorkerDied = "died"
+WorkerHung = "hung"
+
+# Callback used to restart a failed worker, returning whether it restarted it
+OnWorkerFailure = Callable[[int, Union[Worker, ForkedWorker], str], bool]
+
+
+class Supervisor:
+    """
+    The Supervisor keeps an eye on the inference workers, and lets the pool
+    know whenever any of them dies, or stops responding for longer than the
+    configured timeout.
+    """
+
+    def __init__(
+        self,
+        workers: List[Union[Worker, ForkedWorker]],
+        on_worker_failure: OnWorkerFailure,
+        worker_timeout: Optional[float] = None,
+    ):
+        self._workers = workers
+        self._on_worker_failure = on_worker_failure
+        self._worker_timeout = worker_timeout
+
+        self._restarts: Dict[str, int] = {WorkerDied: 0, WorkerHung: 0}
+        self._restarts_collector = WorkerRestartsCollector(self.get_restarts)
+        self._stopped = Event()
+
+    def get_restarts(self) -> Dict[str, int]:
+        return dict(self._restarts)
+
+    def start(self):
+        self._restarts_collector.register()
+
+        # Health checks only need to look at the workers' state, so they can
+        # run on a separate thread without blocking the event loop
+        self._checker = Thread(target=self._check_workers, daemon=True)
+        self._checker.start()
+
+    def _check_workers(self):
+        while not self._stopped.wait(_HealthCheckInterval):
+            for worker_idx, worker in enumerate(self._workers):
+                reason = self._check_worker(worker)
+                if reason is None:
+                    continue
+
+                if self._stopped.is_set():
+                    # The pool may be shutting down the workers
+                    return
+
+                try:
+                    if self._on_worker_failure(worker_idx, worker, reason):
+                        self._restarts[reason] += 1
+                except Exception:
+                    logger.exception(
+                        f"Couldn't restart inference worker with PID {worker.pid}"
+                    )
+
+    def _check_worker(self, worker: Union[Worker, ForkedWorker]) -> Optional[str]:
+        if not worker.is_alive():
+            return WorkerDied
+
+        if self._worker_timeout is None:
+            return None
+
+        last_heartbeat = worker.heartbeat.value
+        if not last_heartbeat:
+            # Worker is still starting up
+            return None
+
+        if time.monotonic() - last_heartbeat > self._worker_timeout:
+            return WorkerHung
+
+        return None
+
+    def stop(self):
+        self._stopped.set()
+        self._checker.join()
+        self._restarts_collector.unregister()
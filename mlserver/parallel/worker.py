@@ -0,0 +1,274 @@
+import os
+import time
+import pickle
+import signal
+import asyncio
+import multiprocessing as mp
+
+from asyncio import Task
+from multiprocessing import Queue
+from ctypes import c_double
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty
+from threading import Thread
+from typing import Any, List, Optional, Set
+
+from ..registry import MultiModelRegistry
+from ..settings import ModelSettings
+from ..logging import logger
+from ..types import InferenceRequest, InferenceResponse
+
+from .errors import WorkerError
+from .messages import (
+    Message,
+    ModelRequestMessage,
+    ModelUpdateMessage,
+    ModelUpdateType,
+    ModelResponseMessage,
+    SerialisedResponse,
+)
+from .requests import SerialisedRequest, deserialise_request
+from .shm import to_shared_memory, from_shared_memory, release
+
+# Use 'spawn' instead of 'fork' to ensure that models are loaded in a
+# clean environment (e.g. to avoid issues like
+# https://github.com/tensorflow/tensorflow/issues/8220)
+_ctx = mp.get_context("spawn")
+
+# Sentinel value used to signal the end of a queue
+END_OF_QUEUE = None
+
+# Interval (in seconds) used by workers to check whether their parent process
+# is still around while waiting for new requests
+_ParentCheckInterval = 1.0
+
+Heartbeat = c_double
+
+# Interval (in seconds) at which workers will report that their event loop is
+# still responsive
+_HeartbeatInterval = 1.0
+
+
+def _attach_arg(arg: Any, segments: List[SharedMemory]) -> Any:
+    """
+    Rebuilds an argument sent by the main process.
+    """
+    if isinstance(arg, InferenceRequest):
+        arg, segment = from_shared_memory(arg)
+        if segment is not None:
+            segments.append(segment)
+    elif isinstance(arg, SerialisedRequest):
+        arg = deserialise_request(arg)
+
+    return arg
+
+
+def new_heartbeat() -> Heartbeat:
+    """
+    Returns a value shared across processes, which workers will update with
+    the time of their last heartbeat.
+    A value of 0 means that the worker hasn't finished starting up yet.
+    """
+    # NOTE: The value doesn't need a lock, as only its worker writes to it.
+    # Besides, a worker killed while holding the lock would never release it.
+    return _ctx.Value("d", 0.0, lock=False)
+
+
+def _ensure_picklable(exc: Exception) -> Exception:
+    """
+    Not every exception can be sent back across processes (e.g. if they hold
+    references to unpicklable objects or have a custom constructor).
+    In those cases, we just send a generic error with its details.
+    """
+    try:
+        pickle.loads(pickle.dumps(exc))
+        return exc
+    except Exception:
+        return WorkerError(exc)
+
+
+def _serialise_response(response: ModelResponseMessage) -> SerialisedResponse:
+    """
+    Responses get pickled by the worker itself, as the queue's feeder thread
+    would just log any errors and leave the caller waiting forever.
+    That way, these errors can get sent back instead.
+    """
+    try:
+        data = pickle.dumps(response, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        error = ModelResponseMessage(id=response.id, exception=WorkerError(e))
+        data = pickle.dumps(error, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return SerialisedResponse(id=response.id, data=data)
+
+
+async def apply_model_update(
+    model_registry: MultiModelRegistry, update: ModelUpdateMessage
+):
+    model_settings = update.model_settings
+    if update.update_type == ModelUpdateType.Load:
+        await model_registry.load(model_settings)
+    elif update.update_type == ModelUpdateType.Unload:
+        version = None
+        if model_settings.parameters:
+            version = model_settings.parameters.version
+        await model_registry.unload_version(model_settings.name, version)
+
+
+class Worker(_ctx.Process):  # type: ignore
+    """
+    Long-lived inference worker.
+
+    Each worker runs its own event loop, where it hosts its own copy of the
+    models, and pulls requests from its own queue.
+    Requests are processed concurrently as they come in, and responses get
+    sent back through the worker's own responses queue, where they will get
+    matched to their requests by ID.
+    """
+
+    def __init__(
+        self,
+        requests: Optional[Queue] = None,
+        responses: Optional[Queue] = None,
+        heartbeat: Optional[Heartbeat] = None,
+        model_settings: List[ModelSettings] = [],
+    ):
+        # NOTE: Mark workers as daemon, so that they get stopped alongside
+        # the main process
+        super().__init__(daemon=True)
+        self._requests: Queue = _ctx.Queue() if requests is None else requests
+        # NOTE: Responses aren't shared with other workers, as a worker killed
+        # while writing into a queue would leave it locked
+        self.responses: Queue = _ctx.Queue() if responses is None else responses
+        self.heartbeat = new_heartbeat() if heartbeat is None else heartbeat
+        self._initial_model_settings = model_settings
+
+    def send(self, message: object):
+        self._requests.put(message)
+
+    def stop(self):
+        self._requests.put(END_OF_QUEUE)
+
+    def run(self, model_registry: Optional[MultiModelRegistry] = None):
+        # Let the main process be the one handling interruptions
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        asyncio.run(self.coro_run(model_registry))
+
+    async def coro_run(self, model_registry: Optional[MultiModelRegistry] = None):
+        # Workers forked from a zygote inherit its already loaded models
+        if model_registry is None:
+            model_registry = MultiModelRegistry()
+
+        self._model_registry = model_registry
+        self._tasks: Set[Task] = set()
+
+        # Workers replacing a failed one need to catch up with the models
+        # loaded at the time
+        for model_settings in self._initial_model_settings:
+            try:
+                await self._model_registry.load(model_settings)
+            except Exception:
+                logger.exception(f"Couldn't load model {model_settings.name}")
+
+        loop = asyncio.get_running_loop()
+        self._stopped = loop.create_future()
+        self._beat(loop)
+
+        # Reading from the queue is a blocking operation, so it happens on a
+        # separate thread which hands over each message to the event loop
+        reader = Thread(target=self._read_requests, args=(loop,), daemon=True)
+        reader.start()
+
+        await self._stopped
+        if self._tasks:
+            await asyncio.wait(self._tasks)
+
+    def _read_requests(self, loop: asyncio.AbstractEventLoop):
+        parent_pid = os.getppid()
+        while True:
+            try:
+                message = self._requests.get(timeout=_ParentCheckInterval)
+            except Empty:
+                # If our parent has gone away, there won't be any more
+                # requests coming in
+                if os.getppid() == parent_pid:
+                    continue
+
+                message = END_OF_QUEUE
+
+            if message is END_OF_QUEUE:
+                loop.call_soon_threadsafe(self._stop)
+                return
+
+            loop.call_soon_threadsafe(self._schedule, message)
+
+    def _beat(self, loop: asyncio.AbstractEventLoop):
+        self.heartbeat.value = time.monotonic()
+        loop.call_later(_HeartbeatInterval, self._beat, loop)
+
+    def _stop(self):
+        if not self._stopped.done():
+            self._stopped.set_result(None)
+
+    def _schedule(self, message: Message):
+        if isinstance(message, ModelUpdateMessage):
+            task = asyncio.create_task(self._process_model_update(message))
+        else:
+            task = asyncio.create_task(self._process_request(message))  # type: ignore
+
+        self._tasks.add(task)
+        task.add_done_callback(partial(self._send_response, message.id))
+
+    def _send_response(self, message_id: str, task: Task):
+        self._tasks.discard(task)
+        try:
+            response = task.result()
+        except (Exception, asyncio.CancelledError) as e:
+            # NOTE: The caller would otherwise keep waiting for a response
+            # forever
+            response = ModelResponseMessage(id=message_id, exception=WorkerError(e))
+
+        # NOTE: The response's data only gets copied by the queue, instead
+        # of getting pickled again
+        self.responses.put(_serialise_response(response))
+
+    async def _process_request(
+        self, request: ModelRequestMessage
+    ) -> ModelResponseMessage:
+        segments: List[SharedMemory] = []
+        try:
+            model = await self._model_registry.get_model(
+                request.model_name, request.model_version
+            )
+            method = getattr(model, request.method_name)
+
+            args = [_attach_arg(arg, segments) for arg in request.method_args]
+            kwargs = {
+                key: _attach_arg(arg, segments)
+                for key, arg in request.method_kwargs.items()
+            }
+            return_value = await method(*args, **kwargs)
+            del args, kwargs
+
+            if isinstance(return_value, InferenceResponse):
+                # The response segment is owned (and freed) by the main
+                # process
+                return_value, segment = to_shared_memory(return_value)
+                release(segment)
+
+            return ModelResponseMessage(id=request.id, return_value=return_value)
+        except Exception as e:
+            return ModelResponseMessage(id=request.id, exception=_ensure_picklable(e))
+        finally:
+            for segment in segments:
+                release(segment)
+
+    async def _process_model_update(
+        self, update: ModelUpdateMessage
+    ) -> ModelResponseMessage:
+        try:
+            await apply_model_update(self._model_registry, update)
+            return ModelResponseMessage(id=update.id)
+        except Exception as e:
+            return ModelResponseMessage(id=update.id, exception=_ensure_picklable(e))
@@ -0,0 +1,304 @@
+import os
+import time
+import signal
+import asyncio
+
+from multiprocessing import Queue
+from multiprocessing.synchronize import Lock
+from queue import Empty
+from typing import Dict, List, Optional
+
+from ..registry import MultiModelRegistry
+from ..settings import ModelSettings
+from ..logging import logger
+
+from .messages import (
+    Message,
+    ModelUpdateMessage,
+    ModelUpdateType,
+    ModelResponseMessage,
+    WorkerForkMessage,
+)
+from .worker import (
+    Worker,
+    Heartbeat,
+    END_OF_QUEUE,
+    _ctx,
+    _ParentCheckInterval,
+    _ensure_picklable,
+    apply_model_update,
+    new_heartbeat,
+)
+
+# Time (in seconds) to wait for forked workers to exit (i.e. when the zygote
+# gets stopped, or when they get replaced), before killing them
+_ForkedWorkerStopTimeout = 5
+
+
+class ForkedWorker:
+    """
+    Handle used by the main process to talk to a worker forked by the zygote.
+    """
+
+    def __init__(
+        self,
+        requests: Queue,
+        responses: Queue,
+        heartbeat: Heartbeat,
+        pid: int,
+        killed_pid: Optional[int] = None,
+    ):
+        self._requests = requests
+        self.responses = responses
+        self.heartbeat = heartbeat
+        self.pid = pid
+        # PID of the previous worker on the same position, if it had to be
+        # killed as it didn't stop on time
+        self.killed_pid = killed_pid
+
+    def send(self, message: object):
+        self._requests.put(message)
+
+    def stop(self):
+        self._requests.put(END_OF_QUEUE)
+
+    def is_alive(self) -> bool:
+        try:
+            os.kill(self.pid, 0)
+            return True
+        except ProcessLookupError:
+            return False
+
+    def kill(self):
+        try:
+            os.kill(self.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+class Zygote(_ctx.Process):  # type: ignore
+    """
+    Process which loads each model once and forks the inference workers off
+    itself.
+
+    Forked workers share the zygote's memory copy-on-write, so that large
+    models only need to get deserialised (and kept in memory) once.
+    Since forking doesn't play well with every runtime, this is only used when
+    explicitly enabled.
+    """
+
+    def __init__(self, num_workers: int):
+        # NOTE: The queues (and heartbeat) of each forked worker need to get
+        # created upfront, so that they're shared by both the main process and
+        # the zygote
+        super().__init__(daemon=True)
+        self._requests: List[Queue] = [_ctx.Queue() for _ in range(num_workers)]
+        self._responses: List[Queue] = [_ctx.Queue() for _ in range(num_workers)]
+        self._heartbeats = [new_heartbeat() for _ in range(num_workers)]
+        self._commands: Queue = _ctx.Queue()
+        self._replies: Queue = _ctx.Queue()
+        # NOTE: The lock needs to be picklable, so that the zygote can get spawned
+        self._lock = _ctx.Lock()
+
+    async def load_model(self, model_settings: ModelSettings):
+        load_message = ModelUpdateMessage(
+            update_type=ModelUpdateType.Load, model_settings=model_settings
+        )
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._call, load_message)
+
+    async def unload_model(self, model_settings: ModelSettings):
+        unload_message = ModelUpdateMessage(
+            update_type=ModelUpdateType.Unload, model_settings=model_settings
+        )
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._call, unload_message)
+
+    def fork_worker(self, worker_idx: int) -> ForkedWorker:
+        """
+        Forks a new worker for the given position of the pool.
+        If there was a previous worker on that position, the zygote will wait
+        for it to exit first (killing it if it doesn't stop on time), so that
+        both don't pull from the same queue.
+        """
+        heartbeat = self._heartbeats[worker_idx]
+        heartbeat.value = 0
+
+        fork_message = WorkerForkMessage(worker_idx=worker_idx)
+        reply = self._call(fork_message)
+        worker_pid, killed_pid = reply.return_value
+        return ForkedWorker(
+            self._requests[worker_idx],
+            self._responses[worker_idx],
+            heartbeat,
+            worker_pid,
+            killed_pid,
+        )
+
+    def stop(self):
+        self._commands.put(END_OF_QUEUE)
+
+    def _call(self, message: Message) -> ModelResponseMessage:
+        # The zygote processes commands one at a time, so each reply will
+        # always match the last command sent
+        with self._lock:
+            self._commands.put(message)
+            reply = self._replies.get()
+
+        if reply.exception is not None:
+            raise reply.exception
+
+        return reply
+
+    def run(self):
+        # Let the main process be the one handling interruptions
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        self._model_registry = MultiModelRegistry()
+        self._children: Dict[int, int] = {}
+
+        parent_pid = os.getppid()
+        while True:
+            try:
+                message = self._commands.get(timeout=_ParentCheckInterval)
+            except Empty:
+                if os.getppid() == parent_pid:
+                    self._reap_children()
+                    continue
+
+                message = END_OF_QUEUE
+
+            if message is END_OF_QUEUE:
+                break
+
+            self._replies.put(self._process_command(message))
+
+        self._wait_for_children()
+
+    def _process_command(self, message: Message) -> ModelResponseMessage:
+        try:
+            if isinstance(message, WorkerForkMessage):
+                killed_pid = self._stop_previous_worker(message.worker_idx)
+                worker_pid = self._fork_worker(message.worker_idx)
+                return ModelResponseMessage(
+                    id=message.id, return_value=(worker_pid, killed_pid)
+                )
+
+            asyncio.run(apply_model_update(self._model_registry, message))
+            return ModelResponseMessage(id=message.id)
+        except Exception as e:
+            return ModelResponseMessage(id=message.id, exception=_ensure_picklable(e))
+
+    def _stop_previous_worker(self, worker_idx: int) -> Optional[int]:
+        """
+        Waits for the previous worker on a position to exit, returning its PID
+        if it had to be killed.
+        """
+        previous_pid = self._children.pop(worker_idx, None)
+        if previous_pid is None:
+            return None
+
+        if _stop_child(previous_pid, _ForkedWorkerStopTimeout):
+            return None
+
+        return previous_pid
+
+    def _fork_worker(self, worker_idx: int) -> int:
+        # At this point, nothing else can be using this position's queues.
+        # However, if the previous worker died while waiting for requests (or
+        # while sending a response), it will have left their locks acquired.
+        requests = self._requests[worker_idx]
+        responses = self._responses[worker_idx]
+        _release_stale_lock(requests._rlock)  # type: ignore
+        _release_stale_lock(responses._wlock)  # type: ignore
+
+        worker_pid = os.fork()
+        if worker_pid != 0:
+            self._children[worker_idx] = worker_pid
+            return worker_pid
+
+        # Within the forked worker, the zygote's models are already loaded
+        exit_code = 0
+        try:
+            worker = Worker(
+                requests=requests,
+                responses=responses,
+                heartbeat=self._heartbeats[worker_idx],
+            )
+            worker.run(self._model_registry)
+
+            # Unlike regular processes, `os._exit()` won't wait for pending
+            # responses to get flushed into the queue
+            responses.close()
+            responses.join_thread()
+        except Exception:
+            logger.exception(f"Forked inference worker {os.getpid()} failed")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _reap_children(self):
+        # Reap any worker which has died, so that it doesn't linger as a
+        # zombie (which would still look alive from the main process)
+        for worker_idx, worker_pid in list(self._children.items()):
+            if _wait_for_pid(worker_pid, timeout=0):
+                del self._children[worker_idx]
+
+    def _wait_for_children(self):
+        deadline = time.monotonic() + _ForkedWorkerStopTimeout
+        for worker_pid in self._children.values():
+            timeout = max(deadline - time.monotonic(), 0)
+            _stop_child(worker_pid, timeout)
+
+        self._children.clear()
+
+
+def _stop_child(pid: int, timeout: float) -> bool:
+    """
+    Waits for a child process to exit, killing (and reaping) it if it doesn't
+    within the given timeout.
+    Returns whether the process exited on its own.
+    """
+    if _wait_for_pid(pid, timeout):
+        return True
+
+    logger.warning(
+        f"Inference worker with PID {pid} didn't stop on time. Terminating it."
+    )
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+    _wait_for_pid(pid)
+    return False
+
+
+def _wait_for_pid(pid: int, timeout: Optional[float] = None) -> bool:
+    """
+    Waits for a child process to exit, returning whether it did within the
+    given timeout.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        try:
+            finished_pid, _ = os.waitpid(pid, 0 if deadline is None else os.WNOHANG)
+        except ChildProcessError:
+            # Process has already been reaped
+            return True
+
+        if finished_pid != 0:
+            return True
+
+        if deadline is not None and time.monotonic() > deadline:
+            return False
+
+        time.sleep(0.1)
+
+
+def _release_stale_lock(lock: Lock):
+    try:
+        lock.release()
+    except ValueError:
+        # The lock wasn't acquired
+        pass
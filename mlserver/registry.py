@@ -5,6 +5,7 @@ from itertools import chain
 from functools import cmp_to_key
 
 from .model import MLModel
+from .middleware import load_middlewares
 from .errors import ModelNotFound
 from .types import RepositoryIndexResponse
 from .logging import logger
@@ -146,9 +147,16 @@ class SingleModelRegistry:
         await model.load()
         self._register(model)
 
+        # NOTE: Middlewares need to wrap the model's own methods, before any of
+        # the hooks below (e.g. parallel inference or adaptive batching) do
+        load_middlewares(model)
+
         if self._on_model_load:
-            # TODO: Expose custom handlers on ParallelRuntime
-            await asyncio.gather(*[callback(model) for callback in self._on_model_load])
+            # NOTE: Callbacks run in order, as some of them may wrap the
+            # model's methods (e.g. to offload them to the inference pool)
+            # before others expose them (e.g. as custom endpoints)
+            for callback in self._on_model_load:
+                await callback(model)
 
     async def unload(self):
         models = await self.get_models()
@@ -58,6 +58,17 @@ def create_app(
             endpoints.infer,
             methods=["POST"],
         ),
+        # Model bulk infer
+        APIRoute(
+            "/v2/models/{model_name}/infer/bulk",
+            endpoints.infer_bulk,
+            methods=["POST"],
+        ),
+        APIRoute(
+            "/v2/models/{model_name}/versions/{model_version}/infer/bulk",
+            endpoints.infer_bulk,
+            methods=["POST"],
+        ),
         # Model metadata
         APIRoute(
             "/v2/models/{model_name}",
@@ -0,0 +1,124 @@
+"""
+Support for the binary tensor data extension of the V2 inference protocol,
+where tensors get sent as raw bytes right after a JSON header, instead of as
+JSON lists.
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..codecs.raw import decode_raw, encode_raw
+from ..errors import InferenceError
+from ..types import InferenceRequest, InferenceResponse
+
+InferenceHeaderContentLength = "inference-header-content-length"
+BinaryDataSizeParameter = "binary_data_size"
+BinaryDataParameter = "binary_data"
+BinaryDataOutputParameter = "binary_data_output"
+
+
+def decode_binary_request(header: Dict[str, Any], binary_data: memoryview) -> dict:
+    """
+    Fills in the data of every input sent as binary, following the same order
+    as the inputs on the JSON header.
+    """
+    if not isinstance(header, dict):
+        raise InferenceError("Invalid binary request: header must be a JSON object")
+
+    inputs = header.get("inputs", [])
+    if not isinstance(inputs, list):
+        raise InferenceError("Invalid binary request: inputs must be a list")
+
+    idx = 0
+    for tensor in inputs:
+        if not isinstance(tensor, dict):
+            raise InferenceError("Invalid binary request: inputs must be objects")
+
+        parameters = tensor.get("parameters") or {}
+        if not isinstance(parameters, dict):
+            raise InferenceError(
+                f"Invalid parameters for tensor {tensor.get('name')}: "
+                "must be a JSON object"
+            )
+
+        binary_data_size = parameters.pop(BinaryDataSizeParameter, None)
+        if binary_data_size is None:
+            continue
+
+        if (
+            not isinstance(binary_data_size, int)
+            or isinstance(binary_data_size, bool)
+            or binary_data_size < 0
+        ):
+            raise InferenceError(
+                f"Invalid {BinaryDataSizeParameter} for tensor {tensor.get('name')}: "
+                f"{binary_data_size}"
+            )
+
+        buffer = binary_data[idx : idx + binary_data_size]
+        if len(buffer) != binary_data_size:
+            raise InferenceError(f"Missing binary data for tensor {tensor.get('name')}")
+
+        tensor["data"] = decode_raw(
+            tensor.get("name"), tensor.get("datatype"), tensor.get("shape", []), buffer
+        )
+        idx += binary_data_size
+
+    return header
+
+
+def _get_flag(parameters: Any, name: str) -> Optional[bool]:
+    if parameters is None:
+        return None
+
+    return getattr(parameters, name, None)
+
+
+def get_binary_outputs(
+    payload: InferenceRequest, inference_response: InferenceResponse
+) -> Set[str]:
+    """
+    Returns the names of the outputs which need to be sent back as binary.
+    These can be requested independently for each output, or for all outputs
+    at once.
+    """
+    all_binary = _get_flag(payload.parameters, BinaryDataOutputParameter)
+    requested = {
+        request_output.name: _get_flag(request_output.parameters, BinaryDataParameter)
+        for request_output in payload.outputs or []
+    }
+
+    binary_outputs = set()
+    for response_output in inference_response.outputs:
+        is_binary = requested.get(response_output.name)
+        if is_binary is None:
+            is_binary = all_binary
+
+        if is_binary:
+            binary_outputs.add(response_output.name)
+
+    return binary_outputs
+
+
+def encode_binary_response(
+    content: dict, inference_response: InferenceResponse, binary_outputs: Set[str]
+) -> Tuple[dict, List[bytes]]:
+    """
+    Strips the data of the binary outputs from the JSON content of the
+    response, returning it separately as raw bytes.
+    """
+    buffers = []
+    for response_output, output_content in zip(
+        inference_response.outputs, content["outputs"]
+    ):
+        if response_output.name not in binary_outputs:
+            continue
+
+        buffer = encode_raw(response_output.datatype, response_output.data)
+        buffers.append(buffer)
+
+        del output_content["data"]
+        parameters = output_content.get("parameters") or {}
+        parameters[BinaryDataSizeParameter] = len(buffer)
+        output_content["parameters"] = parameters
+
+    return content, buffers
@@ -0,0 +1,197 @@
+"""
+Converters between the JSON payloads of the REST API and MLServer's types.
+These skip pydantic's validation (which gets expensive on large tensors) and
+only check the structure of the payload.
+"""
+
+import numpy as np
+
+from typing import Any, List, Optional
+
+from .. import types
+from ..errors import InferenceError
+
+_DATATYPES = {
+    "BOOL",
+    "UINT8",
+    "UINT16",
+    "UINT32",
+    "UINT64",
+    "INT8",
+    "INT16",
+    "INT32",
+    "INT64",
+    "FP16",
+    "FP32",
+    "FP64",
+    "BYTES",
+}
+
+
+def _check(condition: bool, msg: str):
+    if not condition:
+        raise InferenceError(f"Invalid inference request: {msg}")
+
+
+def _get_size(data: Any) -> Optional[int]:
+    """
+    Returns the number of elements of a tensor's data, or `None` if it's held
+    as nested lists whose rows don't have the same length.
+    """
+    if isinstance(data, np.ndarray):
+        return data.size
+
+    if isinstance(data, list):
+        if len(data) > 0 and isinstance(data[0], list):
+            # Tensors can also be sent as nested (i.e. row-major) lists
+            row_size = _get_size(data[0])
+            for row in data[1:]:
+                if not isinstance(row, list) or _get_size(row) != row_size:
+                    return None
+
+            return None if row_size is None else row_size * len(data)
+
+        return len(data)
+
+    return 1
+
+
+def _parameters_to_dict(parameters: Optional[types.Parameters]) -> Optional[dict]:
+    if parameters is None:
+        return None
+
+    return parameters.dict()
+
+
+class ParametersConverter:
+    @classmethod
+    def to_types(cls, body: Any) -> Optional[types.Parameters]:
+        if body is None:
+            return None
+
+        _check(isinstance(body, dict), "parameters must be an object")
+
+        content_type = body.get("content_type")
+        _check(
+            content_type is None or isinstance(content_type, str),
+            "content_type parameter must be a string",
+        )
+
+        headers = body.get("headers")
+        _check(
+            headers is None or isinstance(headers, dict),
+            "headers parameter must be an object",
+        )
+
+        return types.Parameters.construct(**body)
+
+
+class RequestInputConverter:
+    @classmethod
+    def to_types(cls, body: Any) -> types.RequestInput:
+        _check(isinstance(body, dict), "inputs must be objects")
+
+        name = body.get("name")
+        _check(isinstance(name, str), "inputs must have a name")
+
+        datatype = body.get("datatype")
+        _check(
+            isinstance(datatype, str) and datatype in _DATATYPES,
+            f"unknown datatype for input {name}",
+        )
+
+        shape = body.get("shape")
+        _check(
+            isinstance(shape, list)
+            and all(isinstance(dim, int) and dim >= 0 for dim in shape),
+            f"invalid shape for input {name}",
+        )
+
+        _check("data" in body, f"missing data for input {name}")
+        data = body["data"]
+        if datatype != "BYTES":
+            # NOTE: Variable-length payloads can be packed into fewer elements
+            # than their shape
+            expected_size = int(np.prod(shape))
+            size = _get_size(data)
+            _check(
+                size is not None,
+                f"rows of the nested data for input {name} must have the same length",
+            )
+            _check(
+                size == expected_size,
+                f"expected {expected_size} elements for input {name}",
+            )
+
+        return types.RequestInput.construct(
+            name=name,
+            shape=shape,
+            datatype=datatype,
+            parameters=ParametersConverter.to_types(body.get("parameters")),
+            data=types.TensorData.construct(__root__=data),
+        )
+
+
+class RequestOutputConverter:
+    @classmethod
+    def to_types(cls, body: Any) -> types.RequestOutput:
+        _check(isinstance(body, dict), "outputs must be objects")
+
+        name = body.get("name")
+        _check(isinstance(name, str), "outputs must have a name")
+
+        return types.RequestOutput.construct(
+            name=name,
+            parameters=ParametersConverter.to_types(body.get("parameters")),
+        )
+
+
+class InferenceRequestConverter:
+    @classmethod
+    def to_types(cls, body: Any) -> types.InferenceRequest:
+        _check(isinstance(body, dict), "expected an object")
+
+        request_id = body.get("id")
+        _check(request_id is None or isinstance(request_id, str), "invalid id")
+
+        inputs = body.get("inputs")
+        _check(isinstance(inputs, list), "missing list of inputs")
+
+        outputs: Optional[List[types.RequestOutput]] = None
+        if body.get("outputs") is not None:
+            _check(isinstance(body["outputs"], list), "invalid list of outputs")
+            outputs = [RequestOutputConverter.to_types(out) for out in body["outputs"]]
+
+        return types.InferenceRequest.construct(
+            id=request_id,
+            parameters=ParametersConverter.to_types(body.get("parameters")),
+            inputs=[RequestInputConverter.to_types(inp) for inp in inputs],
+            outputs=outputs,
+        )
+
+
+class ResponseOutputConverter:
+    @classmethod
+    def from_types(cls, type_object: types.ResponseOutput) -> dict:
+        return {
+            "name": type_object.name,
+            "shape": type_object.shape,
+            "datatype": type_object.datatype,
+            "parameters": _parameters_to_dict(type_object.parameters),
+            "data": getattr(type_object.data, "__root__", type_object.data),
+        }
+
+
+class InferenceResponseConverter:
+    @classmethod
+    def from_types(cls, type_object: types.InferenceResponse) -> dict:
+        return {
+            "model_name": type_object.model_name,
+            "model_version": type_object.model_version,
+            "id": type_object.id,
+            "parameters": _parameters_to_dict(type_object.parameters),
+            "outputs": [
+                ResponseOutputConverter.from_types(output)
+                for output in type_object.outputs
+            ],
+        }
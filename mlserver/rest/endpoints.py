@@ -1,6 +1,15 @@
+import json
+
+from typing import Any, AsyncIterator, List, Optional, Union
+
 from fastapi.requests import Request
 from fastapi.responses import Response
 
+from ..codecs.arrow import (
+    ArrowStreamContentType,
+    decode_arrow_stream,
+    encode_arrow_stream,
+)
 from ..types import (
     MetadataModelResponse,
     MetadataServerResponse,
@@ -9,9 +18,19 @@ from ..types import (
     RepositoryIndexRequest,
     RepositoryIndexResponse,
 )
+from ..errors import InferenceError
 from ..handlers import DataPlane, ModelRepositoryHandlers
+from ..logging import logger
 from ..utils import insert_headers, extract_headers
 
+from .binary import (
+    InferenceHeaderContentLength,
+    encode_binary_response,
+    get_binary_outputs,
+)
+from .converters import InferenceRequestConverter, InferenceResponseConverter
+from .requests import Request as NDJSONRequest
+from .responses import NDJSONResponse, Response as JSONResponse, to_json
 from .utils import to_status_code
 
 
@@ -48,23 +67,106 @@ class Endpoints:
     async def infer(
         self,
         raw_request: Request,
-        raw_response: Response,
-        payload: InferenceRequest,
         model_name: str,
         model_version: str = None,
-    ) -> InferenceResponse:
+    ) -> Response:
         request_headers = raw_request.headers
+        if _is_arrow_stream(request_headers.get("content-type")):
+            payload = decode_arrow_stream(await raw_request.body())
+        else:
+            # NOTE: The payload gets parsed manually (instead of letting
+            # FastAPI validate it), to avoid going through every element of
+            # each tensor
+            try:
+                body = await raw_request.json()
+            except json.JSONDecodeError as err:
+                raise InferenceError(f"Invalid JSON payload: {err}")
+
+            payload = InferenceRequestConverter.to_types(body)
+
         insert_headers(payload, request_headers)  # type: ignore
 
         inference_response = await self._data_plane.infer(
             payload, model_name, model_version
         )
 
-        response_headers = extract_headers(inference_response)
-        if response_headers:
-            raw_response.headers.update(response_headers)
+        response_headers = extract_headers(inference_response) or {}
+        if _is_arrow_stream(request_headers.get("accept")):
+            return Response(
+                encode_arrow_stream(inference_response),
+                headers=response_headers,
+                media_type=ArrowStreamContentType,
+            )
+
+        content = InferenceResponseConverter.from_types(inference_response)
+
+        binary_outputs = get_binary_outputs(payload, inference_response)
+        if not binary_outputs:
+            return JSONResponse(content, headers=response_headers)
 
-        return inference_response
+        content, buffers = encode_binary_response(
+            content, inference_response, binary_outputs
+        )
+        header = to_json(content)
+        response_headers[InferenceHeaderContentLength] = str(len(header))
+        return Response(
+            b"".join([header, *buffers]),
+            headers=response_headers,
+            media_type="application/octet-stream",
+        )
+
+    async def infer_bulk(
+        self,
+        raw_request: NDJSONRequest,
+        model_name: str,
+        model_version: str = None,
+    ) -> Response:
+        try:
+            if raw_request.headers.get("content-type", "").startswith(
+                NDJSONResponse.media_type
+            ):
+                body = await raw_request.ndjson()
+            else:
+                body = await raw_request.json()
+        except json.JSONDecodeError as err:
+            raise InferenceError(f"Invalid JSON payload: {err}")
+
+        if not isinstance(body, list):
+            raise InferenceError(
+                "Invalid bulk inference request: expected a list of requests"
+            )
+
+        payloads = [InferenceRequestConverter.to_types(req) for req in body]
+        for payload in payloads:
+            insert_headers(payload, dict(raw_request.headers))
+
+        results = await self._data_plane.infer_bulk(payloads, model_name, model_version)
+        return NDJSONResponse(_to_bulk_content(payloads, results))
+
+
+def _is_arrow_stream(media_type: Optional[str]) -> bool:
+    return media_type is not None and ArrowStreamContentType in media_type
+
+
+async def _to_bulk_content(
+    payloads: List[InferenceRequest],
+    results: AsyncIterator[tuple],
+) -> AsyncIterator[Any]:
+    async for idx, result in results:
+        yield _to_bulk_item(payloads[idx], result)
+
+
+def _to_bulk_item(
+    payload: InferenceRequest, result: Union[InferenceResponse, Exception]
+) -> dict:
+    if isinstance(result, Exception):
+        # Errors carry the request's ID, so that they can be matched
+        logger.error(result)
+        return {"id": payload.id, "error": str(result)}
+
+    # NOTE: Response headers can't be sent back for each response
+    extract_headers(result)
+    return InferenceResponseConverter.from_types(result)
 
 
 class ModelRepositoryEndpoints:
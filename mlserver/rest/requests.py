@@ -1,25 +1,64 @@
-from typing import Any
+import json
+
+from typing import Any, List
 
 from fastapi import Request as _Request
 
+from ..errors import InferenceError
+from .binary import InferenceHeaderContentLength, decode_binary_request
+
 try:
     import orjson
 except ImportError:
     orjson = None  # type: ignore
 
 
+def _loads(body: bytes) -> Any:
+    if orjson is None:
+        return json.loads(body)
+
+    return orjson.loads(body)
+
+
+def _get_header_length(header_length: str, body_length: int) -> int:
+    try:
+        length = int(header_length)
+    except ValueError:
+        length = -1
+
+    if not 0 <= length <= body_length:
+        raise InferenceError(
+            f"Invalid {InferenceHeaderContentLength} header: {header_length}"
+        )
+
+    return length
+
+
 class Request(_Request):
     """
     Custom request class which uses `orjson` if present.
     Otherwise, it falls back to the standard FastAPI request.
+    Requests using the binary tensor data extension (i.e. with a JSON header
+    followed by raw tensor data) will get parsed as JSON as well.
     """
 
     async def json(self) -> Any:
-        if orjson is None:
-            return await super().json()
-
         if not hasattr(self, "_json"):
             body = await self.body()
-            self._json = orjson.loads(body)
+            header_length = self.headers.get(InferenceHeaderContentLength)
+            if header_length is None:
+                self._json = _loads(body)
+            else:
+                header_length = _get_header_length(header_length, len(body))
+                header = _loads(body[:header_length])
+                binary_data = memoryview(body)[header_length:]
+                self._json = decode_binary_request(header, binary_data)
 
         return self._json
+
+    async def ndjson(self) -> List[Any]:
+        """
+        Parses a body made of newline-delimited JSON objects (i.e. NDJSON).
+        """
+        body = await self.body()
+        return [_loads(line) for line in body.splitlines() if line.strip()]
@@ -1,8 +1,12 @@
 import json
+import numpy as np
 
-from typing import Any
+from typing import Any, AsyncIterable, AsyncIterator
 
-from starlette.responses import JSONResponse as _JSONResponse
+from starlette.responses import (
+    JSONResponse as _JSONResponse,
+    StreamingResponse as _StreamingResponse,
+)
 
 from ..codecs.string import decode_str
 
@@ -19,6 +23,9 @@ class BytesJSONEncoder(json.JSONEncoder):
             # "best effort" basis
             return decode_str(obj)
 
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+
         return super().default(self, obj)
 
 
@@ -31,34 +38,66 @@ class Response(_JSONResponse):
     media_type = "application/json"
 
     def render(self, content: Any) -> bytes:
-        if orjson is None:
-            # Original implementation of starlette's JSONResponse, using our
-            # custom encoder (capable of "encoding" bytes).
-            # Original implementation can be seen here:
-            # https://github.com/encode/starlette/blob/
-            # f53faba229e3fa2844bc3753e233d9c1f54cca52/starlette/responses.py#L173-L180
-            return json.dumps(
-                content,
-                ensure_ascii=False,
-                allow_nan=False,
-                indent=None,
-                separators=(",", ":"),
-                cls=BytesJSONEncoder,
-            ).encode("utf-8")
-
-        # This is equivalent to the ORJSONResponse implementation in FastAPI:
-        # https://github.com/tiangolo/fastapi/blob/
-        # 864643ef7608d28ac4ed321835a7fb4abe3dfc13/fastapi/responses.py#L32-L34
-        return orjson.dumps(content, default=_encode_bytes)
-
-
-def _encode_bytes(obj: Any) -> str:
+        return to_json(content)
+
+
+class NDJSONResponse(_StreamingResponse):
     """
-    Add compatibility with `bytes` payloads to `orjson`
+    Streams back a sequence of JSON objects as newline-delimited JSON (i.e.
+    NDJSON), sending each of them as soon as it's available.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def __init__(self, content: AsyncIterable[Any], **kwargs):
+        super().__init__(_render_lines(content), **kwargs)
+
+
+async def _render_lines(content: AsyncIterable[Any]) -> AsyncIterator[bytes]:
+    async for item in content:
+        yield to_json(item) + b"\n"
+
+
+def to_json(content: Any) -> bytes:
+    """
+    Serialises content as JSON, using `orjson` if present.
+    Besides the standard types, this also handles `bytes` payloads and NumPy
+    arrays.
+    """
+    if orjson is None:
+        # Original implementation of starlette's JSONResponse, using our
+        # custom encoder (capable of "encoding" bytes).
+        # Original implementation can be seen here:
+        # https://github.com/encode/starlette/blob/
+        # f53faba229e3fa2844bc3753e233d9c1f54cca52/starlette/responses.py#L173-L180
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+            cls=BytesJSONEncoder,
+        ).encode("utf-8")
+
+    # This is equivalent to the ORJSONResponse implementation in FastAPI:
+    # https://github.com/tiangolo/fastapi/blob/
+    # 864643ef7608d28ac4ed321835a7fb4abe3dfc13/fastapi/responses.py#L32-L34
+    return orjson.dumps(
+        content, default=_encode_default, option=orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+def _encode_default(obj: Any) -> Any:
+    """
+    Add compatibility with `bytes` payloads (and with any NumPy arrays not
+    natively supported) to `orjson`
     """
     if isinstance(obj, bytes):
         # If we get a bytes payload, try to decode it back to a string on a
         # "best effort" basis
         return decode_str(obj)
 
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+
     raise TypeError
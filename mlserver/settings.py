@@ -79,6 +79,40 @@ class Settings(BaseSettings):
     grpc_max_message_length: Optional[int] = None
     """Maximum length (i.e. size) of gRPC payloads."""
 
+    grpc_max_stream_requests: int = 100
+    """Maximum number of requests of a single gRPC stream which can be in
+    flight at the same time.
+    Once reached, MLServer will stop reading new requests from the stream until
+    some of the pending responses are sent back."""
+
+    # Parallel inference settings
+    parallel_workers: int = 4
+    """When parallel inference is enabled, number of workers to run inference
+    across.
+    These workers are shared across all models loaded in the server.
+    Setting this value to 0 will disable parallel inference."""
+
+    parallel_fork_workers: bool = False
+    """When parallel inference is enabled, load each model only once in a
+    separate process, and fork the inference workers off it.
+    This lets workers share the model's memory copy-on-write, but it may not
+    be supported by every inference runtime (e.g. TensorFlow).
+    By default, each worker gets spawned as a fresh process and loads its own
+    copy of the models."""
+
+    parallel_worker_timeout: Optional[float] = None
+    """When parallel inference is enabled, time (in seconds) after which an
+    unresponsive worker will be considered hung, and will get restarted.
+    This needs to be longer than any blocking call made by the models (e.g.
+    to load them or to run inference).
+    By default, only workers which have died will get restarted."""
+
+    parallel_model_affinity: bool = False
+    """When parallel inference is enabled, prefer sending requests to the same
+    worker which last served that model version, as long as it's one of the
+    least loaded ones.
+    This can help keep each model's memory hot within a worker."""
+
     # CORS settings
     cors_settings: Optional[CORSSettings] = None
 
@@ -148,13 +182,15 @@ class ModelSettings(BaseSettings):
     """Metadata about the outputs returned by the model."""
 
     # Parallel settings
-    parallel_workers: int = 4
-    """When parallel inference is enabled, number of workers to run inference
-    across."""
+    parallel_workers: Optional[int] = None
+    """*Deprecated*: the number of inference workers is now shared across all
+    models and can be set through the server-wide ``parallel_workers`` setting.
+    Setting this field to 0 will still disable parallel inference for this
+    model."""
 
     warm_workers: bool = False
-    """When parallel inference is enabled, optionally load model to all workers
-    on startup"""
+    """*Deprecated*: when parallel inference is enabled, models now always get
+    loaded into all workers on startup."""
 
     # Adaptive Batching settings (disabled by default)
     max_batch_size: int = 0
@@ -165,6 +201,55 @@ class ModelSettings(BaseSettings):
     """When adaptive batching is enabled, maximum amount of time (in seconds)
     to wait for enough requests to build a full batch."""
 
+    max_batch_queue_size: int = 0
+    """When adaptive batching is enabled, maximum number of requests waiting
+    to get batched. Once reached, new requests will wait until there is room
+    in the queue. By default, the queue is unbounded."""
+
+    target_batch_latency: Optional[float] = None
+    """When adaptive batching is enabled, target for the p99 latency (in
+    seconds) of batched requests. If set, the batch size and the time to wait
+    for each batch will get tuned dynamically, using ``max_batch_size`` and
+    ``max_batch_time`` as upper bounds."""
+
+    batch_length_buckets: List[int] = []
+    """When adaptive batching is enabled, boundaries of the buckets used to
+    batch together variable-length inputs (e.g. ``[16, 32, 64]``).
+    Requests will only get batched with others whose inputs fall within the
+    same bucket, padding their inputs up to the longest one in the batch.
+    By default, inputs don't get padded and all requests need to share the
+    same shape (besides the batch size)."""
+
+    batch_padded_outputs: List[str] = []
+    """When inputs get padded through ``batch_length_buckets``, names of the
+    outputs which hold a value per position of the input (e.g. per-token
+    outputs), and which therefore need to get their padding stripped.
+    Any other output will be returned as is."""
+
+    # Request coalescing settings
+    coalesce_requests: bool = False
+    """Let identical requests which arrive while a prediction for them is
+    already in flight wait for that prediction, instead of running inference
+    again. Requests are considered identical when they share the same inputs,
+    outputs and parameters (besides their headers).
+    Only enable this for models whose predictions are deterministic."""
+
+    # Response cache settings (disabled by default)
+    response_cache_size: int = 0
+    """Maximum number of responses to cache for this model, so that requests
+    with the same inputs, outputs and parameters (besides their headers) don't
+    run inference again. Setting this value to 0 disables the cache.
+    Only enable this for models whose predictions are deterministic."""
+
+    response_cache_max_bytes: Optional[int] = None
+    """When the response cache is enabled, maximum size (in bytes) of the
+    data held across all cached responses. By default, only the number of
+    entries is capped."""
+
+    response_cache_ttl: Optional[float] = None
+    """When the response cache is enabled, time (in seconds) after which
+    cached responses expire. By default, responses don't expire."""
+
     # Custom model class implementation
     implementation: PyObject = "mlserver.model.MLModel"  # type: ignore
     """*Python path* to the inference runtime to use to serve this model (e.g.
@@ -40,6 +40,16 @@ class RepositoryIndexResponse(BaseModel):
     def __len__(self):
         return len(self.__root__)
 
+    def dict(self, *args, **kwargs):
+        # NOTE: The root may be held lazily as a NumPy array, which needs to
+        # be turned into a list to be serialised (and compared)
+        as_dict = super().dict(*args, **kwargs)
+        root = as_dict.get("__root__")
+        if hasattr(root, "tolist"):
+            as_dict["__root__"] = root.tolist()
+
+        return as_dict
+
 
 class RepositoryIndexErrorResponse(BaseModel):
     error: Optional[str] = None
@@ -44,8 +44,9 @@ setup(
         "uvicorn",
         "starlette_exporter",
         "py-grpc-prometheus",
+        "prometheus_client",
     ],
-    extras_require={"all": ["orjson"]},
+    extras_require={"all": ["orjson", "pyarrow"]},
     entry_points={"console_scripts": ["mlserver=mlserver.cli:main"]},
     long_description=_load_description(),
     long_description_content_type="text/markdown",
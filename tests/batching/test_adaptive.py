@@ -1,11 +1,17 @@
 import asyncio
 import pytest
+import time
 
-from typing import List
+from typing import Dict, List
 
-from mlserver.batching.adaptive import AdaptiveBatcher
+from prometheus_client.registry import REGISTRY
+
+from mlserver.errors import InferenceError
+from mlserver.batching.adaptive import AdaptiveBatcher, get_priority, get_timeout
+from mlserver.batching.errors import DeadlineExceeded
+from mlserver.batching.metrics import BatchSizeMetricName, BatchTimeMetricName
 from mlserver.batching.shape import Shape
-from mlserver.types import InferenceRequest, RequestInput
+from mlserver.types import InferenceRequest, Parameters, RequestInput
 from mlserver.model import MLModel
 from mlserver.utils import generate_uuid
 
@@ -47,6 +53,232 @@ async def test_batch_requests_timeout(
         assert batched_requests[0].inference_requests == sent_request
 
 
+async def test_batch_requests_backlog(
+    adaptive_batcher: AdaptiveBatcher,
+    send_request: TestRequestSender,
+):
+    max_batch_size = adaptive_batcher._max_batch_size
+    num_requests = max_batch_size * 2 + 1
+    sent_requests = dict(
+        await asyncio.gather(*[send_request() for _ in range(num_requests)])
+    )
+
+    batched_requests = [
+        batched_req async for batched_req in adaptive_batcher._batch_requests()
+    ]
+
+    assert [len(batched.inference_requests) for batched in batched_requests] == [
+        max_batch_size,
+        max_batch_size,
+        1,
+    ]
+
+    batched_ids = [
+        internal_id
+        for batched in batched_requests
+        for internal_id in batched.inference_requests
+    ]
+    assert batched_ids == list(sent_requests.keys())
+
+
+async def test_queue_size_limit(
+    adaptive_batcher: AdaptiveBatcher,
+    send_request: TestRequestSender,
+):
+    adaptive_batcher._max_queue_size = 2
+    await asyncio.gather(*[send_request() for _ in range(2)])
+
+    # Once the queue is full, new requests need to wait for room
+    blocked_request = asyncio.create_task(send_request())
+    done, _ = await asyncio.wait([blocked_request], timeout=0.1)
+    assert not done
+
+    batched_requests = [
+        batched_req async for batched_req in adaptive_batcher._batch_requests()
+    ]
+    internal_id, _ = await blocked_request
+
+    # Taking requests off the queue should make room for the blocked one
+    assert len(batched_requests) == 1
+    assert len(batched_requests[0].inference_requests) == 3
+    assert internal_id in batched_requests[0].inference_requests
+
+
+@pytest.mark.parametrize(
+    "parameters, expected_priority, expected_timeout",
+    [
+        (None, 0, None),
+        (Parameters(priority=2, timeout=0.5), 2, 0.5),
+        (
+            Parameters(headers={"mlserver-priority": "-1", "mlserver-timeout": "3"}),
+            -1,
+            3.0,
+        ),
+        (
+            Parameters(priority=1, headers={"mlserver-priority": "5"}),
+            1,
+            None,
+        ),
+    ],
+)
+def test_get_scheduling_values(
+    inference_request: InferenceRequest,
+    parameters: Parameters,
+    expected_priority: int,
+    expected_timeout: float,
+):
+    inference_request.parameters = parameters
+
+    assert get_priority(inference_request) == expected_priority
+    assert get_timeout(inference_request) == expected_timeout
+
+
+def test_get_priority_invalid(inference_request: InferenceRequest):
+    inference_request.parameters = Parameters(priority="high")
+
+    with pytest.raises(InferenceError):
+        get_priority(inference_request)
+
+
+async def test_batch_requests_priority(
+    adaptive_batcher: AdaptiveBatcher,
+    send_request: TestRequestSender,
+    inference_request: InferenceRequest,
+):
+    max_batch_size = adaptive_batcher._max_batch_size
+    await asyncio.gather(*[send_request() for _ in range(max_batch_size)])
+
+    # Requests with a higher priority should jump the queue, and within the
+    # same priority, earliest deadlines should go first
+    queued_ids = []
+    for timeout in [60, 30]:
+        urgent_request = inference_request.copy(deep=True)
+        urgent_request.parameters = Parameters(priority=1, timeout=timeout)
+        internal_id, _ = await adaptive_batcher._queue_request(urgent_request)
+        queued_ids.append(internal_id)
+
+    batched_requests = [
+        batched_req async for batched_req in adaptive_batcher._batch_requests()
+    ]
+
+    batched_ids = list(batched_requests[0].inference_requests.keys())
+    assert batched_ids[:2] == list(reversed(queued_ids))
+
+
+async def test_batch_requests_deadline(
+    adaptive_batcher: AdaptiveBatcher,
+    send_request: TestRequestSender,
+    inference_request: InferenceRequest,
+):
+    expired_request = inference_request.copy(deep=True)
+    expired_request.parameters = Parameters(timeout=0)
+    expired_id, async_response = await adaptive_batcher._queue_request(expired_request)
+    internal_id, _ = await send_request()
+
+    await asyncio.sleep(0.01)
+    batched_requests = [
+        batched_req async for batched_req in adaptive_batcher._batch_requests()
+    ]
+
+    assert len(batched_requests) == 1
+    assert list(batched_requests[0].inference_requests.keys()) == [internal_id]
+
+    with pytest.raises(DeadlineExceeded):
+        await async_response
+
+
+async def test_batch_requests_all_expired(
+    adaptive_batcher: AdaptiveBatcher,
+    inference_request: InferenceRequest,
+):
+    inference_request.parameters = Parameters(timeout=0)
+    _, async_response = await adaptive_batcher._queue_request(inference_request)
+
+    await asyncio.sleep(0.01)
+    batched_requests = [
+        batched_req async for batched_req in adaptive_batcher._batch_requests()
+    ]
+
+    assert batched_requests == []
+    with pytest.raises(DeadlineExceeded):
+        await async_response
+
+
+async def test_predict_deadline(
+    adaptive_batcher: AdaptiveBatcher,
+    sum_model: MLModel,
+    inference_request: InferenceRequest,
+):
+    adaptive_batcher._max_batch_time = 10
+    inference_request.parameters = Parameters(timeout=0.05)
+
+    started_at = time.monotonic()
+    response = await adaptive_batcher.predict(inference_request)
+
+    # The batch should close on the request's deadline, instead of waiting for
+    # it to fill up
+    assert time.monotonic() - started_at < 1
+    assert response.outputs == (await sum_model.predict(inference_request)).outputs
+
+
+async def test_predict_expired_in_batch(
+    adaptive_batcher: AdaptiveBatcher,
+    inference_request: InferenceRequest,
+    mocker,
+):
+    adaptive_batcher._max_batch_size = 2
+    adaptive_batcher._max_batch_time = 10
+    predict = mocker.spy(adaptive_batcher, "_predict_fn")
+
+    expired_request = inference_request.copy(deep=True)
+    expired_request.parameters = Parameters(timeout=0.05)
+    expired_response = asyncio.create_task(adaptive_batcher.predict(expired_request))
+    await asyncio.sleep(0.01)
+
+    # Block the loop so that the request expires while its batch is still open
+    time.sleep(0.1)
+    response = await adaptive_batcher.predict(inference_request)
+
+    with pytest.raises(DeadlineExceeded):
+        await expired_response
+
+    assert predict.call_count == 1
+    batched_request = predict.call_args.args[0]
+    assert batched_request.inputs[0].shape == inference_request.inputs[0].shape
+    assert response.id == inference_request.id
+
+
+async def test_batch_requests_length_buckets(
+    adaptive_batcher: AdaptiveBatcher,
+    inference_request: InferenceRequest,
+):
+    adaptive_batcher._length_buckets = [2, 4]
+
+    bucket_ids: Dict[int, List[str]] = {2: [], 4: []}
+    for length in [1, 3, 2, 4]:
+        request_input = RequestInput(
+            name="input-0",
+            shape=[1, length],
+            datatype="INT32",
+            data=list(range(length)),
+        )
+        req = InferenceRequest(inputs=[request_input])
+        internal_id, _ = await adaptive_batcher._queue_request(req)
+        bucket = 2 if length <= 2 else 4
+        bucket_ids[bucket].append(internal_id)
+
+    batched_requests = [
+        batched_req async for batched_req in adaptive_batcher._batch_requests()
+    ]
+
+    # Each batch should only get padded up to the longest request in its
+    # bucket
+    assert len(batched_requests) == 2
+    for batched, (bucket, internal_ids) in zip(batched_requests, bucket_ids.items()):
+        assert list(batched.inference_requests.keys()) == internal_ids
+        assert batched.merged_request.inputs[0].shape == [2, bucket]
+
+
 async def test_batcher(
     adaptive_batcher: AdaptiveBatcher,
     send_request: TestRequestSender,
@@ -202,3 +434,22 @@ async def test_predict(
 
         expected = await sum_model.predict(req)
         assert res == expected
+
+
+async def test_tuned_batcher(sum_model: MLModel, inference_request: InferenceRequest):
+    sum_model.settings.target_batch_latency = 10
+    adaptive_batcher = AdaptiveBatcher(sum_model)
+
+    await asyncio.gather(
+        *[adaptive_batcher.predict(inference_request) for _ in range(20)]
+    )
+
+    tuner = adaptive_batcher._tuner
+    assert tuner is not None
+    assert 0 <= tuner.batch_time <= sum_model.settings.max_batch_time
+
+    labels = {"model_name": sum_model.name, "model_version": sum_model.version}
+    batch_size = REGISTRY.get_sample_value(BatchSizeMetricName, labels=labels)
+    batch_time = REGISTRY.get_sample_value(BatchTimeMetricName, labels=labels)
+    assert batch_size == tuner.batch_size
+    assert batch_time == tuner.batch_time
@@ -1,6 +1,7 @@
 import pytest
+import numpy as np
 
-from typing import Dict, List
+from typing import Dict, List, TypeVar
 
 from mlserver.types import (
     InferenceRequest,
@@ -8,9 +9,22 @@ from mlserver.types import (
     ResponseOutput,
     InferenceResponse,
     Parameters,
+    TensorData,
 )
 from mlserver.batching.requests import BatchedRequests
 
+_Tensor = TypeVar("_Tensor", RequestInput, ResponseOutput)
+
+
+def _as_list(tensor: _Tensor) -> _Tensor:
+    # Numeric data gets merged as NumPy arrays, which can't be compared
+    # directly as part of a Pydantic model
+    data = tensor.data.__root__
+    if not isinstance(data, np.ndarray):
+        return tensor
+
+    return tensor.copy(update={"data": TensorData(__root__=data.tolist())})
+
 
 @pytest.mark.parametrize(
     "request_inputs, expected_request_input, expected_minibatch_sizes",
@@ -140,7 +154,7 @@ def test_merge_request_inputs(
     batched = BatchedRequests()
     merged = batched._merge_request_inputs(request_inputs)
 
-    assert merged == expected_request_input
+    assert _as_list(merged) == expected_request_input
     assert batched._minibatch_sizes == expected_minibatch_sizes
 
 
@@ -227,10 +241,33 @@ def test_merged_request(
 
     batched = BatchedRequests(inference_requests)
     merged_request = batched.merged_request
+    merged_request.inputs = [_as_list(merged) for merged in merged_request.inputs]
 
     assert merged_request == expected
 
 
+@pytest.mark.parametrize(
+    "all_data, expected",
+    [
+        ([[1, 2, 3], [4, 5, 6]], [1, 2, 3, 4, 5, 6]),
+        ([[[1, 2, 3]], [[4, 5, 6]]], [[1, 2, 3], [4, 5, 6]]),
+    ],
+)
+def test_merge_numeric_data(all_data: List[list], expected: list):
+    request_inputs = {
+        f"req-{idx}": RequestInput(name="foo", datatype="FP32", shape=[1, 3], data=data)
+        for idx, data in enumerate(all_data)
+    }
+
+    batched = BatchedRequests()
+    merged = batched._merge_request_inputs(request_inputs)
+
+    merged_data = merged.data.__root__
+    assert isinstance(merged_data, np.ndarray)
+    assert merged_data.dtype == np.float32
+    assert merged_data.tolist() == expected
+
+
 @pytest.mark.parametrize(
     "minibatch_sizes, response_output, expected",
     [
@@ -311,6 +348,36 @@ def test_split_response_output(
     assert list(split.values()) == expected
 
 
+@pytest.mark.parametrize(
+    "merged_data, expected",
+    [
+        (
+            np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]),
+            [[1, 2, 3], [4, 5, 6, 7, 8, 9], [10, 11, 12]],
+        ),
+        (
+            np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]]),
+            [[[1, 2, 3]], [[4, 5, 6], [7, 8, 9]], [[10, 11, 12]]],
+        ),
+    ],
+)
+def test_split_numeric_data(merged_data: np.ndarray, expected: list):
+    response_output = ResponseOutput(
+        name="foo", datatype="INT64", shape=[4, 3], data=merged_data
+    )
+
+    batched = BatchedRequests()
+    batched._minibatch_sizes = {"req-1": 1, "req-2": 2, "req-3": 1}
+    split = batched._split_response_output(response_output)
+
+    assert list(split.keys()) == ["req-1", "req-2", "req-3"]
+    for split_output, expected_data in zip(split.values(), expected):
+        split_data = split_output.data.__root__
+        assert split_data.tolist() == expected_data
+        # Each minibatch should just be a view over the merged data
+        assert np.shares_memory(split_data, merged_data)
+
+
 @pytest.mark.parametrize(
     "inference_requests, inference_response, expected",
     [
@@ -405,3 +472,94 @@ def test_split_response(
 
     assert inference_requests.keys() == responses.keys()
     assert list(responses.values()) == expected
+
+
+def test_padded_requests():
+    inference_requests = {
+        "req-1": InferenceRequest(
+            inputs=[
+                RequestInput(name="foo", datatype="INT32", shape=[1, 2], data=[1, 2])
+            ]
+        ),
+        "req-2": InferenceRequest(
+            inputs=[
+                RequestInput(
+                    name="foo",
+                    datatype="INT32",
+                    shape=[2, 3],
+                    data=[3, 4, 5, 6, 7, 8],
+                )
+            ]
+        ),
+    }
+
+    batched = BatchedRequests(
+        inference_requests, pad_inputs=True, padded_outputs={"per-token"}
+    )
+
+    merged = batched.merged_request.inputs[0]
+    assert merged.shape == [3, 3]
+    assert merged.data.__root__.tolist() == [1, 2, 0, 3, 4, 5, 6, 7, 8]
+
+    inference_response = InferenceResponse(
+        model_name="my-model",
+        outputs=[
+            ResponseOutput(
+                name="per-token",
+                datatype="INT32",
+                shape=[3, 3],
+                data=[10, 20, 0, 30, 40, 50, 60, 70, 80],
+            ),
+            ResponseOutput(
+                name="per-sequence", datatype="INT32", shape=[3], data=[1, 2, 3]
+            ),
+        ],
+    )
+    responses = batched.split_response(inference_response)
+
+    # Padding should get stripped only from outputs which keep the padded
+    # length
+    per_token, per_sequence = responses["req-1"].outputs
+    assert per_token.shape == [1, 2]
+    assert per_token.data.__root__.tolist() == [10, 20]
+    assert per_sequence.shape == [1]
+
+    per_token, per_sequence = responses["req-2"].outputs
+    assert per_token.shape == [2, 3]
+    assert per_token.data.__root__.tolist() == [30, 40, 50, 60, 70, 80]
+    assert per_sequence.shape == [2]
+
+
+def test_padded_requests_fixed_size_output():
+    inference_requests = {
+        "req-1": InferenceRequest(
+            inputs=[RequestInput(name="foo", datatype="INT32", shape=[1, 1], data=[1])]
+        ),
+        "req-2": InferenceRequest(
+            inputs=[
+                RequestInput(name="foo", datatype="INT32", shape=[1, 2], data=[2, 3])
+            ]
+        ),
+    }
+    batched = BatchedRequests(
+        inference_requests, pad_inputs=True, padded_outputs={"per-token"}
+    )
+
+    # Class probabilities whose size happens to match the padded length
+    inference_response = InferenceResponse(
+        model_name="my-model",
+        outputs=[
+            ResponseOutput(
+                name="probs", datatype="FP32", shape=[2, 2], data=[0.1, 0.9, 0.7, 0.3]
+            )
+        ],
+    )
+    responses = batched.split_response(inference_response)
+
+    (probs,) = responses["req-1"].outputs
+    assert probs.shape == [1, 2]
+    assert np.asarray(probs.data.__root__).tolist() == pytest.approx([0.1, 0.9])
+
+    (probs,) = responses["req-2"].outputs
+    assert probs.shape == [1, 2]
+    assert np.asarray(probs.data.__root__).tolist() == pytest.approx([0.7, 0.3])
@@ -0,0 +1,73 @@
+import pytest
+
+from mlserver.batching.tuning import BatchTuner, _InferenceTimeEstimate, _MinSamples
+
+
+@pytest.fixture
+def tuner() -> BatchTuner:
+    return BatchTuner(
+        model_name="sum-model",
+        model_version="v1.2.3",
+        max_batch_size=10,
+        max_batch_time=0.5,
+        target_latency=0.1,
+    )
+
+
+def _observe_latencies(tuner: BatchTuner, latency: float):
+    for _ in range(_MinSamples):
+        tuner.observe_latency(latency)
+
+
+def test_shrink_batch_size(tuner: BatchTuner):
+    _observe_latencies(tuner, 0.2)
+    tuner.observe_batch(10, 0.05)
+
+    assert tuner.batch_size == 7
+
+
+def test_grow_batch_size(tuner: BatchTuner):
+    tuner.batch_size = 5
+    _observe_latencies(tuner, 0.01)
+    tuner.observe_batch(5, 0.005)
+
+    assert tuner.batch_size == 6
+
+
+def test_keep_batch_size_without_enough_samples(tuner: BatchTuner):
+    tuner.observe_latency(0.2)
+    tuner.observe_batch(10, 0.05)
+
+    assert tuner.batch_size == 10
+
+
+@pytest.mark.parametrize(
+    "arrival_interval, inference_time, expected",
+    [
+        # Waiting for the whole batch to arrive fits within the budget
+        (0.001, 0.01, 0.009),
+        # Inference leaves little room to wait for requests
+        (0.1, 0.09, 0.01),
+        # Inference takes longer than the target, so there's no room to wait
+        (0.1, 0.2, 0.0),
+    ],
+)
+def test_batch_time(
+    tuner: BatchTuner, arrival_interval: float, inference_time: float, expected
+):
+    for idx in range(3):
+        tuner.observe_arrival(idx * arrival_interval)
+
+    tuner.observe_batch(10, inference_time)
+
+    assert tuner.batch_time == pytest.approx(expected)
+
+
+def test_inference_time_estimate():
+    estimate = _InferenceTimeEstimate()
+    for _ in range(50):
+        estimate.update(2, 0.03)
+        estimate.update(4, 0.05)
+
+    # Inference time should be estimated as 0.01s + 0.01s per element
+    assert estimate.predict(8) == pytest.approx(0.09, rel=0.1)
@@ -0,0 +1,210 @@
+import pytest
+import numpy as np
+
+from mlserver.codecs import ArrowCodec, CodecError, StringCodec
+from mlserver.codecs.arrow import (
+    decode_arrow_stream,
+    encode_arrow_stream,
+    from_arrow_array,
+    to_arrow_array,
+)
+from mlserver.types import (
+    InferenceRequest,
+    InferenceResponse,
+    Parameters,
+    RequestInput,
+    ResponseOutput,
+)
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize(
+    "request_input, expected",
+    [
+        (
+            RequestInput(name="foo", datatype="INT32", shape=[3], data=[1, 2, 3]),
+            pa.array([1, 2, 3], type=pa.int32()),
+        ),
+        (
+            RequestInput(name="foo", datatype="FP64", shape=[2, 2], data=[1, 2, 3, 4]),
+            pa.FixedSizeListArray.from_arrays(pa.array([1.0, 2.0, 3.0, 4.0]), 2),
+        ),
+        (
+            RequestInput(name="foo", datatype="BYTES", shape=[2], data=[b"a", b"b"]),
+            pa.array([b"a", b"b"]),
+        ),
+        (
+            RequestInput(
+                name="foo",
+                datatype="BYTES",
+                shape=[2],
+                data=[b"a", b"b"],
+                parameters=Parameters(_decoded_payload=["a", "b"]),
+            ),
+            pa.array(["a", "b"]),
+        ),
+    ],
+)
+def test_to_arrow_array(request_input: RequestInput, expected: "pa.Array"):
+    array = to_arrow_array(request_input)
+
+    assert array.equals(expected)
+
+
+def test_to_arrow_array_zero_copy():
+    data = np.array([1.5, 2.5, 3.5])
+    request_input = RequestInput(
+        name="foo",
+        datatype="FP64",
+        shape=[3],
+        data=[1.5, 2.5, 3.5],
+        parameters=Parameters(_decoded_payload=data),
+    )
+
+    array = to_arrow_array(request_input)
+
+    assert array.buffers()[1].address == data.ctypes.data
+
+
+@pytest.mark.parametrize(
+    "array, expected",
+    [
+        (
+            pa.chunked_array([pa.array([1, 2]), pa.array([3])]),
+            ResponseOutput(name="foo", shape=[3], datatype="INT64", data=[1, 2, 3]),
+        ),
+        (
+            pa.FixedSizeListArray.from_arrays(pa.array([1.0, 2.0, 3.0, 4.0]), 2),
+            ResponseOutput(
+                name="foo", shape=[2, 2], datatype="FP64", data=[1.0, 2.0, 3.0, 4.0]
+            ),
+        ),
+        (
+            pa.array(["a", "b"]),
+            ResponseOutput(name="foo", shape=[2], datatype="BYTES", data=[b"a", b"b"]),
+        ),
+    ],
+)
+def test_from_arrow_array(array: "pa.Array", expected: ResponseOutput):
+    response_output = from_arrow_array("foo", array)
+
+    assert response_output == expected
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        pa.array([1, None, 3]),
+        pa.chunked_array([pa.array([1.5]), pa.array([None], type=pa.float64())]),
+        pa.FixedSizeListArray.from_arrays(pa.array([1, None, 3, 4]), 2),
+    ],
+)
+def test_from_arrow_array_nulls(array: "pa.Array"):
+    with pytest.raises(CodecError, match="foo"):
+        from_arrow_array("foo", array)
+
+
+def _to_stream(table: "pa.Table") -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return sink.getvalue().to_pybytes()
+
+
+def test_decode_arrow_stream():
+    table = pa.table(
+        {
+            "a": pa.array([1.5, 2.5]),
+            "b": pa.array(["hey", "abc"]),
+            "c": pa.FixedSizeListArray.from_arrays(pa.array([1, 2, 3, 4]), 2),
+        }
+    ).replace_schema_metadata({"id": "my-request"})
+    buffer = _to_stream(table)
+
+    inference_request = decode_arrow_stream(buffer)
+
+    assert inference_request.id == "my-request"
+    a, b, c = inference_request.inputs
+    assert (a.name, a.shape, a.datatype) == ("a", [2], "FP64")
+    np.testing.assert_array_equal(a.data.__root__, [1.5, 2.5])
+    assert np.shares_memory(a.data.__root__, np.frombuffer(buffer, dtype=np.uint8))
+
+    assert (b.name, b.shape, b.datatype) == ("b", [2], "BYTES")
+    assert b.data.__root__ == [b"hey", b"abc"]
+    assert b.parameters.content_type == StringCodec.ContentType
+
+    assert (c.name, c.shape, c.datatype) == ("c", [2, 2], "INT64")
+    np.testing.assert_array_equal(c.data.__root__, [1, 2, 3, 4])
+
+
+def test_decode_arrow_stream_nulls():
+    table = pa.table({"a": pa.array([1.5, 2.5]), "b": pa.array([1, None])})
+
+    with pytest.raises(CodecError, match="column b"):
+        decode_arrow_stream(_to_stream(table))
+
+
+def test_decode_arrow_stream_invalid():
+    with pytest.raises(CodecError):
+        decode_arrow_stream(b"not an arrow stream")
+
+
+def test_encode_arrow_stream():
+    inference_response = InferenceResponse(
+        model_name="my-model",
+        id="my-request",
+        outputs=[
+            ResponseOutput(name="a", shape=[2], datatype="INT32", data=[1, 2]),
+            ResponseOutput(
+                name="b", shape=[2, 2], datatype="FP32", data=np.arange(4.0)
+            ),
+            ResponseOutput(name="c", shape=[2], datatype="BYTES", data=[b"x", b"y"]),
+        ],
+    )
+
+    buffer = encode_arrow_stream(inference_response)
+    table = pa.ipc.open_stream(buffer).read_all()
+
+    assert table.schema.metadata == {b"model_name": b"my-model", b"id": b"my-request"}
+    assert table.column("a").type == pa.int32()
+    assert table.column("a").to_pylist() == [1, 2]
+    assert table.column("b").to_pylist() == [[0.0, 1.0], [2.0, 3.0]]
+    assert table.column("c").to_pylist() == [b"x", b"y"]
+
+
+def test_encode_arrow_stream_invalid_rows():
+    inference_response = InferenceResponse(
+        model_name="my-model",
+        outputs=[
+            ResponseOutput(name="a", shape=[2], datatype="INT32", data=[1, 2]),
+            ResponseOutput(name="b", shape=[3], datatype="INT32", data=[1, 2, 3]),
+        ],
+    )
+
+    with pytest.raises(CodecError):
+        encode_arrow_stream(inference_response)
+
+
+def test_arrow_codec():
+    inference_request = InferenceRequest(
+        inputs=[
+            RequestInput(name="a", datatype="INT64", shape=[2], data=[1, 2]),
+            RequestInput(name="b", datatype="FP32", shape=[2], data=[0.5, 1.5]),
+        ]
+    )
+
+    table = ArrowCodec.decode(inference_request)
+
+    assert table.column_names == ["a", "b"]
+    assert ArrowCodec.can_encode(table)
+
+    inference_response = ArrowCodec.encode("my-model", table)
+    assert inference_response == InferenceResponse(
+        model_name="my-model",
+        outputs=[
+            ResponseOutput(name="a", shape=[2], datatype="INT64", data=[1, 2]),
+            ResponseOutput(name="b", shape=[2], datatype="FP32", data=[0.5, 1.5]),
+        ],
+    )
@@ -7,7 +7,7 @@ from typing import Any
 from mlserver.types import RequestInput, Parameters, InferenceRequest
 from mlserver.codecs import NumpyCodec, StringCodec, PandasCodec
 from mlserver.codecs.middleware import DecodedParameterName, codec_middleware
-from mlserver.settings import ModelSettings
+from mlserver.model import MLModel
 
 
 @pytest.mark.parametrize(
@@ -53,9 +53,9 @@ from mlserver.settings import ModelSettings
     ],
 )
 def test_decode_request(
-    sum_model_settings: ModelSettings, inference_request: InferenceRequest, expected
+    sum_model: MLModel, inference_request: InferenceRequest, expected
 ):
-    decoded_request = codec_middleware(inference_request, sum_model_settings)
+    decoded_request = codec_middleware(inference_request, sum_model)
     decoded = getattr(decoded_request.parameters, DecodedParameterName)
 
     pd.testing.assert_frame_equal(decoded, expected)
@@ -117,10 +117,10 @@ def test_decode_request(
     ],
 )
 def test_decode_request_inputs(
-    sum_model_settings: ModelSettings, request_input: RequestInput, expected: Any
+    sum_model: MLModel, request_input: RequestInput, expected: Any
 ):
     request = InferenceRequest(inputs=[request_input])
-    request = codec_middleware(request, sum_model_settings)
+    request = codec_middleware(request, sum_model)
 
     if expected is None:
         assert not request.inputs[0].parameters
@@ -89,6 +89,37 @@ def test_decode(request_input: RequestInput, expected: np.ndarray):
     np.testing.assert_array_equal(decoded, expected)
 
 
+def test_encode_lazy():
+    payload = np.array([[1, 2], [3, 4]], dtype="int32")
+    response_output = NumpyCodec.encode(name="foo", payload=payload)
+
+    # Numeric data should be kept as a flattened view over the original array
+    data = response_output.data.__root__
+    assert isinstance(data, np.ndarray)
+    assert np.shares_memory(data, payload)
+    np.testing.assert_array_equal(data, [1, 2, 3, 4])
+
+
+def test_decode_lazy():
+    data = np.arange(4, dtype="<i4")
+    request_input = RequestInput(name="foo", shape=[2, 2], data=data, datatype="INT32")
+    decoded = NumpyCodec.decode(request_input)
+
+    # Data already held as a NumPy array shouldn't get copied again
+    assert np.shares_memory(decoded, data)
+    np.testing.assert_array_equal(decoded, [[0, 1], [2, 3]])
+
+
+def test_decode_read_only():
+    data = np.frombuffer(np.arange(4, dtype="<i4").tobytes(), dtype="<i4")
+    request_input = RequestInput(name="foo", shape=[2, 2], data=data, datatype="INT32")
+    decoded = NumpyCodec.decode(request_input)
+
+    # Models should be able to modify their inputs in place
+    decoded *= 2
+    np.testing.assert_array_equal(decoded, [[0, 2], [4, 6]])
+
+
 @pytest.mark.parametrize(
     "request_input",
     [
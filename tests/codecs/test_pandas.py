@@ -2,9 +2,9 @@ import pytest
 import pandas as pd
 import numpy as np
 
-from typing import Any
+from typing import Any, List
 
-from mlserver.codecs.pandas import PandasCodec, _to_response_output
+from mlserver.codecs.pandas import PandasCodec, PandasArrowCodec, _to_response_output
 from mlserver.types import (
     InferenceRequest,
     InferenceResponse,
@@ -163,3 +163,137 @@ def test_decode(inference_request, expected):
     decoded = codec.decode(inference_request)
 
     pd.testing.assert_frame_equal(decoded, expected)
+
+
+@pytest.mark.parametrize(
+    "shape, data",
+    [
+        ([3], [1.0, 2.0, 3.0]),
+        ([3, 1], [1.0, 2.0, 3.0]),
+    ],
+)
+def test_decode_raw(shape: List[int], data: list):
+    list_request = InferenceRequest(
+        inputs=[RequestInput(name="a", datatype="FP64", shape=shape, data=data)]
+    )
+
+    # Binary payloads (or raw contents) get loaded as arrays
+    raw_data = np.array(data, dtype=np.float64)
+    raw_request = InferenceRequest(
+        inputs=[RequestInput(name="a", datatype="FP64", shape=shape, data=raw_data)]
+    )
+
+    decoded = PandasCodec.decode(raw_request)
+    expected = PandasCodec.decode(list_request)
+
+    pd.testing.assert_frame_equal(decoded, expected)
+
+
+def test_encode_lazy():
+    series = pd.Series(data=np.array([1.5, 2.5], dtype=np.float32), name="foo")
+    response_output = _to_response_output(series)
+
+    assert response_output.datatype == "FP32"
+    assert isinstance(response_output.data.__root__, np.ndarray)
+    assert np.shares_memory(response_output.data.__root__, series.to_numpy())
+
+
+@pytest.mark.parametrize(
+    "inference_request, expected",
+    [
+        (
+            InferenceRequest(
+                inputs=[
+                    RequestInput(name="a", data=[1, 2, 3], datatype="INT32", shape=[3]),
+                    RequestInput(
+                        name="b",
+                        data=[b"hey", b"abc", b"foo"],
+                        datatype="BYTES",
+                        shape=[3],
+                        parameters=Parameters(_decoded_payload=["hey", "abc", "foo"]),
+                    ),
+                ]
+            ),
+            pd.DataFrame(
+                {
+                    "a": pd.Series([1, 2, 3], dtype="int32[pyarrow]"),
+                    "b": pd.Series(["hey", "abc", "foo"], dtype="string[pyarrow]"),
+                }
+            ),
+        ),
+        (
+            InferenceRequest(
+                inputs=[
+                    RequestInput(
+                        name="a",
+                        data=[1, 2, 3, 4],
+                        datatype="FP64",
+                        shape=[2, 2],
+                        parameters=Parameters(
+                            _decoded_payload=np.array([[1.0, 2.0], [3.0, 4.0]])
+                        ),
+                    ),
+                ]
+            ),
+            pd.DataFrame({"a": [[1.0, 2.0], [3.0, 4.0]]}),
+        ),
+    ],
+)
+def test_decode_arrow(inference_request: InferenceRequest, expected: pd.DataFrame):
+    pytest.importorskip("pyarrow")
+
+    decoded = PandasArrowCodec.decode(inference_request)
+
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in decoded.dtypes)
+    for col in expected:
+        assert decoded[col].tolist() == expected[col].tolist()
+
+
+def test_decode_arrow_zero_copy():
+    pytest.importorskip("pyarrow")
+
+    data = np.array([1.5, 2.5, 3.5])
+    inference_request = InferenceRequest(
+        inputs=[
+            RequestInput(
+                name="a",
+                data=[1.5, 2.5, 3.5],
+                datatype="FP64",
+                shape=[3],
+                parameters=Parameters(_decoded_payload=data),
+            )
+        ]
+    )
+
+    decoded = PandasArrowCodec.decode(inference_request)
+    response_output = _to_response_output(decoded["a"])
+
+    assert np.shares_memory(response_output.data.__root__, data)
+
+
+def test_encode_arrow():
+    pa = pytest.importorskip("pyarrow")
+
+    dataframe = pd.DataFrame(
+        {
+            "a": pd.arrays.ArrowExtensionArray(pa.array([1, 2, 3])),
+            "b": pd.arrays.ArrowExtensionArray(pa.array(["A", "B", "C"])),
+            "c": pd.arrays.ArrowExtensionArray(
+                pa.FixedSizeListArray.from_arrays(pa.array([1.0, 2.0, 3.0]), 1)
+            ),
+        }
+    )
+    inference_response = PandasCodec.encode("my-model", dataframe)
+
+    assert inference_response == InferenceResponse(
+        model_name="my-model",
+        outputs=[
+            ResponseOutput(name="a", shape=[3], datatype="INT64", data=[1, 2, 3]),
+            ResponseOutput(
+                name="b", shape=[3], datatype="BYTES", data=[b"A", b"B", b"C"]
+            ),
+            ResponseOutput(
+                name="c", shape=[3, 1], datatype="FP64", data=[1.0, 2.0, 3.0]
+            ),
+        ],
+    )
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+
+from mlserver.codecs import NumpyCodec, PandasCodec, StringCodec
+from mlserver.codecs.numpy import NumpyRequestCodec
+from mlserver.codecs import plan
+from mlserver.codecs.plan import CodecPlan
+from mlserver.settings import ModelSettings, ModelParameters
+from mlserver.types import (
+    InferenceRequest,
+    MetadataTensor,
+    Parameters,
+    RequestInput,
+    RequestOutput,
+)
+
+
+def _new_model_settings(content_type: str = None) -> ModelSettings:
+    model_settings = ModelSettings(
+        name="my-model",
+        inputs=[
+            MetadataTensor(
+                name="foo",
+                datatype="INT32",
+                shape=[2],
+                parameters=Parameters(content_type=NumpyCodec.ContentType),
+            ),
+            MetadataTensor(name="bar", datatype="BYTES", shape=[1]),
+        ],
+        outputs=[
+            MetadataTensor(
+                name="out",
+                datatype="BYTES",
+                shape=[1],
+                parameters=Parameters(content_type=StringCodec.ContentType),
+            )
+        ],
+    )
+    if content_type is not None:
+        model_settings.parameters = ModelParameters(content_type=content_type)
+
+    return model_settings
+
+
+def test_get_input_codec(mocker):
+    codec_plan = CodecPlan(_new_model_settings())
+
+    # The registry shouldn't be hit once the plan has been resolved
+    find_input_codec = mocker.patch("mlserver.codecs.plan.find_input_codec")
+    foo = RequestInput(name="foo", datatype="INT32", shape=[2], data=[1, 2])
+    bar = RequestInput(name="bar", datatype="BYTES", shape=[1], data=[b"a"])
+
+    assert codec_plan.get_input_codec(foo) is NumpyCodec
+    assert codec_plan.get_input_codec(bar) is None
+    find_input_codec.assert_not_called()
+
+
+def test_get_input_codec_override():
+    codec_plan = CodecPlan(_new_model_settings())
+    bar = RequestInput(
+        name="bar",
+        datatype="BYTES",
+        shape=[1],
+        data=[b"a"],
+        parameters=Parameters(content_type=StringCodec.ContentType),
+    )
+
+    assert codec_plan.get_input_codec(bar) is StringCodec
+
+
+def test_decode_inference_request():
+    codec_plan = CodecPlan(_new_model_settings(NumpyRequestCodec.ContentType))
+    inference_request = InferenceRequest(
+        inputs=[RequestInput(name="foo", datatype="INT32", shape=[2], data=[1, 2])]
+    )
+
+    decoded = codec_plan.decode_inference_request(inference_request)
+
+    np.testing.assert_array_equal(decoded, [1, 2])
+
+
+def test_get_output_codec():
+    codec_plan = CodecPlan(_new_model_settings())
+
+    assert codec_plan.get_output_codec(["a"], RequestOutput(name="out")) is StringCodec
+    assert (
+        codec_plan.get_output_codec(np.array([1]), RequestOutput(name="other"))
+        is NumpyCodec
+    )
+
+
+def test_get_response_codec(mocker):
+    codec_plan = CodecPlan(_new_model_settings())
+    find_by_payload = mocker.spy(plan, "find_request_codec_by_payload")
+
+    for _ in range(3):
+        assert codec_plan.get_response_codec(np.array([1, 2])) is NumpyRequestCodec
+
+    # Payloads of a different type should still get a matching codec
+    assert codec_plan.get_response_codec(pd.DataFrame({"a": [1]})) is PandasCodec
+    assert find_by_payload.call_count == 2
@@ -3,6 +3,7 @@ import pytest
 from typing import Any
 
 from mlserver.codecs import StringCodec
+from mlserver.codecs.string import encode_strs, decode_strs
 from mlserver.types import RequestInput, ResponseOutput
 
 
@@ -120,3 +121,32 @@ def test_encode_request_input(decoded, expected):
     assert request_input.data.__root__ == decoded
     assert response_output.datatype == request_input.datatype
     assert request_input.parameters.content_type == codec.ContentType
+
+
+@pytest.mark.parametrize(
+    "payload, expected",
+    [
+        ([], []),
+        (["hey", "", "whats"], [b"hey", b"", b"whats"]),
+        (["héllo", "wörld"], ["héllo".encode(), "wörld".encode()]),
+        (["with\x00separator", "hey"], [b"with\x00separator", b"hey"]),
+        (["hey", b"whats", None], [b"hey", b"whats", None]),
+    ],
+)
+def test_encode_strs(payload: list, expected: list):
+    assert encode_strs(payload) == expected
+
+
+@pytest.mark.parametrize(
+    "packed, expected",
+    [
+        ([], []),
+        (b"hey", ["hey"]),
+        ([b"hey", b"", b"whats"], ["hey", "", "whats"]),
+        (["héllo".encode(), "wörld".encode()], ["héllo", "wörld"]),
+        ([b"with\x00separator", b"hey"], ["with\x00separator", "hey"]),
+        ([b"hey", "whats", None], ["hey", "whats", None]),
+    ],
+)
+def test_decode_strs(packed: Any, expected: list):
+    assert decode_strs(packed) == expected
@@ -5,6 +5,7 @@ import shutil
 
 from mlserver.handlers import DataPlane, ModelRepositoryHandlers
 from mlserver.registry import MultiModelRegistry
+from mlserver.parallel import InferencePool
 from mlserver.repository import ModelRepository, DEFAULT_MODEL_SETTINGS_FILENAME
 from mlserver import types, Settings, ModelSettings
 
@@ -68,6 +69,14 @@ def settings() -> Settings:
     return Settings.parse_file(settings_path)
 
 
+@pytest.fixture
+async def inference_pool(settings: Settings) -> InferencePool:
+    pool = InferencePool(settings)
+    yield pool
+
+    await pool.close()
+
+
 @pytest.fixture
 def data_plane(settings: Settings, model_registry: MultiModelRegistry) -> DataPlane:
     return DataPlane(settings=settings, model_registry=model_registry)
@@ -1,3 +1,5 @@
+import time
+
 from mlserver import MLModel
 from mlserver.types import InferenceRequest, InferenceResponse, Parameters
 from mlserver.codecs import NumpyCodec
@@ -29,3 +31,10 @@ class SumModel(MLModel):
             response.parameters = Parameters(headers=response_headers)
 
         return response
+
+
+class SlowModel(MLModel):
+    async def predict(self, payload: InferenceRequest) -> InferenceResponse:
+        # Block the event loop, to simulate a worker which stopped responding
+        time.sleep(10)
+        return InferenceResponse(model_name=self.name, outputs=[])
@@ -1,8 +1,11 @@
 import pytest
+import numpy as np
 
 from google.protobuf import json_format
 
 from mlserver import types
+from mlserver.codecs import NumpyCodec
+from mlserver.errors import InferenceError
 from mlserver.grpc.converters import (
     ModelInferRequestConverter,
     ModelInferResponseConverter,
@@ -62,6 +65,69 @@ def test_modelinferrequest_to_types(model_infer_request):
     assert dict(inference_request) == dict(expected)
 
 
+def test_modelinferrequest_to_types_raw(model_infer_request):
+    model_input = model_infer_request.inputs[0]
+    data = np.array(model_input.contents.int_contents, dtype="<i4")
+    model_input.ClearField("contents")
+    model_infer_request.raw_input_contents.append(data.tobytes())
+
+    inference_request = ModelInferRequestConverter.to_types(model_infer_request)
+
+    request_input = inference_request.inputs[0]
+    assert isinstance(request_input.data.__root__, np.ndarray)
+    np.testing.assert_array_equal(request_input.data.__root__, [1, 2, 3])
+
+    decoded = NumpyCodec.decode(request_input)
+    np.testing.assert_array_equal(decoded, [[1, 2, 3]])
+
+
+@pytest.mark.parametrize("num_inputs, num_raw_contents", [(1, 2), (2, 1)])
+def test_modelinferrequest_to_types_raw_mismatch(
+    model_infer_request, num_inputs: int, num_raw_contents: int
+):
+    model_input = model_infer_request.inputs[0]
+    model_input.ClearField("contents")
+    model_infer_request.inputs.extend([model_input] * (num_inputs - 1))
+
+    data = np.array([1, 2, 3], dtype="<i4")
+    model_infer_request.raw_input_contents.extend([data.tobytes()] * num_raw_contents)
+
+    with pytest.raises(InferenceError):
+        ModelInferRequestConverter.to_types(model_infer_request)
+
+
+def test_modelinferrequest_from_types_raw(inference_request):
+    model_infer_request = ModelInferRequestConverter.from_types(
+        inference_request, model_name="sum-model", model_version="", use_raw=True
+    )
+
+    assert not model_infer_request.inputs[0].HasField("contents")
+    assert len(model_infer_request.raw_input_contents) == 1
+
+    inference_request = ModelInferRequestConverter.to_types(model_infer_request)
+    np.testing.assert_array_equal(inference_request.inputs[0].data.__root__, [1, 2, 3])
+
+
+def test_modelinferresponse_from_types_fp16():
+    data = np.array([1.5, 2.5], dtype="float16")
+    inference_response = types.InferenceResponse(
+        model_name="my-model",
+        outputs=[
+            NumpyCodec.encode(name="foo", payload=data),
+            types.ResponseOutput(name="bar", datatype="INT32", shape=[1], data=[3]),
+        ],
+    )
+
+    model_infer_response = ModelInferResponseConverter.from_types(inference_response)
+
+    # FP16 can only be sent as raw contents, so every output should be raw
+    foo, bar = model_infer_response.raw_output_contents
+    np.testing.assert_array_equal(np.frombuffer(foo, dtype="<f2"), data)
+    np.testing.assert_array_equal(np.frombuffer(bar, dtype="<i4"), [3])
+    for output in model_infer_response.outputs:
+        assert not output.HasField("contents")
+
+
 def test_modelinferresponse_from_types(inference_response):
     model_infer_response = ModelInferResponseConverter.from_types(inference_response)
 
@@ -137,6 +203,17 @@ def test_parameters_from_types(grpc_parameters):
                 contents=pb.InferTensorContents(fp32_contents=[21.0]),
             ),
         ),
+        (
+            NumpyCodec.encode(
+                name="output-0", payload=np.array([[1, 2], [3, 4]], dtype="int32")
+            ),
+            pb.ModelInferResponse.InferOutputTensor(
+                name="output-0",
+                datatype="INT32",
+                shape=[2, 2],
+                contents=pb.InferTensorContents(int_contents=[1, 2, 3, 4]),
+            ),
+        ),
         (
             types.ResponseOutput(
                 name="output-0",
@@ -1,8 +1,11 @@
+import asyncio
+import numpy as np
 import pytest
 import grpc
 
 from mlserver.grpc import dataplane_pb2 as pb
 from mlserver.grpc import model_repository_pb2 as mr_pb
+from mlserver.grpc.converters import ArrowStreamParameter
 from mlserver import __version__
 
 
@@ -67,6 +70,168 @@ async def test_model_infer(
     assert prediction.outputs[0].contents == expected
 
 
+async def test_model_infer_raw(
+    inference_service_stub, model_infer_request, sum_model_settings
+):
+    model_infer_request.model_name = sum_model_settings.name
+    model_infer_request.ClearField("model_version")
+
+    # Move the input contents into the request's raw contents
+    model_input = model_infer_request.inputs[0]
+    data = np.array(model_input.contents.int_contents, dtype="<i4")
+    model_input.ClearField("contents")
+    model_infer_request.raw_input_contents.append(data.tobytes())
+
+    prediction = await inference_service_stub.ModelInfer(model_infer_request)
+
+    assert len(prediction.outputs) == 1
+    assert not prediction.outputs[0].HasField("contents")
+
+    (raw_output,) = prediction.raw_output_contents
+    total = np.frombuffer(raw_output, dtype="<i8")
+    np.testing.assert_array_equal(total, [6])
+
+
+async def test_model_infer_arrow(
+    inference_service_stub, model_infer_request, sum_model_settings
+):
+    pa = pytest.importorskip("pyarrow")
+
+    model_infer_request.model_name = sum_model_settings.name
+    model_infer_request.ClearField("model_version")
+
+    # Send the inputs as a single Arrow stream instead
+    model_input = model_infer_request.inputs[0]
+    table = pa.table(
+        {
+            model_input.name: pa.FixedSizeListArray.from_arrays(
+                pa.array(model_input.contents.int_contents, type=pa.int32()), 3
+            )
+        }
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    model_infer_request.ClearField("inputs")
+    model_infer_request.raw_input_contents.append(sink.getvalue().to_pybytes())
+    model_infer_request.parameters[ArrowStreamParameter].bool_param = True
+
+    prediction = await inference_service_stub.ModelInfer(model_infer_request)
+
+    assert len(prediction.outputs) == 0
+    assert prediction.parameters[ArrowStreamParameter].bool_param
+
+    (raw_output,) = prediction.raw_output_contents
+    total = pa.ipc.open_stream(raw_output).read_all()
+    assert total.column("total").to_pylist() == [[6]]
+
+
+async def test_model_stream_infer(
+    inference_service_stub, model_infer_request, sum_model_settings
+):
+    requests = []
+    for idx in range(5):
+        request = pb.ModelInferRequest()
+        request.CopyFrom(model_infer_request)
+        request.model_name = sum_model_settings.name
+        request.ClearField("model_version")
+        request.id = f"request-{idx}"
+        requests.append(request)
+
+    # Add a request which should fail
+    failed_request = pb.ModelInferRequest()
+    failed_request.CopyFrom(model_infer_request)
+    failed_request.model_name = "my-model"
+    failed_request.id = "request-failed"
+    requests.append(failed_request)
+
+    async def _request_iterator():
+        for request in requests:
+            yield request
+
+    stream = inference_service_stub.ModelStreamInfer(_request_iterator())
+    responses = {response.infer_response.id: response async for response in stream}
+
+    assert len(responses) == len(requests)
+
+    failed = responses.pop("request-failed")
+    assert failed.error_message == "Model my-model with version v1.2.3 not found"
+
+    expected = pb.InferTensorContents(int64_contents=[6])
+    for response in responses.values():
+        assert response.error_message == ""
+        assert response.infer_response.model_name == sum_model_settings.name
+        assert response.infer_response.outputs[0].contents == expected
+
+
+async def test_model_stream_infer_max_requests(
+    grpc_server, settings, model_infer_request, sum_model_settings, mocker
+):
+    settings.grpc_max_stream_requests = 2
+    model_infer_request.model_name = sum_model_settings.name
+    model_infer_request.ClearField("model_version")
+
+    read = 0
+
+    async def _request_iterator():
+        nonlocal read
+        for _ in range(5):
+            read += 1
+            yield model_infer_request
+
+    context = mocker.Mock()
+    context.invocation_metadata.return_value = ()
+    context.trailing_metadata.return_value = ()
+
+    servicer = grpc_server._inference_servicer
+    stream = servicer.ModelStreamInfer(_request_iterator(), context)
+    first = await stream.__anext__()
+
+    # While the first response is still being sent back, the stream shouldn't
+    # be read past the limit
+    await asyncio.sleep(0.1)
+    assert read == settings.grpc_max_stream_requests
+
+    rest = [response async for response in stream]
+    assert read == 5
+    assert len(rest) == 4
+    for response in [first, *rest]:
+        assert response.error_message == ""
+
+
+async def test_model_bulk_infer(
+    inference_service_stub, model_infer_request, sum_model_settings
+):
+    request = pb.ModelBulkInferRequest(model_name=sum_model_settings.name)
+    for idx in range(5):
+        model_infer_request.id = f"request-{idx}"
+        request.requests.append(model_infer_request)
+
+    stream = inference_service_stub.ModelBulkInfer(request)
+    responses = {response.infer_response.id: response async for response in stream}
+
+    assert len(responses) == len(request.requests)
+
+    expected = pb.InferTensorContents(int64_contents=[6])
+    for response in responses.values():
+        assert response.error_message == ""
+        assert response.infer_response.outputs[0].contents == expected
+
+
+async def test_model_bulk_infer_error(inference_service_stub, model_infer_request):
+    request = pb.ModelBulkInferRequest(
+        model_name="my-model", requests=[model_infer_request]
+    )
+
+    with pytest.raises(grpc.RpcError) as err:
+        async for _ in inference_service_stub.ModelBulkInfer(request):
+            pass
+
+    assert err.value.code() == grpc.StatusCode.NOT_FOUND
+    assert "Model my-model" in err.value.details()
+
+
 async def test_model_infer_headers(
     inference_service_stub, model_infer_request, sum_model_settings
 ):
@@ -93,6 +258,17 @@ async def test_model_infer_error(inference_service_stub, model_infer_request):
     assert err.value.details() == "Model my-model with version v1.2.3 not found"
 
 
+async def test_model_infer_deadline_exceeded(
+    inference_service_stub, model_infer_request
+):
+    model_infer_request.parameters["timeout"].int64_param = 0
+
+    with pytest.raises(grpc.RpcError) as err:
+        await inference_service_stub.ModelInfer(model_infer_request)
+
+    assert err.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+
+
 async def test_model_repository_index(
     model_repository_service_stub, grpc_repository_index_request
 ):
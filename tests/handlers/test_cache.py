@@ -0,0 +1,107 @@
+import pytest
+
+from prometheus_client.registry import REGISTRY
+
+from mlserver.handlers.cache import ResponseCache, get_response_size
+from mlserver.handlers.dataplane import DataPlane
+from mlserver.handlers.metrics import CacheHitsMetricName, CacheMissesMetricName
+from mlserver.types import InferenceRequest, InferenceResponse, ResponseOutput
+
+from ..fixtures import SumModel
+
+
+def _new_response(num_elems: int = 2) -> InferenceResponse:
+    return InferenceResponse(
+        model_name="my-model",
+        outputs=[
+            ResponseOutput(
+                name="foo",
+                datatype="INT32",
+                shape=[1, num_elems],
+                data=list(range(num_elems)),
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def cached_model(sum_model: SumModel) -> SumModel:
+    sum_model.settings.response_cache_size = 10
+    return sum_model
+
+
+def test_get_response_size():
+    assert get_response_size(_new_response(num_elems=3)) == 12
+
+
+def test_lru_eviction():
+    cache = ResponseCache("my-model", None, max_entries=2)
+    cache.put("a", _new_response())
+    cache.put("b", _new_response())
+
+    # Reading an entry should make it the most recently used
+    assert cache.get("a") is not None
+    cache.put("c", _new_response())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert len(cache) == 2
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+
+def test_max_bytes():
+    cache = ResponseCache("my-model", None, max_entries=10, max_bytes=20)
+    cache.put("a", _new_response(num_elems=2))
+    cache.put("b", _new_response(num_elems=2))
+    cache.put("c", _new_response(num_elems=2))
+
+    assert cache.get("a") is None
+    assert cache.size_bytes == 16
+
+    # Responses larger than the cache should never be stored
+    cache.put("d", _new_response(num_elems=10))
+    assert cache.get("d") is None
+    assert len(cache) == 2
+
+
+def test_ttl(mocker):
+    monotonic = mocker.patch("mlserver.handlers.cache.time.monotonic")
+    monotonic.return_value = 100
+
+    cache = ResponseCache("my-model", None, max_entries=10, ttl=5)
+    cache.put("a", _new_response())
+    assert cache.get("a") is not None
+
+    monotonic.return_value = 105
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+async def test_infer_cached(
+    data_plane: DataPlane,
+    cached_model: SumModel,
+    inference_request: InferenceRequest,
+    mocker,
+):
+    predict = mocker.spy(cached_model, "predict")
+
+    for idx in range(3):
+        payload = inference_request.copy(deep=True)
+        payload.id = f"request-{idx}"
+        prediction = await data_plane.infer(
+            payload, name=cached_model.name, version=cached_model.version
+        )
+
+        assert prediction.id == payload.id
+        assert prediction.outputs[0].data.__root__ == [6]
+
+    assert predict.call_count == 1
+
+    labels = {"model_name": cached_model.name, "model_version": cached_model.version}
+    hits = REGISTRY.get_sample_value(f"{CacheHitsMetricName}_total", labels=labels)
+    misses = REGISTRY.get_sample_value(f"{CacheMissesMetricName}_total", labels=labels)
+    assert hits == 2
+    assert misses == 1
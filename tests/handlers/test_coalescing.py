@@ -0,0 +1,168 @@
+import asyncio
+import pytest
+import numpy as np
+
+from mlserver.handlers.coalescing import RequestCoalescer, get_request_key
+from mlserver.handlers.dataplane import DataPlane
+from mlserver.types import (
+    InferenceRequest,
+    InferenceResponse,
+    Parameters,
+    RequestInput,
+)
+
+from ..fixtures import SumModel
+
+
+@pytest.fixture
+def coalesced_model(sum_model: SumModel) -> SumModel:
+    sum_model.settings.coalesce_requests = True
+    return sum_model
+
+
+def test_get_request_key(sum_model: SumModel, inference_request: InferenceRequest):
+    key = get_request_key(sum_model, inference_request)
+
+    duplicate = inference_request.copy(deep=True)
+    duplicate.id = "another-id"
+    duplicate.parameters = Parameters(headers={"x-foo": "bar"})
+    assert get_request_key(sum_model, duplicate) == key
+
+    different = inference_request.copy(deep=True)
+    different.inputs[0].data.__root__ = [4, 5, 6]
+    assert get_request_key(sum_model, different) != key
+
+
+@pytest.mark.parametrize(
+    "other, expected",
+    [
+        (
+            RequestInput(
+                name="foo", shape=[4], datatype="FP32", data=np.arange(4, dtype="f4")
+            ),
+            True,
+        ),
+        (
+            RequestInput(name="bar", shape=[4], datatype="FP32", data=[0, 1, 2, 3]),
+            False,
+        ),
+        (
+            RequestInput(name="foo", shape=[2, 2], datatype="FP32", data=[0, 1, 2, 3]),
+            False,
+        ),
+        (
+            RequestInput(name="foo", shape=[4], datatype="FP64", data=[0, 1, 2, 3]),
+            False,
+        ),
+        (
+            RequestInput(name="foo", shape=[4], datatype="FP32", data=[0, 1, 2, 4]),
+            False,
+        ),
+    ],
+)
+def test_get_request_key_tensors(
+    sum_model: SumModel, other: RequestInput, expected: bool
+):
+    request_input = RequestInput(
+        name="foo", shape=[4], datatype="FP32", data=[0, 1, 2, 3]
+    )
+    key = get_request_key(sum_model, InferenceRequest(inputs=[request_input]))
+    other_key = get_request_key(sum_model, InferenceRequest(inputs=[other]))
+
+    assert (other_key == key) == expected
+
+
+def test_get_request_key_bytes(sum_model: SumModel):
+    first = RequestInput(name="foo", shape=[2], datatype="BYTES", data=[b"ab", b"c"])
+    second = RequestInput(name="foo", shape=[2], datatype="BYTES", data=[b"a", b"bc"])
+
+    key = get_request_key(sum_model, InferenceRequest(inputs=[first]))
+    assert get_request_key(sum_model, InferenceRequest(inputs=[second])) != key
+
+
+async def test_coalesce():
+    coalescer = RequestCoalescer()
+    calls = []
+
+    async def _predict() -> InferenceResponse:
+        calls.append(None)
+        await asyncio.sleep(0.1)
+        return InferenceResponse(model_name="my-model", outputs=[])
+
+    responses = await asyncio.gather(
+        *[coalescer.coalesce("my-key", _predict) for _ in range(5)]
+    )
+
+    assert len(calls) == 1
+    assert len({id(response) for response in responses}) == 5
+    assert coalescer._in_flight == {}
+
+
+async def test_coalesce_errors():
+    coalescer = RequestCoalescer()
+
+    async def _predict() -> InferenceResponse:
+        await asyncio.sleep(0.1)
+        raise ValueError("foo")
+
+    results = await asyncio.gather(
+        *[coalescer.coalesce("my-key", _predict) for _ in range(3)],
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+async def test_infer_coalesced(
+    data_plane: DataPlane,
+    coalesced_model: SumModel,
+    inference_request: InferenceRequest,
+    mocker,
+):
+    predict = mocker.spy(coalesced_model, "predict")
+
+    payloads = []
+    for idx in range(3):
+        payload = inference_request.copy(deep=True)
+        payload.id = f"request-{idx}"
+        payloads.append(payload)
+
+    predictions = await asyncio.gather(
+        *[
+            data_plane.infer(
+                payload, name=coalesced_model.name, version=coalesced_model.version
+            )
+            for payload in payloads
+        ]
+    )
+
+    assert predict.call_count == 1
+    for payload, prediction in zip(payloads, predictions):
+        assert prediction.id == payload.id
+        assert prediction.outputs[0].data.__root__ == [6]
+
+
+async def test_infer_coalesced_raw(
+    data_plane: DataPlane,
+    coalesced_model: SumModel,
+    inference_request: InferenceRequest,
+    mocker,
+):
+    predict = mocker.spy(coalesced_model, "predict")
+
+    # Binary (or raw) payloads get loaded as arrays instead of lists
+    raw_request = inference_request.copy(deep=True)
+    request_input = raw_request.inputs[0]
+    request_input.data.__root__ = np.array(request_input.data.__root__, dtype="i4")
+
+    predictions = await asyncio.gather(
+        *[
+            data_plane.infer(
+                payload, name=coalesced_model.name, version=coalesced_model.version
+            )
+            for payload in [inference_request, raw_request]
+        ]
+    )
+
+    assert predict.call_count == 1
+    assert predictions[0].outputs == predictions[1].outputs
@@ -1,6 +1,7 @@
 import pytest
 import uuid
 
+from mlserver.errors import ModelNotFound
 from mlserver.settings import ModelSettings, ModelParameters
 from mlserver.types import MetadataTensor
 
@@ -99,3 +100,30 @@ async def test_infer_generates_uuid(data_plane, sum_model, inference_request):
 
     assert prediction.id is not None
     assert prediction.id == str(uuid.UUID(prediction.id))
+
+
+async def test_infer_bulk(data_plane, sum_model, inference_request):
+    payloads = []
+    for idx in range(4):
+        payload = inference_request.copy(deep=True)
+        payload.id = f"request-{idx}"
+        payloads.append(payload)
+
+    # Make the last request fail, by sending a 1D tensor
+    payloads[-1].inputs[0].shape = [3]
+
+    results = await data_plane.infer_bulk(
+        payloads, name=sum_model.name, version=sum_model.version
+    )
+    responses = {idx: result async for idx, result in results}
+
+    assert len(responses) == len(payloads)
+    assert isinstance(responses.pop(3), Exception)
+    for idx, prediction in responses.items():
+        assert prediction.id == payloads[idx].id
+        assert prediction.outputs[0].data.__root__ == [6]
+
+
+async def test_infer_bulk_not_found(data_plane, inference_request):
+    with pytest.raises(ModelNotFound):
+        await data_plane.infer_bulk([inference_request], name="my-model")
@@ -52,3 +52,34 @@ async def test_grpc_metrics(
     assert grpc_server_handled is not None
     assert len(grpc_server_handled.samples) == 1
     assert grpc_server_handled.samples[0].value == expected_handled
+
+
+async def test_grpc_stream_metrics(
+    metrics_client: MetricsClient,
+    inference_service_stub: GRPCInferenceServiceStub,
+    model_infer_request: pb.ModelInferRequest,  # noqa: F811
+):
+    await metrics_client.wait_until_ready()
+
+    expected_msgs = 5
+
+    async def _request_iterator():
+        for _ in range(expected_msgs):
+            yield model_infer_request
+
+    stream = inference_service_stub.ModelStreamInfer(_request_iterator())
+    responses = [response async for response in stream]
+    assert len(responses) == expected_msgs
+
+    for metric_name in ["grpc_server_msg_received", "grpc_server_msg_sent"]:
+        metrics = await metrics_client.metrics()
+        metric = find_metric(metrics, metric_name)
+        assert metric is not None
+        assert len(metric.samples) == 1
+        assert metric.samples[0].value == expected_msgs
+
+    metrics = await metrics_client.metrics()
+    grpc_server_handled = find_metric(metrics, "grpc_server_handled")
+    assert grpc_server_handled is not None
+    assert grpc_server_handled.samples[0].labels["grpc_type"] == "BIDI_STREAMING"
+    assert grpc_server_handled.samples[0].value == 1
@@ -0,0 +1,157 @@
+import asyncio
+import pickle
+import pytest
+import numpy as np
+
+from multiprocessing import Queue
+from multiprocessing.shared_memory import SharedMemory
+from types import SimpleNamespace
+from prometheus_client.registry import REGISTRY
+
+from mlserver.parallel.dispatcher import Dispatcher
+from mlserver.parallel.errors import WorkerError
+from mlserver.parallel.messages import (
+    ModelRequestMessage,
+    ModelResponseMessage,
+    SerialisedResponse,
+)
+from mlserver.parallel.metrics import QueueSizeMetricName
+from mlserver.parallel.shm import release, to_shared_memory
+from mlserver.types import InferenceResponse, ResponseOutput
+
+
+@pytest.fixture
+def request_message() -> ModelRequestMessage:
+    return ModelRequestMessage(
+        model_name="sum-model", model_version="v1.2.3", method_name="predict"
+    )
+
+
+@pytest.fixture
+def dispatcher() -> Dispatcher:
+    # The selection logic only needs to know about the worker PIDs
+    workers = [SimpleNamespace(pid=pid) for pid in [100, 101, 102]]
+    return Dispatcher(workers)  # type: ignore
+
+
+def test_select_least_loaded(
+    dispatcher: Dispatcher, request_message: ModelRequestMessage
+):
+    dispatcher._in_flight = [3, 1, 2]
+
+    assert dispatcher._select_worker(request_message) == 1
+
+
+def test_select_spreads_ties(
+    dispatcher: Dispatcher, request_message: ModelRequestMessage
+):
+    selected = {dispatcher._select_worker(request_message) for _ in range(3)}
+
+    assert selected == {0, 1, 2}
+
+
+def test_select_model_affinity(request_message: ModelRequestMessage):
+    workers = [SimpleNamespace(pid=pid) for pid in [100, 101, 102]]
+    dispatcher = Dispatcher(workers, model_affinity=True)  # type: ignore
+
+    first = dispatcher._select_worker(request_message)
+    assert dispatcher._select_worker(request_message) == first
+
+    # Affinity should only apply while the worker is one of the least loaded
+    dispatcher._in_flight[first] = 1
+    assert dispatcher._select_worker(request_message) != first
+
+
+def test_queue_size_metric(dispatcher: Dispatcher):
+    dispatcher._in_flight = [3, 1, 0]
+    dispatcher._queue_size_collector.register()
+
+    try:
+        for worker_pid, expected in [("100", 3), ("101", 1), ("102", 0)]:
+            queue_size = REGISTRY.get_sample_value(
+                QueueSizeMetricName, labels={"worker_pid": worker_pid}
+            )
+            assert queue_size == expected
+    finally:
+        dispatcher._queue_size_collector.unregister()
+
+
+@pytest.fixture
+def shared_response() -> ModelResponseMessage:
+    data = np.arange(32 * 1024, dtype=np.int32)
+    inference_response = InferenceResponse(
+        model_name="sum-model",
+        outputs=[
+            ResponseOutput(name="foo", datatype="INT32", shape=[data.size], data=data)
+        ],
+    )
+    shared, segment = to_shared_memory(inference_response)
+    assert segment is not None
+    release(segment)
+
+    return ModelResponseMessage(return_value=shared)
+
+
+def _is_unlinked(response: ModelResponseMessage) -> bool:
+    segment_name = response.return_value.outputs[0].data.__root__.segment
+    try:
+        release(SharedMemory(name=segment_name), unlink=True)
+        return False
+    except FileNotFoundError:
+        return True
+
+
+def test_hand_over_unknown(
+    dispatcher: Dispatcher, shared_response: ModelResponseMessage
+):
+    serialised = SerialisedResponse(
+        id=shared_response.id, data=pickle.dumps(shared_response)
+    )
+    dispatcher._hand_over(serialised)
+
+    assert _is_unlinked(shared_response)
+
+
+async def test_process_response_done(
+    dispatcher: Dispatcher, shared_response: ModelResponseMessage
+):
+    async_response = asyncio.get_running_loop().create_future()
+    async_response.cancel()
+
+    dispatcher._process_response(async_response, shared_response)
+
+    assert _is_unlinked(shared_response)
+
+
+def _fail():
+    raise ValueError("Broken response")
+
+
+class _BrokenResponse:
+    def __reduce__(self):
+        return (_fail, ())
+
+
+async def test_read_responses_errors(request_message: ModelRequestMessage):
+    responses: Queue = Queue()
+    worker = SimpleNamespace(pid=100, responses=responses, send=lambda msg: None)
+    dispatcher = Dispatcher([worker])  # type: ignore
+    dispatcher.start()
+
+    try:
+        async_response = asyncio.create_task(
+            dispatcher.dispatch_request(request_message)
+        )
+        await asyncio.sleep(0.1)
+
+        # Neither broken messages on the queue, nor broken responses, should
+        # stop the reader
+        responses.put(_BrokenResponse())
+        responses.put(SerialisedResponse(id=request_message.id, data=b"broken"))
+
+        with pytest.raises(WorkerError):
+            await asyncio.wait_for(async_response, timeout=5)
+
+        assert dispatcher._reader.is_alive()
+    finally:
+        dispatcher.stop()
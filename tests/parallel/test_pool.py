@@ -0,0 +1,216 @@
+import asyncio
+import pytest
+
+from mlserver.parallel.pool import InferencePool, _InferencePoolAttr
+from mlserver.registry import MultiModelRegistry
+from mlserver.model import MLModel
+from mlserver.settings import Settings, ModelSettings, ModelParameters
+from mlserver.types import InferenceRequest, InferenceResponse, MetadataModelResponse
+from mlserver.handlers.custom import get_custom_handlers
+
+from ..fixtures import SumModel
+
+
+@pytest.fixture
+async def loaded_pool(
+    inference_pool: InferencePool, sum_model: MLModel
+) -> InferencePool:
+    await inference_pool.load_model(sum_model)
+    return inference_pool
+
+
+async def test_pool_workers(inference_pool: InferencePool, settings: Settings):
+    workers = inference_pool._workers
+
+    assert len(workers) == settings.parallel_workers
+    for worker in workers:
+        assert worker.is_alive()
+
+
+async def test_pool_predict(
+    loaded_pool: InferencePool, sum_model: MLModel, inference_request: InferenceRequest
+):
+    response = await loaded_pool.predict(sum_model, inference_request)
+
+    assert response is not None
+    assert isinstance(response, InferenceResponse)
+    assert len(response.outputs) == 1
+
+
+async def test_pool_predict_concurrent(
+    loaded_pool: InferencePool, sum_model: MLModel, inference_request: InferenceRequest
+):
+    num_requests = 20
+    requests = []
+    for idx in range(num_requests):
+        request = inference_request.copy(deep=True)
+        request.id = f"request-{idx}"
+        request.inputs[0].data.__root__ = [idx, idx, idx]
+        requests.append(request)
+
+    responses = await asyncio.gather(
+        *[loaded_pool.predict(sum_model, r) for r in requests]
+    )
+
+    for idx, response in enumerate(responses):
+        assert response.id == f"request-{idx}"
+        assert response.outputs[0].data.__root__ == [idx * 3]
+
+
+async def test_pool_predict_error(
+    loaded_pool: InferencePool, sum_model: MLModel, inference_request: InferenceRequest
+):
+    inference_request.inputs[0].data.__root__ = ["not", "a", "number"]
+
+    with pytest.raises(ValueError):
+        await loaded_pool.predict(sum_model, inference_request)
+
+
+async def test_parallel_predict(
+    loaded_pool: InferencePool, sum_model: MLModel, inference_request: InferenceRequest
+):
+    response = await sum_model.predict(inference_request)
+
+    assert response is not None
+    assert isinstance(response, InferenceResponse)
+    assert len(response.outputs) == 1
+
+
+async def test_parallel_metadata(loaded_pool: InferencePool, sum_model: MLModel):
+    metadata = await sum_model.metadata()
+
+    assert isinstance(metadata, MetadataModelResponse)
+    assert metadata.name == sum_model.name
+
+
+async def test_parallel_custom_handler(loaded_pool: InferencePool, sum_model: SumModel):
+    total = await sum_model.my_payload(payload=[1, 2, 3])
+
+    assert total == 6
+
+    # Custom handlers should keep their metadata, so that they can still get
+    # exposed as endpoints
+    assert get_custom_handlers(sum_model)[0][1] == sum_model.my_payload
+
+
+async def test_pool_multiple_models(
+    loaded_pool: InferencePool,
+    model_registry: MultiModelRegistry,
+    sum_model_settings: ModelSettings,
+    inference_request: InferenceRequest,
+):
+    new_model_settings = sum_model_settings.copy(deep=True)
+    new_model_settings.name = "sum-model-2"
+    await model_registry.load(new_model_settings)
+    new_model = await model_registry.get_model(new_model_settings.name)
+
+    workers = list(loaded_pool._workers)
+    await loaded_pool.load_model(new_model)
+
+    response = await new_model.predict(inference_request)
+    assert response.model_name == new_model_settings.name
+
+    # Both models should be served by the same workers
+    assert list(loaded_pool._workers) == workers
+    assert len(loaded_pool._models) == 2
+
+
+async def test_close(inference_pool: InferencePool):
+    workers = list(inference_pool._workers)
+
+    await inference_pool.close()
+
+    assert len(inference_pool._workers) == 0
+    for worker in workers:
+        assert not worker.is_alive()
+
+
+async def test_load_model(loaded_pool: InferencePool, sum_model: MLModel):
+    assert getattr(sum_model, _InferencePoolAttr) is loaded_pool
+
+
+async def test_load_model_in_progress(
+    inference_pool: InferencePool, sum_model: MLModel, mocker
+):
+    predict = sum_model.predict
+    dispatch_update = inference_pool._dispatcher.dispatch_update
+
+    async def _dispatch_update(*args, **kwargs):
+        # Methods shouldn't be routed to the workers until they've all
+        # acknowledged the load
+        assert sum_model.predict == predict
+        assert not hasattr(sum_model, _InferencePoolAttr)
+        return await dispatch_update(*args, **kwargs)
+
+    mocker.patch.object(inference_pool._dispatcher, "dispatch_update", _dispatch_update)
+    await inference_pool.load_model(sum_model)
+
+    assert sum_model.predict != predict
+    assert getattr(sum_model, _InferencePoolAttr) is inference_pool
+
+
+async def test_load_model_error(
+    inference_pool: InferencePool, sum_model: MLModel, mocker
+):
+    predict = sum_model.predict
+    mocker.patch.object(
+        inference_pool._dispatcher,
+        "dispatch_update",
+        side_effect=RuntimeError("Failed to load model"),
+    )
+
+    with pytest.raises(RuntimeError):
+        await inference_pool.load_model(sum_model)
+
+    assert sum_model.predict == predict
+    assert not hasattr(sum_model, _InferencePoolAttr)
+    assert len(inference_pool._models) == 0
+
+
+async def test_dont_load_if_disabled(inference_pool: InferencePool, sum_model: MLModel):
+    sum_model.settings.parallel_workers = 0
+
+    await inference_pool.load_model(sum_model)
+    assert not hasattr(sum_model, _InferencePoolAttr)
+
+
+async def test_unload_model(loaded_pool: InferencePool, sum_model: MLModel):
+    await loaded_pool.unload_model(sum_model)
+
+    assert not hasattr(sum_model, _InferencePoolAttr)
+    assert len(loaded_pool._models) == 0
+
+
+async def test_unload_replaced_model(
+    loaded_pool: InferencePool,
+    sum_model: MLModel,
+    sum_model_settings: ModelSettings,
+    inference_request: InferenceRequest,
+):
+    # Simulate a reload, where the new instance gets loaded before the old one
+    # gets unloaded
+    new_model = sum_model.__class__(sum_model_settings)
+    await new_model.load()
+    await loaded_pool.load_model(new_model)
+    await loaded_pool.unload_model(sum_model)
+
+    response = await new_model.predict(inference_request)
+    assert isinstance(response, InferenceResponse)
+
+
+async def test_unload_model_version(
+    loaded_pool: InferencePool,
+    model_registry: MultiModelRegistry,
+    sum_model_settings: ModelSettings,
+):
+    new_model_settings = sum_model_settings.copy(deep=True)
+    new_model_settings.parameters = ModelParameters(version="v2")
+    await model_registry.load(new_model_settings)
+    new_model = await model_registry.get_model(
+        new_model_settings.name, new_model_settings.parameters.version
+    )
+
+    await loaded_pool.load_model(new_model)
+    await loaded_pool.unload_model(new_model)
+
+    assert len(loaded_pool._models) == 1
@@ -0,0 +1,34 @@
+import pickle
+
+from starlette.requests import Request
+
+from mlserver.parallel.requests import serialise_request, deserialise_request
+
+
+def _receive_body(body: bytes):
+    async def _receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return _receive
+
+
+async def test_serialise_request():
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/invocations",
+        "query_string": b"foo=bar",
+        "headers": [(b"content-type", b"application/json")],
+        "app": object(),
+    }
+    request = Request(scope, _receive_body(b'{"foo": "bar"}'))
+
+    serialised = await serialise_request(request)
+    deserialised = deserialise_request(pickle.loads(pickle.dumps(serialised)))
+
+    assert "app" not in deserialised.scope
+    assert deserialised.method == "POST"
+    assert deserialised.url.path == "/invocations"
+    assert deserialised.query_params["foo"] == "bar"
+    assert deserialised.headers["content-type"] == "application/json"
+    assert await deserialised.json() == {"foo": "bar"}
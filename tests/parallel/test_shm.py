@@ -0,0 +1,96 @@
+import pytest
+import numpy as np
+
+from mlserver.parallel import shm
+from mlserver.parallel.pool import InferencePool
+from mlserver.parallel.shm import (
+    SharedTensor,
+    to_shared_memory,
+    from_shared_memory,
+    release,
+)
+from mlserver.model import MLModel
+from mlserver.types import InferenceRequest, InferenceResponse, RequestInput
+
+
+@pytest.fixture
+def large_request() -> InferenceRequest:
+    data = list(range(32 * 1024))
+    return InferenceRequest(
+        inputs=[
+            RequestInput(
+                name="input-0", datatype="INT32", shape=[1, len(data)], data=data
+            ),
+            RequestInput(name="bar", datatype="BYTES", shape=[2], data=["a", "b"]),
+        ]
+    )
+
+
+def test_to_shared_memory(large_request: InferenceRequest):
+    shared, segment = to_shared_memory(large_request)
+
+    try:
+        assert segment is not None
+        assert shared is not large_request
+
+        foo, bar = shared.inputs
+        assert isinstance(foo.data.__root__, SharedTensor)
+        assert foo.data.__root__.segment == segment.name
+        assert foo.data.__root__.shape == [32 * 1024]
+        assert bar.data == large_request.inputs[1].data
+
+        # Original request must be left untouched
+        assert isinstance(large_request.inputs[0].data.__root__, list)
+    finally:
+        release(segment, unlink=True)
+
+
+def test_to_shared_memory_small(inference_request: InferenceRequest):
+    shared, segment = to_shared_memory(inference_request)
+
+    assert segment is None
+    assert shared is inference_request
+
+
+@pytest.mark.parametrize("copy", [True, False])
+def test_from_shared_memory(large_request: InferenceRequest, copy: bool):
+    shared, segment = to_shared_memory(large_request)
+
+    attached, attached_segment = from_shared_memory(shared, copy=copy)
+    try:
+        foo = attached.inputs[0]
+        expected = large_request.inputs[0].data.__root__
+        assert isinstance(foo.data.__root__, np.ndarray)
+        assert foo.data.__root__.dtype == np.int32
+        np.testing.assert_array_equal(foo.data.__root__, expected)
+
+        shared_data = np.frombuffer(attached_segment.buf, dtype=np.uint8)
+        assert np.shares_memory(foo.data.__root__, shared_data) != copy
+        del shared_data
+    finally:
+        del foo, attached
+        release(attached_segment)
+        release(segment, unlink=True)
+
+
+async def test_pool_predict_shared_memory(
+    inference_pool: InferencePool, sum_model: MLModel, large_request: InferenceRequest
+):
+    large_request.inputs = large_request.inputs[:1]
+    await inference_pool.load_model(sum_model)
+
+    response = await inference_pool.predict(sum_model, large_request)
+
+    assert isinstance(response, InferenceResponse)
+    assert response.outputs[0].data.__root__ == [sum(range(32 * 1024))]
+
+
+def test_threshold(monkeypatch, inference_request: InferenceRequest):
+    monkeypatch.setattr(shm, "SharedMemoryThreshold", 0)
+
+    shared, segment = to_shared_memory(inference_request)
+    try:
+        assert segment is not None
+        assert isinstance(shared.inputs[0].data.__root__, SharedTensor)
+    finally:
+        release(segment, unlink=True)
@@ -0,0 +1,86 @@
+import os
+import signal
+import asyncio
+import pytest
+
+from prometheus_client.registry import REGISTRY
+
+from mlserver.parallel.errors import WorkerStopped
+from mlserver.parallel.pool import InferencePool
+from mlserver.parallel.metrics import WorkerRestartsMetricName
+from mlserver.parallel.supervisor import WorkerDied, WorkerHung
+from mlserver.registry import MultiModelRegistry
+from mlserver.model import MLModel
+from mlserver.settings import Settings, ModelSettings
+from mlserver.types import InferenceRequest, InferenceResponse
+
+from ..fixtures import SlowModel
+
+
+async def _wait_for_restart(pool: InferencePool, previous_pid: int):
+    for _ in range(100):
+        worker = pool._workers[0]
+        if worker.pid != previous_pid and worker.heartbeat.value:
+            return
+
+        await asyncio.sleep(0.1)
+
+    raise TimeoutError(f"Worker with PID {previous_pid} wasn't restarted")
+
+
+def _get_restarts(reason: str) -> float:
+    return REGISTRY.get_sample_value(
+        f"{WorkerRestartsMetricName}_total", labels={"reason": reason}
+    )
+
+
+@pytest.mark.parametrize("fork_workers", [False, True])
+async def test_restart_dead_worker(
+    settings: Settings,
+    sum_model: MLModel,
+    inference_request: InferenceRequest,
+    fork_workers: bool,
+):
+    settings.parallel_fork_workers = fork_workers
+    pool = InferencePool(settings)
+    await pool.load_model(sum_model)
+
+    try:
+        dead_pid = pool._workers[0].pid
+        os.kill(dead_pid, signal.SIGKILL)
+        await _wait_for_restart(pool, dead_pid)
+
+        assert _get_restarts(WorkerDied) == 1
+        assert len(pool._workers) == settings.parallel_workers
+
+        # The new worker should also have the model loaded
+        responses = await asyncio.gather(
+            *[sum_model.predict(inference_request) for _ in range(4)]
+        )
+        for response in responses:
+            assert isinstance(response, InferenceResponse)
+    finally:
+        await pool.close()
+
+
+async def test_restart_hung_worker(
+    settings: Settings, model_registry: MultiModelRegistry
+):
+    settings.parallel_workers = 1
+    settings.parallel_worker_timeout = 1
+    pool = InferencePool(settings)
+
+    slow_model_settings = ModelSettings(name="slow-model", implementation=SlowModel)
+    await model_registry.load(slow_model_settings)
+    slow_model = await model_registry.get_model(slow_model_settings.name)
+    await pool.load_model(slow_model)
+
+    try:
+        hung_pid = pool._workers[0].pid
+        with pytest.raises(WorkerStopped):
+            await slow_model.predict(InferenceRequest(inputs=[]))
+
+        await _wait_for_restart(pool, hung_pid)
+        assert _get_restarts(WorkerHung) == 1
+    finally:
+        await pool.close()
@@ -0,0 +1,79 @@
+import asyncio
+import pickle
+import pytest
+
+from threading import Lock
+
+from mlserver.parallel.errors import WorkerError
+from mlserver.parallel.messages import ModelRequestMessage, ModelResponseMessage
+from mlserver.parallel.worker import Worker
+
+from ..fixtures import SumModel
+
+
+@pytest.fixture
+def worker(sum_model: SumModel, mocker) -> Worker:
+    worker = Worker()
+    worker._model_registry = mocker.Mock()
+    worker._model_registry.get_model = mocker.AsyncMock(return_value=sum_model)
+    return worker
+
+
+def test_worker_error_picklable():
+    err = WorkerError(TypeError("foo"))
+
+    unpickled = pickle.loads(pickle.dumps(err))
+
+    assert isinstance(unpickled, WorkerError)
+    assert str(unpickled) == str(err)
+
+
+def _get_response(worker: Worker) -> ModelResponseMessage:
+    serialised = worker.responses.get(timeout=1)
+    response = pickle.loads(serialised.data)
+
+    assert serialised.id == response.id
+    return response
+
+
+async def test_send_response_unpicklable(worker: Worker, sum_model: SumModel, mocker):
+    async def _my_payload(payload: list) -> Lock:
+        return Lock()
+
+    mocker.patch.object(sum_model, "my_payload", _my_payload)
+    worker._tasks = set()
+    request = ModelRequestMessage(
+        model_name=sum_model.name,
+        model_version=sum_model.version,
+        method_name="my_payload",
+        method_args=[[1, 2, 3]],
+    )
+
+    worker._schedule(request)
+    await asyncio.sleep(0.1)
+
+    response = _get_response(worker)
+    assert response.id == request.id
+    assert response.return_value is None
+    assert isinstance(response.exception, WorkerError)
+
+
+async def test_send_response_cancelled(worker: Worker, sum_model: SumModel, mocker):
+    async def _process_request(request: ModelRequestMessage):
+        await asyncio.Event().wait()
+
+    mocker.patch.object(worker, "_process_request", _process_request)
+    worker._tasks = set()
+    request = ModelRequestMessage(
+        model_name=sum_model.name, method_name="predict", method_args=[]
+    )
+
+    worker._schedule(request)
+    (task,) = worker._tasks
+    task.cancel()
+    await asyncio.sleep(0.1)
+
+    response = _get_response(worker)
+    assert response.id == request.id
+    assert isinstance(response.exception, WorkerError)
+    assert worker._tasks == set()
@@ -0,0 +1,92 @@
+import os
+import signal
+import pytest
+
+from mlserver.parallel.pool import InferencePool
+from mlserver.parallel.zygote import ForkedWorker
+from mlserver.model import MLModel
+from mlserver.settings import Settings
+from mlserver.types import InferenceRequest, InferenceResponse
+
+
+@pytest.fixture
+async def forked_pool(settings: Settings) -> InferencePool:
+    settings.parallel_fork_workers = True
+    pool = InferencePool(settings)
+
+    yield pool
+
+    await pool.close()
+
+
+async def test_forked_workers(forked_pool: InferencePool, settings: Settings):
+    workers = forked_pool._workers
+
+    assert forked_pool._zygote is not None
+    assert len(workers) == settings.parallel_workers
+    for worker in workers:
+        assert isinstance(worker, ForkedWorker)
+        assert worker.is_alive()
+        assert worker.pid != os.getpid()
+        assert worker.pid != forked_pool._zygote.pid
+
+
+async def test_load_model(forked_pool: InferencePool, sum_model: MLModel):
+    previous_pids = [worker.pid for worker in forked_pool._workers]
+
+    await forked_pool.load_model(sum_model)
+
+    # Workers should get re-forked, so that they inherit the new model
+    for previous_pid, worker in zip(previous_pids, forked_pool._workers):
+        assert worker.pid != previous_pid
+        assert worker.is_alive()
+
+
+async def test_load_model_stuck_worker(
+    forked_pool: InferencePool, sum_model: MLModel, inference_request: InferenceRequest
+):
+    # A stopped worker will ignore any request to exit (e.g. SIGTERM or the
+    # end of its queue)
+    stuck_worker = forked_pool._workers[0]
+    os.kill(stuck_worker.pid, signal.SIGSTOP)
+
+    await forked_pool.load_model(sum_model)
+
+    assert not stuck_worker.is_alive()
+    new_worker = forked_pool._workers[0]
+    assert new_worker.pid != stuck_worker.pid
+    assert new_worker.is_alive()
+
+    response = await sum_model.predict(inference_request)
+    assert isinstance(response, InferenceResponse)
+
+
+async def test_predict(
+    forked_pool: InferencePool, sum_model: MLModel, inference_request: InferenceRequest
+):
+    await forked_pool.load_model(sum_model)
+
+    response = await sum_model.predict(inference_request)
+
+    assert isinstance(response, InferenceResponse)
+    assert len(response.outputs) == 1
+
+
+async def test_unload_model(
+    forked_pool: InferencePool, sum_model: MLModel, inference_request: InferenceRequest
+):
+    await forked_pool.load_model(sum_model)
+    await forked_pool.unload_model(sum_model)
+
+    assert len(forked_pool._models) == 0
+
+
+async def test_close(forked_pool: InferencePool):
+    zygote = forked_pool._zygote
+    workers = list(forked_pool._workers)
+
+    await forked_pool.close()
+
+    assert not zygote.is_alive()
+    for worker in workers:
+        assert not worker.is_alive()
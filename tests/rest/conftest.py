@@ -5,7 +5,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from mlserver.handlers import DataPlane, ModelRepositoryHandlers
-from mlserver.parallel import load_inference_pool, unload_inference_pool
+from mlserver.parallel import InferencePool
 from mlserver.batching import load_batching
 from mlserver.rest import RESTServer
 from mlserver import Settings
@@ -18,6 +18,7 @@ async def rest_server(
     settings: Settings,
     data_plane: DataPlane,
     model_repository_handlers: ModelRepositoryHandlers,
+    inference_pool: InferencePool,
     sum_model: SumModel,
 ) -> RESTServer:
     server = RESTServer(
@@ -26,16 +27,15 @@ async def rest_server(
         model_repository_handlers=model_repository_handlers,
     )
 
-    await asyncio.gather(
-        server.add_custom_handlers(sum_model),
-        load_inference_pool(sum_model),
-        load_batching(sum_model),
-    )
+    await inference_pool.load_model(sum_model)
+    await server.add_custom_handlers(sum_model)
+    await load_batching(sum_model)
 
     yield server
 
     await asyncio.gather(
-        server.delete_custom_handlers(sum_model), unload_inference_pool(sum_model)
+        server.delete_custom_handlers(sum_model),
+        inference_pool.unload_model(sum_model),
     )
 
 
@@ -0,0 +1,188 @@
+import json
+import struct
+import numpy as np
+import pytest
+
+from typing import Any
+
+from mlserver.codecs import CodecError
+from mlserver.errors import InferenceError
+from mlserver.rest.binary import (
+    InferenceHeaderContentLength,
+    decode_binary_request,
+    encode_binary_response,
+    get_binary_outputs,
+)
+from mlserver.types import (
+    InferenceRequest,
+    InferenceResponse,
+    Parameters,
+    RequestOutput,
+    ResponseOutput,
+)
+
+
+def _to_binary_request(inputs: list) -> bytes:
+    header = {"inputs": []}
+    buffers = []
+    for name, datatype, shape, buffer in inputs:
+        header["inputs"].append(
+            {
+                "name": name,
+                "datatype": datatype,
+                "shape": shape,
+                "parameters": {"binary_data_size": len(buffer)},
+            }
+        )
+        buffers.append(buffer)
+
+    return json.dumps(header).encode(), b"".join(buffers)
+
+
+def test_decode_binary_request():
+    floats = np.array([1.5, 2.5, 3.5], dtype="<f4")
+    strings = struct.pack("<I", 3) + b"foo" + struct.pack("<I", 2) + b"ba"
+    header, binary_data = _to_binary_request(
+        [
+            ("input-0", "FP32", [1, 3], floats.tobytes()),
+            ("input-1", "BYTES", [2], strings),
+        ]
+    )
+
+    decoded = decode_binary_request(json.loads(header), memoryview(binary_data))
+
+    input_0, input_1 = decoded["inputs"]
+    np.testing.assert_array_equal(input_0["data"], floats)
+    assert input_0["parameters"] == {}
+    assert input_1["data"] == [b"foo", b"ba"]
+
+
+def test_decode_binary_request_invalid_size():
+    header, binary_data = _to_binary_request(
+        [("input-0", "INT32", [1, 3], np.arange(2, dtype="<i4").tobytes())]
+    )
+
+    with pytest.raises(CodecError):
+        decode_binary_request(json.loads(header), memoryview(binary_data))
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        [],
+        {"inputs": {}},
+        {"inputs": ["input-0"]},
+        {"inputs": [{"name": "input-0", "parameters": ["foo"]}]},
+        {"inputs": [{"name": "input-0", "parameters": {"binary_data_size": "4"}}]},
+        {"inputs": [{"name": "input-0", "parameters": {"binary_data_size": -1}}]},
+    ],
+)
+def test_decode_binary_request_invalid_header(header: Any):
+    with pytest.raises(InferenceError):
+        decode_binary_request(header, memoryview(b""))
+
+
+@pytest.mark.parametrize(
+    "request_parameters, request_outputs, expected",
+    [
+        (None, None, set()),
+        (Parameters(binary_data_output=True), None, {"foo", "bar"}),
+        (
+            None,
+            [RequestOutput(name="foo", parameters=Parameters(binary_data=True))],
+            {"foo"},
+        ),
+        (
+            Parameters(binary_data_output=True),
+            [RequestOutput(name="foo", parameters=Parameters(binary_data=False))],
+            {"bar"},
+        ),
+    ],
+)
+def test_get_binary_outputs(request_parameters, request_outputs, expected):
+    payload = InferenceRequest(
+        inputs=[], outputs=request_outputs, parameters=request_parameters
+    )
+    inference_response = InferenceResponse(
+        model_name="my-model",
+        outputs=[
+            ResponseOutput(name="foo", datatype="INT32", shape=[1], data=[1]),
+            ResponseOutput(name="bar", datatype="INT32", shape=[1], data=[2]),
+        ],
+    )
+
+    assert get_binary_outputs(payload, inference_response) == expected
+
+
+def test_encode_binary_response():
+    inference_response = InferenceResponse(
+        model_name="my-model",
+        outputs=[
+            ResponseOutput(name="foo", datatype="FP64", shape=[2], data=[1.0, 2.0]),
+            ResponseOutput(name="bar", datatype="BYTES", shape=[1], data=["hey"]),
+        ],
+    )
+
+    content, buffers = encode_binary_response(
+        inference_response.dict(), inference_response, {"foo", "bar"}
+    )
+
+    foo, bar = content["outputs"]
+    assert "data" not in foo
+    assert foo["parameters"] == {"binary_data_size": 16}
+    assert bar["parameters"] == {"binary_data_size": 7}
+    assert buffers == [
+        np.array([1.0, 2.0], dtype="<f8").tobytes(),
+        struct.pack("<I", 3) + b"hey",
+    ]
+
+
+def test_infer_binary(rest_client, sum_model):
+    data = np.array([[1, 2, 3]], dtype="<i4")
+    header = {
+        "inputs": [
+            {
+                "name": "input-0",
+                "datatype": "INT32",
+                "shape": [1, 3],
+                "parameters": {"binary_data_size": data.nbytes},
+            }
+        ],
+        "parameters": {"binary_data_output": True},
+    }
+    json_header = json.dumps(header).encode()
+
+    endpoint = f"/v2/models/{sum_model.name}/infer"
+    response = rest_client.post(
+        endpoint,
+        data=json_header + data.tobytes(),
+        headers={
+            "content-type": "application/octet-stream",
+            InferenceHeaderContentLength: str(len(json_header)),
+        },
+    )
+
+    assert response.status_code == 200
+
+    header_length = int(response.headers[InferenceHeaderContentLength])
+    response_header = json.loads(response.content[:header_length])
+    (output,) = response_header["outputs"]
+    assert output["parameters"] == {"binary_data_size": 8}
+
+    total = np.frombuffer(response.content[header_length:], dtype="<i8")
+    np.testing.assert_array_equal(total, [6])
+
+
+@pytest.mark.parametrize("header_length", ["foo", "-1", "1000"])
+def test_infer_binary_invalid_header_length(rest_client, sum_model, header_length):
+    endpoint = f"/v2/models/{sum_model.name}/infer"
+    response = rest_client.post(
+        endpoint,
+        data=b'{"inputs": []}',
+        headers={
+            "content-type": "application/octet-stream",
+            InferenceHeaderContentLength: header_length,
+        },
+    )
+
+    assert response.status_code == 400
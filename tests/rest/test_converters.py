@@ -0,0 +1,110 @@
+import pytest
+import numpy as np
+
+from mlserver import types
+from mlserver.errors import InferenceError
+from mlserver.rest.converters import (
+    InferenceRequestConverter,
+    InferenceResponseConverter,
+)
+
+
+def test_inferencerequest_to_types(inference_request: types.InferenceRequest):
+    body = inference_request.dict()
+
+    converted = InferenceRequestConverter.to_types(body)
+
+    assert converted == inference_request
+
+
+def test_inferencerequest_to_types_nested():
+    body = {
+        "inputs": [
+            {
+                "name": "foo",
+                "datatype": "INT32",
+                "shape": [2, 2],
+                "data": [[1, 2], [3, 4]],
+            }
+        ],
+        "outputs": [{"name": "bar"}],
+    }
+
+    converted = InferenceRequestConverter.to_types(body)
+
+    (request_input,) = converted.inputs
+    assert request_input.parameters is None
+    assert request_input.data.__root__ == [[1, 2], [3, 4]]
+    assert converted.outputs == [types.RequestOutput(name="bar")]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        [],
+        {},
+        {"inputs": [{"datatype": "INT32", "shape": [1], "data": [1]}]},
+        {"inputs": [{"name": "foo", "datatype": "INT33", "shape": [1], "data": [1]}]},
+        {"inputs": [{"name": "foo", "datatype": "INT32", "shape": [-1], "data": []}]},
+        {"inputs": [{"name": "foo", "datatype": "INT32", "shape": [1]}]},
+        {"inputs": [{"name": "foo", "datatype": "INT32", "shape": [3], "data": [1]}]},
+        {"inputs": [], "outputs": [{"parameters": {}}]},
+        {"inputs": [], "parameters": []},
+        {"inputs": [{"name": "foo", "datatype": ["FP32"], "shape": [1], "data": [1]}]},
+        {"inputs": [], "parameters": {"content_type": 5}},
+        {"inputs": [], "parameters": {"headers": "foo"}},
+        {
+            "inputs": [
+                {
+                    "name": "foo",
+                    "datatype": "INT32",
+                    "shape": [1],
+                    "data": [1],
+                    "parameters": {"content_type": ["np"]},
+                }
+            ]
+        },
+        {
+            "inputs": [
+                {
+                    "name": "foo",
+                    "datatype": "INT32",
+                    "shape": [2, 2],
+                    "data": [[1, 2, 3], [4]],
+                }
+            ]
+        },
+        {
+            "inputs": [
+                {
+                    "name": "foo",
+                    "datatype": "INT32",
+                    "shape": [2, 2],
+                    "data": [[1, 2], 3, 4],
+                }
+            ]
+        },
+    ],
+)
+def test_inferencerequest_to_types_invalid(body):
+    with pytest.raises(InferenceError):
+        InferenceRequestConverter.to_types(body)
+
+
+def test_inferenceresponse_from_types(inference_response: types.InferenceResponse):
+    inference_response.outputs.append(
+        types.ResponseOutput(
+            name="bar",
+            datatype="INT32",
+            shape=[2],
+            data=np.array([1, 2]),
+            parameters=types.Parameters(content_type="np"),
+        )
+    )
+
+    content = InferenceResponseConverter.from_types(inference_response)
+
+    expected = inference_response.dict()
+    expected_data = expected["outputs"][1].pop("data")
+    np.testing.assert_array_equal(content["outputs"][1].pop("data"), expected_data)
+    assert content == expected
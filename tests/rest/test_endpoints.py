@@ -1,6 +1,8 @@
+import json
 import pytest
 
 from mlserver import types, __version__
+from mlserver.codecs.arrow import ArrowStreamContentType
 
 
 def test_live(rest_client):
@@ -82,6 +84,62 @@ def test_infer_error(rest_client, inference_request):
     assert response.json()["error"] == "Model my-model with version v0 not found"
 
 
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"{not json",
+        b'{"inputs": [{"name": "foo", "datatype": "FP32"}]}',
+        b'{"inputs": [{"name": "foo", "datatype": ["FP32"], "shape": [1], '
+        b'"data": [1]}]}',
+        b'{"inputs": [{"name": "foo", "datatype": "INT32", "shape": [1, 3], '
+        b'"data": [1, 2, 3], "parameters": {"content_type": 5}}]}',
+    ],
+)
+def test_infer_invalid(rest_client, sum_model_settings, content):
+    endpoint = f"/v2/models/{sum_model_settings.name}/infer"
+    response = rest_client.post(
+        endpoint, data=content, headers={"content-type": "application/json"}
+    )
+
+    assert response.status_code == 400
+    assert "error" in response.json()
+
+
+@pytest.mark.parametrize("ndjson", [True, False])
+def test_infer_bulk(rest_client, inference_request, sum_model_settings, ndjson):
+    payloads = []
+    for idx in range(4):
+        payload = inference_request.dict()
+        payload["id"] = f"request-{idx}"
+        payloads.append(payload)
+
+    endpoint = f"/v2/models/{sum_model_settings.name}/infer/bulk"
+    if ndjson:
+        content = "\n".join(json.dumps(payload) for payload in payloads)
+        response = rest_client.post(
+            endpoint, data=content, headers={"content-type": "application/x-ndjson"}
+        )
+    else:
+        response = rest_client.post(endpoint, json=payloads)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    results = {line["id"]: line for line in lines}
+    assert len(results) == len(payloads)
+    for prediction in results.values():
+        assert prediction["outputs"][0]["data"] == [6]
+
+
+def test_infer_bulk_error(rest_client, inference_request):
+    endpoint = "/v2/models/my-model/infer/bulk"
+    response = rest_client.post(endpoint, json=[inference_request.dict()])
+
+    assert response.status_code == 404
+    assert response.json()["error"] == "Model my-model not found"
+
+
 def test_model_repository_index(rest_client, repository_index_request):
     endpoint = "/v2/repository/index"
     response = rest_client.post(endpoint, json=repository_index_request.dict())
@@ -120,3 +178,35 @@ def test_model_repository_load_error(rest_client, sum_model_settings):
 
     assert response.status_code == 404
     assert response.json()["error"] == "Model my-model not found"
+
+
+def test_infer_arrow(rest_client, sum_model_settings):
+    pa = pytest.importorskip("pyarrow")
+
+    table = pa.table(
+        {
+            "input-0": pa.FixedSizeListArray.from_arrays(
+                pa.array([1, 2, 3], type=pa.int32()), 3
+            )
+        }
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    endpoint = f"/v2/models/{sum_model_settings.name}/infer"
+    response = rest_client.post(
+        endpoint,
+        data=sink.getvalue().to_pybytes(),
+        headers={
+            "content-type": ArrowStreamContentType,
+            "accept": ArrowStreamContentType,
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == ArrowStreamContentType
+
+    prediction = pa.ipc.open_stream(response.content).read_all()
+    assert prediction.column_names == ["total"]
+    assert prediction.column("total").to_pylist() == [[6]]
@@ -3,7 +3,13 @@ import numpy as np
 
 from typing import Any, Optional
 
-from mlserver.types import InferenceRequest, RequestInput, Parameters, TensorData
+from mlserver.types import (
+    InferenceRequest,
+    MetadataTensor,
+    RequestInput,
+    Parameters,
+    TensorData,
+)
 from mlserver.codecs import RequestCodec, NumpyCodec, StringCodec
 from mlserver.codecs.numpy import NumpyRequestCodec
 from mlserver.model import MLModel
@@ -175,6 +181,7 @@ def test_decode(sum_model: MLModel, request_input: RequestInput, expected: Any):
                         parameters=Parameters(
                             content_type="str",
                             _decoded_payload=["abc"],
+                            _decoded_codec=StringCodec,
                         ),
                     )
                 ],
@@ -195,3 +202,40 @@ def test_decode_request(
         np.testing.assert_array_equal(decoded_request, expected)  # type: ignore
     else:
         assert decoded_request == expected
+
+
+def test_codec_plan_invalidation(sum_model: MLModel):
+    request_input = RequestInput(name="foo", shape=[2], data=[1, 2], datatype="INT32")
+    assert not isinstance(sum_model.decode(request_input), np.ndarray)
+
+    sum_model.inputs = [
+        MetadataTensor(
+            name="foo",
+            datatype="INT32",
+            shape=[2],
+            parameters=Parameters(content_type=NumpyCodec.ContentType),
+        )
+    ]
+
+    decoded = sum_model.decode(request_input)
+    np.testing.assert_array_equal(decoded, [1, 2])
+
+
+def test_codec_plan_metadata_changed(sum_model: MLModel):
+    request_input = RequestInput(name="foo", shape=[2], data=[1, 2], datatype="INT32")
+    codec_plan = sum_model.codec_plan
+    assert sum_model.codec_plan is codec_plan
+
+    sum_model.settings.inputs.append(
+        MetadataTensor(
+            name="foo",
+            datatype="INT32",
+            shape=[2],
+            parameters=Parameters(content_type=NumpyCodec.ContentType),
+        )
+    )
+
+    assert codec_plan.is_stale(sum_model.settings)
+    decoded = sum_model.decode(request_input)
+    np.testing.assert_array_equal(decoded, [1, 2])
+    assert sum_model.codec_plan is not codec_plan
@@ -1,10 +1,13 @@
 import pytest
+import numpy as np
 
 from typing import List, Union
 
+from mlserver.codecs import has_decoded, get_decoded
 from mlserver.errors import ModelNotFound
 from mlserver.registry import MultiModelRegistry, SingleModelRegistry
 from mlserver.settings import ModelSettings
+from mlserver.types import InferenceRequest, RequestInput
 
 
 @pytest.fixture
@@ -200,3 +203,22 @@ async def test_find_default(
     foo_registry._clear_default()
     default_model = foo_registry._find_default()
     assert default_model.version == expected
+
+
+async def test_load_middlewares(
+    model_registry: MultiModelRegistry, sum_model_settings: ModelSettings
+):
+    sum_model = await model_registry.load(sum_model_settings)
+
+    # sum-model has metadata setting the default content type of input
+    # `input-0` to `np`
+    inference_request = InferenceRequest(
+        inputs=[
+            RequestInput(name="input-0", shape=[1, 2], data=[1, 2], datatype="INT32")
+        ]
+    )
+    await sum_model.predict(inference_request)
+
+    request_input = inference_request.inputs[0]
+    assert has_decoded(request_input)
+    np.testing.assert_array_equal(get_decoded(request_input), [[1, 2]])
@@ -1,5 +1,6 @@
 import pytest
 import json
+import numpy as np
 
 from mlserver import types
 
@@ -22,3 +23,19 @@ def test_tensor_data(data):
     assert tensor_data.__root__ == data
     for tensor_elem, elem in zip(tensor_data, data):
         assert type(tensor_elem) == type(elem)
+
+
+def test_tensor_data_ndarray():
+    data = np.array([[1.5, 2.5], [3.5, 4.5]], dtype="float32").ravel()
+    inference_request = types.InferenceRequest(
+        inputs=[
+            types.RequestInput(name="foo", shape=[2, 2], datatype="FP32", data=data)
+        ]
+    )
+
+    expected = [1.5, 2.5, 3.5, 4.5]
+    assert json.loads(inference_request.json())["inputs"][0]["data"] == expected
+    assert json.loads(json.dumps(inference_request.dict()))["inputs"][0]["data"] == (
+        expected
+    )
+    assert inference_request.inputs[0].data == types.TensorData(__root__=expected)